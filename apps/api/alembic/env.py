@@ -19,7 +19,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from src.config import get_settings
 # Import all models so Alembic can detect them for autogenerate
 # The models must be imported before we reference Base.metadata
-from src.models import PBI, AgentLog, Base, Feature, Project
+from src.models import (PBI, AgentLog, Base, Feature, FeatureOrderCounter,
+                        Project)
+from src.partitions import partition_month
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -40,6 +42,20 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Leave agent_logs partitions out of autogenerate.
+
+    Partitions are created and dropped at runtime by src/partitions.py,
+    so they have no models.
+    """
+    table = object if type_ == "table" else getattr(object, "table", None)
+    if table is not None and partition_month(table.name) is not None:
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -62,6 +78,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -87,6 +104,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
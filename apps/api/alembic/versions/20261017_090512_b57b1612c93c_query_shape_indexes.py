@@ -0,0 +1,51 @@
+"""query_shape_indexes
+
+Composite indexes matching the hot query shapes:
+- projects ORDER BY created_at DESC, id DESC (keyset pages)
+- features WHERE project_id ORDER BY order, created_at, id (keyset pages,
+  max(order) per project, per-project feature counts)
+- pbis.blocked_by_id dependency lookups
+- agent_logs WHERE project_id ORDER BY created_at, id
+
+The single-column project_id indexes on features and agent_logs are
+dropped; the composites lead with project_id and serve the same lookups.
+
+Indexes are built with CREATE INDEX CONCURRENTLY so writes are not
+blocked, which requires running outside of a transaction.
+
+Revision ID: b57b1612c93c
+Revises: 3b14b6447ad0
+Create Date: 2026-10-17 09:05:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b57b1612c93c'
+down_revision: Union[str, None] = '3b14b6447ad0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_features_project_id_order_created_at_id', 'features', ['project_id', 'order', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_pbis_blocked_by_id'), 'pbis', ['blocked_by_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_agent_logs_project_id_created_at_id', 'agent_logs', ['project_id', 'created_at', 'id'], unique=False, postgresql_concurrently=True)
+        op.drop_index(op.f('ix_features_project_id'), table_name='features', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_agent_logs_project_id'), table_name='agent_logs', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_agent_logs_project_id'), 'agent_logs', ['project_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_features_project_id'), 'features', ['project_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_agent_logs_project_id_created_at_id', table_name='agent_logs', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_pbis_blocked_by_id'), table_name='pbis', postgresql_concurrently=True)
+        op.drop_index('ix_features_project_id_order_created_at_id', table_name='features', postgresql_concurrently=True)
+        op.drop_index('ix_projects_created_at_id', table_name='projects', postgresql_concurrently=True)
@@ -0,0 +1,60 @@
+"""server_side_defaults
+
+Move id and timestamp generation into the database:
+- id: gen_random_uuid() (built in since PostgreSQL 13)
+- created_at / updated_at: timezone('utc', now())
+- updated_at is maintained by a BEFORE UPDATE trigger
+
+Existing rows already hold ids and timestamps (all three columns are
+NOT NULL), so only the defaults change; nothing needs rewriting.
+
+Revision ID: 5f0c2d9e7a41
+Revises: b57b1612c93c
+Create Date: 2026-10-17 09:38:47.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f0c2d9e7a41'
+down_revision: Union[str, None] = 'b57b1612c93c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('projects', 'features', 'pbis', 'agent_logs')
+
+UTC_NOW = sa.text("timezone('utc', now())")
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := timezone('utc', now());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+        op.alter_column(table, 'created_at', server_default=UTC_NOW)
+        op.alter_column(table, 'updated_at', server_default=UTC_NOW)
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER {table}_set_updated_at ON {table}")
+        op.alter_column(table, 'updated_at', server_default=None)
+        op.alter_column(table, 'created_at', server_default=None)
+        op.alter_column(table, 'id', server_default=None)
+    op.execute("DROP FUNCTION set_updated_at()")
@@ -0,0 +1,49 @@
+"""on_delete_cascade
+
+Let PostgreSQL delete child rows so deleting a project or feature is a
+single statement instead of the ORM loading and deleting the whole tree:
+- features.project_id, pbis.feature_id, agent_logs.project_id:
+  ON DELETE CASCADE
+- pbis.blocked_by_id, agent_logs.pbi_id: ON DELETE SET NULL
+  (a removed dependency unblocks the PBI; logs outlive their PBI and
+  stay attached to the project)
+
+Revision ID: 9d3e61b4c0f8
+Revises: 5f0c2d9e7a41
+Create Date: 2026-10-17 10:22:15.660472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3e61b4c0f8'
+down_revision: Union[str, None] = '5f0c2d9e7a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table, ondelete)
+FOREIGN_KEYS = (
+    ('features', 'project_id', 'projects', 'CASCADE'),
+    ('pbis', 'feature_id', 'features', 'CASCADE'),
+    ('pbis', 'blocked_by_id', 'pbis', 'SET NULL'),
+    ('agent_logs', 'project_id', 'projects', 'CASCADE'),
+    ('agent_logs', 'pbi_id', 'pbis', 'SET NULL'),
+)
+
+
+def upgrade() -> None:
+    for table, column, referred, ondelete in FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred, [column], ['id'], ondelete=ondelete)
+
+
+def downgrade() -> None:
+    for table, column, referred, _ in FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred, [column], ['id'])
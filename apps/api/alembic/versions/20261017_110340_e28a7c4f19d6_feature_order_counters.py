@@ -0,0 +1,42 @@
+"""feature_order_counters
+
+Per-project counter for Feature.order, replacing SELECT max(order).
+Counters are seeded from the current max(order) of each project.
+
+Revision ID: e28a7c4f19d6
+Revises: 9d3e61b4c0f8
+Create Date: 2026-10-17 11:03:40.115873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e28a7c4f19d6'
+down_revision: Union[str, None] = '9d3e61b4c0f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('feature_order_counters',
+    sa.Column('project_id', sa.UUID(), nullable=False),
+    sa.Column('next_order', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id')
+    )
+    op.execute(
+        """
+        INSERT INTO feature_order_counters (project_id, next_order)
+        SELECT project_id, max("order") + 1
+        FROM features
+        GROUP BY project_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('feature_order_counters')
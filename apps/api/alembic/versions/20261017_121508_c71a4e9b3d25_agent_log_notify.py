@@ -0,0 +1,81 @@
+"""agent_log_notify
+
+Publish new agent logs on the agent_logs NOTIFY channel so API workers
+can stream them without polling.
+
+A statement-level trigger reads the inserted rows from a transition
+table, so a COPY of thousands of rows sends a handful of notifications
+rather than one per row. Each payload is a JSON object holding a
+project id and up to 100 log ids of that project, which keeps it well
+under the 8000 byte NOTIFY limit:
+
+    {"project_id": "...", "ids": ["...", ...]}
+
+created_at of agent_logs now defaults to clock_timestamp() instead of
+now(), so rows written by one statement get increasing timestamps and
+stream in the order they were sent.
+
+Revision ID: c71a4e9b3d25
+Revises: e28a7c4f19d6
+Create Date: 2026-10-17 12:15:08.417260
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c71a4e9b3d25'
+down_revision: Union[str, None] = 'e28a7c4f19d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'agent_logs',
+        'created_at',
+        server_default=sa.text("timezone('utc', clock_timestamp())"),
+    )
+    op.execute(
+        """
+        CREATE FUNCTION notify_agent_logs() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify(
+                'agent_logs',
+                json_build_object('project_id', project_id, 'ids', ids)::text
+            )
+            FROM (
+                SELECT project_id, json_agg(id) AS ids
+                FROM (
+                    SELECT
+                        project_id,
+                        id,
+                        (row_number() OVER (PARTITION BY project_id) - 1) / 100
+                            AS chunk
+                    FROM new_rows
+                ) numbered
+                GROUP BY project_id, chunk
+            ) chunks;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER agent_logs_notify AFTER INSERT ON agent_logs "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notify_agent_logs()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER agent_logs_notify ON agent_logs")
+    op.execute("DROP FUNCTION notify_agent_logs()")
+    op.alter_column(
+        'agent_logs',
+        'created_at',
+        server_default=sa.text("timezone('utc', now())"),
+    )
@@ -0,0 +1,210 @@
+"""partition_agent_logs
+
+Turn agent_logs into a table range-partitioned by month on created_at.
+
+- The primary key becomes (id, created_at): a unique constraint on a
+  partitioned table has to include the partition key.
+- Partitions are named agent_logs_yYYYYmMM. This migration creates one
+  for every month from the oldest existing log through MONTHS_AHEAD
+  months from now; afterwards src/partitions.py keeps creating future
+  partitions and drops (or detaches) expired ones.
+- Existing rows are copied into the new table in one INSERT ... SELECT,
+  so the migration holds an exclusive lock on agent_logs while it runs.
+- The new-log notification now also carries the oldest created_at of
+  each chunk ("since"), so readers can prune to the partitions that
+  hold the new rows.
+
+There is no default partition: rows outside every partition fail to
+insert, which keeps creating and detaching partitions cheap.
+
+Revision ID: 8a2f5d07e6b3
+Revises: c71a4e9b3d25
+Create Date: 2026-10-17 13:41:22.560914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a2f5d07e6b3'
+down_revision: Union[str, None] = 'c71a4e9b3d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+# json_build_object arguments of the notification payload
+PAYLOAD_FIELDS = "'project_id', project_id, 'ids', json_agg(id)"
+PAYLOAD_FIELDS_WITH_SINCE = PAYLOAD_FIELDS + ", 'since', min(created_at)"
+
+COLUMNS = (
+    'project_id, pbi_id, agent_name, message_type, content, extra_data, '
+    'id, created_at, updated_at'
+)
+
+NOTIFY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION notify_agent_logs() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('agent_logs', payload::text)
+        FROM (
+            SELECT json_build_object({fields}) AS payload
+            FROM (
+                SELECT
+                    project_id,
+                    id,
+                    created_at,
+                    (row_number() OVER (PARTITION BY project_id) - 1) / 100
+                        AS chunk
+                FROM new_rows
+            ) numbered
+            GROUP BY project_id, chunk
+        ) chunks;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+# One partition per month, from the month of the oldest existing log (or
+# the current month) through MONTHS_AHEAD months from now
+CREATE_PARTITIONS = """
+    DO $$
+    DECLARE
+        month date;
+    BEGIN
+        FOR month IN
+            SELECT generate_series(
+                date_trunc(
+                    'month',
+                    coalesce(
+                        (SELECT min(created_at) FROM agent_logs_old),
+                        timezone('utc', now())
+                    )
+                ),
+                date_trunc('month', timezone('utc', now()))
+                    + interval '{months_ahead} months',
+                interval '1 month'
+            )::date
+        LOOP
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF agent_logs '
+                'FOR VALUES FROM (%L) TO (%L)',
+                to_char(month, '"agent_logs_y"YYYY"m"MM'),
+                month,
+                (month + interval '1 month')::date
+            );
+        END LOOP;
+    END
+    $$
+"""
+
+
+def _columns(primary_key: tuple[str, ...]) -> list[sa.Column]:
+    return [
+        sa.Column('project_id', sa.UUID(), nullable=False),
+        sa.Column('pbi_id', sa.UUID(), nullable=True),
+        sa.Column('agent_name', sa.String(length=100), nullable=False),
+        sa.Column(
+            'message_type',
+            postgresql.ENUM(name='agentmessagetype', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column(
+            'extra_data', postgresql.JSON(astext_type=sa.Text()), nullable=True
+        ),
+        sa.Column(
+            'id',
+            sa.UUID(),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', clock_timestamp())"),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(['pbi_id'], ['pbis.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(
+            ['project_id'], ['projects.id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint(*primary_key),
+    ]
+
+
+def _create_triggers() -> None:
+    op.execute(
+        "CREATE TRIGGER agent_logs_set_updated_at BEFORE UPDATE ON agent_logs "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+    op.execute(
+        "CREATE TRIGGER agent_logs_notify AFTER INSERT ON agent_logs "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION notify_agent_logs()"
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index(
+        'ix_agent_logs_project_id_created_at_id',
+        'agent_logs',
+        ['project_id', 'created_at', 'id'],
+    )
+    op.create_index('ix_agent_logs_pbi_id', 'agent_logs', ['pbi_id'])
+
+
+def _replace_table(primary_key: tuple[str, ...], **table_kwargs: str) -> None:
+    # Move the current table aside, create its replacement under the
+    # same name and copy every row across.
+    op.execute("DROP TRIGGER agent_logs_notify ON agent_logs")
+    op.execute("DROP TRIGGER agent_logs_set_updated_at ON agent_logs")
+    op.drop_index('ix_agent_logs_pbi_id', table_name='agent_logs')
+    op.drop_index(
+        'ix_agent_logs_project_id_created_at_id', table_name='agent_logs'
+    )
+    op.rename_table('agent_logs', 'agent_logs_old')
+    op.execute(
+        "ALTER TABLE agent_logs_old RENAME CONSTRAINT agent_logs_pkey "
+        "TO agent_logs_old_pkey"
+    )
+    op.create_table('agent_logs', *_columns(primary_key), **table_kwargs)
+
+
+def upgrade() -> None:
+    op.execute(NOTIFY_FUNCTION.format(fields=PAYLOAD_FIELDS_WITH_SINCE))
+    _replace_table(
+        ('id', 'created_at'), postgresql_partition_by='RANGE (created_at)'
+    )
+
+    # Computed by the server rather than here, so the migration also
+    # works offline (alembic upgrade --sql)
+    op.execute(CREATE_PARTITIONS.format(months_ahead=MONTHS_AHEAD))
+
+    op.execute(
+        f"INSERT INTO agent_logs ({COLUMNS}) SELECT {COLUMNS} FROM agent_logs_old"
+    )
+    op.drop_table('agent_logs_old')
+    _create_indexes()
+    _create_triggers()
+
+
+def downgrade() -> None:
+    op.execute(NOTIFY_FUNCTION.format(fields=PAYLOAD_FIELDS))
+    _replace_table(('id',))
+    op.execute(
+        f"INSERT INTO agent_logs ({COLUMNS}) SELECT {COLUMNS} FROM agent_logs_old"
+    )
+    # Drops every partition with it
+    op.drop_table('agent_logs_old')
+    _create_indexes()
+    _create_triggers()
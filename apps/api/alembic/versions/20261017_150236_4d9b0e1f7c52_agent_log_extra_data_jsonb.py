@@ -0,0 +1,52 @@
+"""agent_log_extra_data_jsonb
+
+Store agent_logs.extra_data as JSONB and index it with GIN
+(jsonb_path_ops), so containment filters (extra_data @> '{...}') use the
+index instead of re-parsing JSON text on every row.
+
+The type change rewrites every partition, and the index is built on
+each of them; both hold an exclusive lock on agent_logs while they run.
+
+Revision ID: 4d9b0e1f7c52
+Revises: 8a2f5d07e6b3
+Create Date: 2026-10-17 15:02:36.184502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d9b0e1f7c52'
+down_revision: Union[str, None] = '8a2f5d07e6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'agent_logs',
+        'extra_data',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        postgresql_using='extra_data::jsonb',
+    )
+    op.create_index(
+        'ix_agent_logs_extra_data',
+        'agent_logs',
+        ['extra_data'],
+        postgresql_using='gin',
+        postgresql_ops={'extra_data': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_agent_logs_extra_data', table_name='agent_logs')
+    op.alter_column(
+        'agent_logs',
+        'extra_data',
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        postgresql_using='extra_data::json',
+    )
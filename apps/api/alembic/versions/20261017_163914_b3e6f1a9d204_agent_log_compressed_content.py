@@ -0,0 +1,84 @@
+"""agent_log_compressed_content
+
+Let agent_logs store large contents zstd-compressed (see
+src/log_compression.py):
+- content_zstd holds the compressed content, content_head its first
+  characters for listings; content becomes nullable
+- a check constraint keeps exactly one of content and content_zstd set
+
+Existing rows stay as they are; compress them afterwards with
+python -m src.log_compression. Downgrading decompresses every compressed
+row back into content first.
+
+Revision ID: b3e6f1a9d204
+Revises: 4d9b0e1f7c52
+Create Date: 2026-10-17 16:39:14.027358
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import zstandard
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e6f1a9d204'
+down_revision: Union[str, None] = '4d9b0e1f7c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DECOMPRESS_BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    op.add_column(
+        'agent_logs', sa.Column('content_zstd', sa.LargeBinary(), nullable=True)
+    )
+    op.add_column(
+        'agent_logs', sa.Column('content_head', sa.Text(), nullable=True)
+    )
+    op.alter_column('agent_logs', 'content', existing_type=sa.Text(), nullable=True)
+    op.create_check_constraint(
+        'ck_agent_logs_content_stored_once',
+        'agent_logs',
+        '(content IS NULL) <> (content_zstd IS NULL)',
+    )
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    while True:
+        rows = connection.execute(
+            sa.text(
+                "SELECT id, created_at, content_zstd FROM agent_logs "
+                "WHERE content_zstd IS NOT NULL LIMIT :limit"
+            ),
+            {'limit': DECOMPRESS_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            sa.text(
+                "UPDATE agent_logs "
+                "SET content = :content, content_zstd = NULL, content_head = NULL "
+                "WHERE id = :id AND created_at = :created_at"
+            ),
+            [
+                {
+                    'id': row.id,
+                    'created_at': row.created_at,
+                    'content': zstandard.decompress(row.content_zstd).decode(),
+                }
+                for row in rows
+            ],
+        )
+
+    op.drop_constraint(
+        'ck_agent_logs_content_stored_once', 'agent_logs', type_='check'
+    )
+    op.alter_column(
+        'agent_logs', 'content', existing_type=sa.Text(), nullable=False
+    )
+    op.drop_column('agent_logs', 'content_head')
+    op.drop_column('agent_logs', 'content_zstd')
@@ -0,0 +1,90 @@
+"""log_blobs
+
+Add log_blobs, a content-addressed store of large log contents keyed
+by SHA-256, and agent_logs.content_hash referencing it. A log now
+stores its content in exactly one of content, content_zstd and
+content_hash.
+
+Existing rows keep their content inline. Downgrading copies the content
+of every blob back into the logs referencing it.
+
+Revision ID: 5f0c8d2e6a17
+Revises: b3e6f1a9d204
+Create Date: 2026-10-17 17:45:20.631842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f0c8d2e6a17'
+down_revision: Union[str, None] = 'b3e6f1a9d204'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'log_blobs',
+        sa.Column('hash', sa.LargeBinary(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.Column('content_zstd', sa.LargeBinary(), nullable=True),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            '(content IS NULL) <> (content_zstd IS NULL)',
+            name='ck_log_blobs_content_stored_once',
+        ),
+        sa.PrimaryKeyConstraint('hash'),
+    )
+    op.add_column(
+        'agent_logs', sa.Column('content_hash', sa.LargeBinary(), nullable=True)
+    )
+    op.create_foreign_key(
+        'agent_logs_content_hash_fkey',
+        'agent_logs',
+        'log_blobs',
+        ['content_hash'],
+        ['hash'],
+    )
+    op.drop_constraint(
+        'ck_agent_logs_content_stored_once', 'agent_logs', type_='check'
+    )
+    op.create_check_constraint(
+        'ck_agent_logs_content_stored_once',
+        'agent_logs',
+        'num_nonnulls(content, content_zstd, content_hash) = 1',
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE agent_logs SET "
+        "content = log_blobs.content, "
+        "content_zstd = log_blobs.content_zstd, "
+        "content_hash = NULL, "
+        "content_head = CASE WHEN log_blobs.content IS NULL "
+        "THEN agent_logs.content_head END "
+        "FROM log_blobs WHERE agent_logs.content_hash = log_blobs.hash"
+    )
+    op.drop_constraint(
+        'ck_agent_logs_content_stored_once', 'agent_logs', type_='check'
+    )
+    op.create_check_constraint(
+        'ck_agent_logs_content_stored_once',
+        'agent_logs',
+        '(content IS NULL) <> (content_zstd IS NULL)',
+    )
+    op.drop_constraint(
+        'agent_logs_content_hash_fkey', 'agent_logs', type_='foreignkey'
+    )
+    op.drop_column('agent_logs', 'content_hash')
+    op.drop_table('log_blobs')
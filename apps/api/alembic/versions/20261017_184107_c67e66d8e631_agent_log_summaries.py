@@ -0,0 +1,99 @@
+"""agent_log_summaries
+
+Add agent_log_summaries, the per-PBI and message type rollup of agent
+logs removed by the retention job (src/log_retention.py), and a partial
+index on agent_logs.content_hash so blobs no longer referenced can be
+found and deleted.
+
+Revision ID: c67e66d8e631
+Revises: 5f0c8d2e6a17
+Create Date: 2026-10-17 18:41:07.888830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c67e66d8e631'
+down_revision: Union[str, None] = '5f0c8d2e6a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'agent_log_summaries',
+        sa.Column('project_id', sa.UUID(), nullable=False),
+        sa.Column('pbi_id', sa.UUID(), nullable=True),
+        sa.Column(
+            'message_type',
+            postgresql.ENUM(name='agentmessagetype', create_type=False),
+            nullable=False,
+        ),
+        sa.Column('log_count', sa.Integer(), nullable=False),
+        sa.Column('first_at', sa.DateTime(), nullable=False),
+        sa.Column('last_at', sa.DateTime(), nullable=False),
+        sa.Column(
+            'errors', postgresql.JSONB(astext_type=sa.Text()), nullable=False
+        ),
+        sa.Column(
+            'id',
+            sa.UUID(),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(),
+            server_default=sa.text("timezone('utc', now())"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(['pbi_id'], ['pbis.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(
+            ['project_id'], ['projects.id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'project_id',
+            'pbi_id',
+            'message_type',
+            name='uq_agent_log_summaries_project_id_pbi_id_message_type',
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+    op.create_index(
+        op.f('ix_agent_log_summaries_pbi_id'),
+        'agent_log_summaries',
+        ['pbi_id'],
+        unique=False,
+    )
+    op.execute(
+        "CREATE TRIGGER agent_log_summaries_set_updated_at "
+        "BEFORE UPDATE ON agent_log_summaries "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    )
+    op.create_index(
+        'ix_agent_logs_content_hash',
+        'agent_logs',
+        ['content_hash'],
+        unique=False,
+        postgresql_where=sa.text('content_hash IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_agent_logs_content_hash', table_name='agent_logs')
+    op.drop_index(
+        op.f('ix_agent_log_summaries_pbi_id'), table_name='agent_log_summaries'
+    )
+    op.drop_table('agent_log_summaries')
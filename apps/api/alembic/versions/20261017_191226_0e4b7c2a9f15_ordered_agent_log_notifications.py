@@ -0,0 +1,72 @@
+"""ordered_agent_log_notifications
+
+Publish the new-log notifications of a statement in (created_at, id)
+order: rows are numbered into chunks in that order and the chunks are
+sent first to last. Before, both the numbering and the order of the
+chunks were arbitrary, so a live stream could receive a later chunk
+first and then skip the earlier ones as already sent.
+
+Revision ID: 0e4b7c2a9f15
+Revises: c67e66d8e631
+Create Date: 2026-10-17 19:12:26.301547
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0e4b7c2a9f15'
+down_revision: Union[str, None] = 'c67e66d8e631'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NOTIFY_FUNCTION = """
+    CREATE OR REPLACE FUNCTION notify_agent_logs() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('agent_logs', payload::text)
+        FROM (
+            SELECT json_build_object({fields}) AS payload
+            FROM (
+                SELECT
+                    project_id,
+                    id,
+                    created_at,
+                    (row_number() OVER (PARTITION BY project_id{order}) - 1)
+                        / 100 AS chunk
+                FROM new_rows
+            ) numbered
+            GROUP BY project_id, chunk{chunk_order}
+        ) chunks;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        NOTIFY_FUNCTION.format(
+            fields=(
+                "'project_id', project_id, "
+                "'ids', json_agg(id ORDER BY created_at, id), "
+                "'since', min(created_at)"
+            ),
+            order=" ORDER BY created_at, id",
+            chunk_order="\n            ORDER BY project_id, chunk",
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        NOTIFY_FUNCTION.format(
+            fields=(
+                "'project_id', project_id, 'ids', json_agg(id), "
+                "'since', min(created_at)"
+            ),
+            order="",
+            chunk_order="",
+        )
+    )
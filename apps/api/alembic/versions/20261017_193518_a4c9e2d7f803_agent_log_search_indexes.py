@@ -0,0 +1,53 @@
+"""agent_log_search_indexes
+
+Index the log searches that have no project_id to start from: one index
+on (created_at, id) for searches by time alone (or with no filter at
+all), and (agent_name, created_at, id) and (message_type, created_at,
+id) for searches by agent or message type. Each returns a page newest
+first by reading its index backwards, instead of sorting every matching
+row.
+
+The indexes are built on each partition while agent_logs is locked
+against writes.
+
+Revision ID: a4c9e2d7f803
+Revises: 0e4b7c2a9f15
+Create Date: 2026-10-17 19:35:18.472906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c9e2d7f803'
+down_revision: Union[str, None] = '0e4b7c2a9f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_agent_logs_created_at_id', 'agent_logs', ['created_at', 'id']
+    )
+    op.create_index(
+        'ix_agent_logs_agent_name_created_at_id',
+        'agent_logs',
+        ['agent_name', 'created_at', 'id'],
+    )
+    op.create_index(
+        'ix_agent_logs_message_type_created_at_id',
+        'agent_logs',
+        ['message_type', 'created_at', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_agent_logs_message_type_created_at_id', table_name='agent_logs'
+    )
+    op.drop_index(
+        'ix_agent_logs_agent_name_created_at_id', table_name='agent_logs'
+    )
+    op.drop_index('ix_agent_logs_created_at_id', table_name='agent_logs')
@@ -0,0 +1,87 @@
+"""
+Helpers shared by the benchmarks in this directory.
+
+Benchmarks run the app in-process (FastAPI TestClient) against the
+database configured in the environment, on the stack it selects
+(DATABASE_ASYNC). From apps/api, with the database migrated to head:
+
+    python scripts/bench/<name>.py
+
+Each benchmark works in projects of its own and deletes them afterwards.
+Numbers depend on the machine; compare runs of the same benchmark on the
+same box, before and after a change.
+"""
+
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import Engine, event  # noqa: E402
+from src import database  # noqa: E402
+from src.main import app  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+API = "/api/v1"
+
+
+@contextmanager
+def client() -> Iterator[TestClient]:
+    """TestClient running the app's lifespan, warmed up by one request."""
+    with TestClient(app) as http:
+        http.get("/health").raise_for_status()
+        yield http
+
+
+def timed(run: Callable[[], Any]) -> tuple[Any, float]:
+    """Run once; returns (result, elapsed milliseconds)."""
+    start = time.perf_counter()
+    result = run()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def median_ms(run: Callable[[], Any], repeat: int) -> float:
+    """Median milliseconds of repeat runs."""
+    return statistics.median(timed(run)[1] for _ in range(repeat))
+
+
+@contextmanager
+def project(http: TestClient, name: str) -> Iterator[str]:
+    """Create a project for the benchmark and delete it afterwards."""
+    response = http.post(f"{API}/projects/", json={"name": name, "epic": "Benchmark"})
+    response.raise_for_status()
+    project_id = response.json()["id"]
+    try:
+        yield project_id
+    finally:
+        http.delete(f"{API}/projects/{project_id}")
+
+
+@contextmanager
+def count_statements() -> Iterator[list[int]]:
+    """Count the statements sent to the database, on either stack."""
+    engine: Engine = (
+        database.async_engine.sync_engine
+        if database.async_engine is not None
+        else database.engine
+    )
+    count = [0]
+
+    def record(*args: Any) -> None:
+        count[0] += 1
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield count
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def stack() -> str:
+    """Name of the database stack in use."""
+    return "async" if database.async_engine is not None else "sync"
@@ -0,0 +1,35 @@
+"""
+POST /features/bulk at growing batch sizes.
+
+Reports the wall time of each request and the statements it sent. A
+bulk create inserts its features with multi-row INSERT ... RETURNING
+(insertmanyvalues, up to 1000 rows per statement), so the statement
+count grows by one per thousand features rather than per feature.
+"""
+
+from _common import API, client, count_statements, project, stack, timed
+
+SIZES = (1, 50, 1000, 10_000)
+
+
+def main() -> None:
+    print(f"POST /features/bulk ({stack()} stack)")
+    with client() as http:
+        for size in SIZES:
+            features = [
+                {"name": f"feature {i}", "description": "d"} for i in range(size)
+            ]
+            with project(http, "bench bulk create") as project_id:
+                with count_statements() as statements:
+                    response, ms = timed(
+                        lambda: http.post(
+                            f"{API}/features/bulk",
+                            json={"project_id": project_id, "features": features},
+                        )
+                    )
+                response.raise_for_status()
+                print(f"{size:>7} features {ms:9.1f} ms {statements[0]:>4} statements")
+
+
+if __name__ == "__main__":
+    main()
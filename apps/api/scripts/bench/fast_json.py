@@ -0,0 +1,92 @@
+"""
+The orjson fast path (fast_json_responses) against the default one.
+
+Reports, with the setting off and on:
+- building, validating and serializing 10k FeatureResponse bodies
+  in-process (the fast path skips validation and dumps with orjson)
+- POST /features/bulk with 10k features
+- p50 of GET /features/project/{id}?limit=200
+"""
+
+import orjson
+from _common import API, client, median_ms, project, stack, timed
+from starlette.testclient import TestClient
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from src import database
+from src.config import get_settings
+from src.models import Feature
+from src.responses import row_fields
+from src.schemas.feature import FeatureResponse
+
+FEATURES = 10_000
+PAGE_SIZE = 200
+REPEAT = 30
+
+_FEATURE_LIST = TypeAdapter(list[FeatureResponse])
+
+
+def _serialize(rows: list[Feature]) -> None:
+    print(f"{FEATURES} FeatureResponse bodies, build + validate + serialize:")
+
+    def default() -> bytes:
+        items = [row_fields(FeatureResponse, row, pbi_count=0) for row in rows]
+        return _FEATURE_LIST.dump_json(_FEATURE_LIST.validate_python(items))
+
+    def fast() -> bytes:
+        items = [row_fields(FeatureResponse, row, pbi_count=0) for row in rows]
+        return orjson.dumps(items)
+
+    assert orjson.loads(default()) == orjson.loads(fast())
+    print(f"  default (pydantic):  {median_ms(default, 7):7.1f} ms")
+    print(f"  fast path (orjson):  {median_ms(fast, 7):7.1f} ms")
+
+
+def _bulk_create(http: TestClient, features: list[dict]) -> None:
+    for fast in (False, True):
+        get_settings().fast_json_responses = fast
+        with project(http, "bench fast json") as project_id:
+            response, ms = timed(
+                lambda: http.post(
+                    f"{API}/features/bulk",
+                    json={"project_id": project_id, "features": features},
+                )
+            )
+            response.raise_for_status()
+        print(f"POST /features/bulk, {FEATURES} features, fast={fast}: {ms:.0f} ms")
+
+
+def _list_page(http: TestClient, project_id: str) -> None:
+    url = f"{API}/features/project/{project_id}"
+    for fast in (False, True):
+        get_settings().fast_json_responses = fast
+        p50 = median_ms(lambda: http.get(url, params={"limit": PAGE_SIZE}), REPEAT)
+        print(
+            f"GET /features/project/{{id}}?limit={PAGE_SIZE}, fast={fast}: "
+            f"p50 {p50:.1f} ms"
+        )
+
+
+def main() -> None:
+    print(f"fast_json_responses ({stack()} stack)")
+    features = [
+        {"name": f"feature {i}", "description": "d" * 200} for i in range(FEATURES)
+    ]
+    with client() as http:
+        _bulk_create(http, features)
+        with project(http, "bench fast json") as project_id:
+            http.post(
+                f"{API}/features/bulk",
+                json={"project_id": project_id, "features": features},
+            ).raise_for_status()
+            _list_page(http, project_id)
+            get_settings().fast_json_responses = False
+
+            with Session(database.engine) as db:
+                stmt = select(Feature).where(Feature.project_id == project_id)
+                _serialize(list(db.scalars(stmt)))
+
+
+if __name__ == "__main__":
+    main()
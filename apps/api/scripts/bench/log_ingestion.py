@@ -0,0 +1,63 @@
+"""
+Agent log ingestion through COPY.
+
+Reports rows per second for AgentLogService.create_many alone (the
+COPY of validated entries) and for POST /logs/batch end to end (request
+parsing and validation included), at a few batch sizes.
+"""
+
+import asyncio
+
+from _common import API, client, project, stack, timed
+from src.dependencies import agent_log_service_scope
+from src.schemas.agent_log import AgentLogCreate
+
+TOTAL = 50_000
+BATCH_SIZES = (100, 1000, 10_000)
+
+
+def _entry(project_id: str, i: int) -> dict:
+    return {
+        "project_id": project_id,
+        "agent_name": "bench",
+        "message_type": "ACTION",
+        "content": f'ran "step {i}"\n\tdone',
+        "extra_data": {"step": i, "tool": "shell"},
+    }
+
+
+async def _service_rows_per_second(project_id: str) -> float:
+    logs = [AgentLogCreate(**_entry(project_id, i)) for i in range(TOTAL)]
+    async with agent_log_service_scope() as service:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await service.create_many(logs)
+        return TOTAL / (loop.time() - start)
+
+
+def main() -> None:
+    print(f"Agent log ingestion ({stack()} stack)")
+    with client() as http:
+        with project(http, "bench log ingestion") as project_id:
+            rate = http.portal.call(_service_rows_per_second, project_id)
+            print(f"create_many, {TOTAL} rows in one COPY: {rate:9,.0f} rows/s")
+
+            for size in BATCH_SIZES:
+                batches = [
+                    {"logs": [_entry(project_id, i) for i in range(start, start + size)]}
+                    for start in range(0, TOTAL, size)
+                ]
+
+                def send() -> None:
+                    for batch in batches:
+                        http.post(f"{API}/logs/batch", json=batch).raise_for_status()
+
+                _, ms = timed(send)
+                print(
+                    f"POST /logs/batch, {size:>6} per batch: "
+                    f"{TOTAL / ms * 1000:9,.0f} rows/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+GET /projects/{id}/tree on a large project.
+
+Builds a project of 200 features with 10 PBIs each and reports the
+statements per request (always three: project, features, PBIs), the
+body size and the median latency against the 250 ms budget.
+"""
+
+from _common import (API, client, count_statements, median_ms, project,
+                     stack, timed)
+from sqlalchemy import text
+from src import database
+
+FEATURES = 200
+PBIS_PER_FEATURE = 10
+REPEAT = 20
+BUDGET_MS = 250
+
+_INSERT_PBIS = text(
+    """
+    INSERT INTO pbis (feature_id, title, description, type, status, "order")
+    SELECT f.id, 'pbi ' || g, repeat('x', 300),
+           CASE WHEN g % 2 = 0 THEN 'BACKEND' ELSE 'FRONTEND' END::pbitype,
+           'PENDING', g
+    FROM features f, generate_series(1, :count) g
+    WHERE f.project_id = :project_id
+    """
+)
+
+
+def main() -> None:
+    print(f"GET /projects/{{id}}/tree ({stack()} stack)")
+    with client() as http, project(http, "bench tree") as project_id:
+        features = [
+            {"name": f"feature {i}", "description": "d" * 200}
+            for i in range(FEATURES)
+        ]
+        http.post(
+            f"{API}/features/bulk",
+            json={"project_id": project_id, "features": features},
+        ).raise_for_status()
+        with database.engine.begin() as conn:
+            conn.execute(
+                _INSERT_PBIS, {"project_id": project_id, "count": PBIS_PER_FEATURE}
+            )
+
+        url = f"{API}/projects/{project_id}/tree"
+        with count_statements() as statements:
+            response, _ = timed(lambda: http.get(url))
+        response.raise_for_status()
+        p50 = median_ms(lambda: http.get(url), REPEAT)
+
+        print(
+            f"{FEATURES} features, {FEATURES * PBIS_PER_FEATURE} PBIs, "
+            f"{len(response.content) / 1e6:.1f} MB"
+        )
+        print(f"statements per request: {statements[0]}")
+        print(f"p50 over {REPEAT} requests: {p50:.1f} ms (budget {BUDGET_MS} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -37,6 +37,71 @@ class Settings(BaseSettings):
     
     # Database (required - will fail fast if not set)
     database_url: str
+    # Serve requests from the asyncpg AsyncEngine instead of the sync engine.
+    # Alembic and other tooling always use the sync engine.
+    database_async: bool = False
+    
+    # Serialize the feature and project list responses straight from the
+    # ORM rows with orjson, skipping response schema validation (see
+    # src/responses.py).
+    fast_json_responses: bool = False
+    
+    # Read-through cache of projects and features read by ID
+    # (see src/services/cache.py). Entries are kept ttl_seconds at most:
+    # up to max_entries per worker in memory (LRU), or shared by all
+    # workers in a Redis-protocol server when url is a redis:// URL.
+    entity_cache_enabled: bool = False
+    entity_cache_url: str | None = None
+    entity_cache_max_entries: int = 10_000
+    entity_cache_ttl_seconds: float = 60
+    
+    # Agent log write-behind buffer (POST /api/v1/logs)
+    # Entries are flushed in one COPY once batch_size are queued or
+    # flush_interval_ms after the first one, whichever comes first. When the
+    # queue is full, writers wait up to block_timeout_ms and are then
+    # dropped (0 drops immediately).
+    log_sink_max_queue: int = 10_000
+    log_sink_batch_size: int = 500
+    log_sink_flush_interval_ms: int = 200
+    log_sink_block_timeout_ms: int = 100
+    
+    # Live agent log streams (GET /api/v1/projects/{id}/logs/stream)
+    # A viewer more than max_pending logs behind is caught up from the
+    # database instead of buffering further.
+    log_stream_max_pending: int = 1000
+    log_stream_keepalive_seconds: int = 15
+    
+    # Monthly agent_logs partitions (see src/partitions.py)
+    # Partitions are created months_ahead months in advance. Months that
+    # ended more than retention_months ago are dropped, or only detached
+    # with detach_only; retention_months = 0 keeps everything.
+    log_partition_months_ahead: int = 3
+    log_partition_retention_months: int = 0
+    log_partition_detach_only: bool = False
+    log_partition_check_interval_hours: float = 6
+    
+    # Compressed storage of large CODE logs (see src/log_compression.py)
+    # When enabled, CODE content longer than threshold_bytes (UTF-8) is
+    # written zstd-compressed at the given level. Existing rows are
+    # converted with python -m src.log_compression.
+    log_compression_enabled: bool = False
+    log_compression_threshold_bytes: int = 4096
+    log_compression_level: int = 3
+    
+    # Deduplicated storage of large CODE logs (see LogBlob)
+    # When enabled, CODE content longer than threshold_bytes (UTF-8) is
+    # stored once per distinct body in log_blobs and referenced by hash.
+    log_blobs_enabled: bool = False
+    log_blob_threshold_bytes: int = 1024
+    
+    # Agent log retention for COMPLETED and FAILED projects
+    # (see src/log_retention.py). Logs of a listed message type older than
+    # its number of days are rolled up into agent_log_summaries and
+    # deleted, batch_size rows per transaction; unlisted types are kept,
+    # e.g. LOG_RETENTION_DAYS='{"THOUGHT": 30, "ACTION": 90}'.
+    log_retention_days: dict[str, int] = {}
+    log_retention_batch_size: int = 1000
+    log_retention_interval_hours: float = 24
     
     # GitHub Integration
     github_token: str | None = None
@@ -58,6 +123,16 @@ class Settings(BaseSettings):
         case_sensitive=False,
         extra="ignore",
     )
+    
+    @property
+    def async_database_url(self) -> str:
+        """
+        The database URL rewritten for the asyncpg driver.
+        
+        Any driver given in database_url (e.g. postgresql+psycopg2) is replaced.
+        """
+        _, _, rest = self.database_url.partition("://")
+        return f"postgresql+asyncpg://{rest}"
 
 
 @lru_cache
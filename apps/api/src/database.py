@@ -2,8 +2,8 @@
 Database connection and session management for Geonosis API.
 
 This module provides:
-- SQLAlchemy engine configuration
-- Session factory for database operations
+- SQLAlchemy engine configuration (sync, plus async when DATABASE_ASYNC is set)
+- Session factories for database operations
 - Base class for ORM models
 - Dependency injection for FastAPI routes
 - Database initialization and health checks
@@ -23,9 +23,11 @@ Usage:
 """
 
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from src.config import get_settings
 
@@ -45,12 +47,36 @@ engine = create_engine(
 # Session factory
 # autocommit=False: explicit commits required
 # autoflush=False: explicit flushes required for better control
+# expire_on_commit=False: rows returned by INSERT/UPDATE ... RETURNING stay
+# loaded after commit instead of being re-SELECTed on next access
 SessionLocal = sessionmaker(
     bind=engine,
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
 )
 
+# Async engine and session factory, only created in async mode. The
+# asyncpg driver is required either way: the cache invalidation listener
+# (src/pg_listener.py) connects with it on both stacks, and the agent log
+# service imports its exceptions.
+# expire_on_commit=False: attributes cannot be lazily refreshed outside
+# of an await, so loaded values must survive the commit
+async_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+if settings.database_async:
+    async_engine = create_async_engine(
+        settings.async_database_url,
+        pool_pre_ping=True,
+        echo=settings.debug,
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
 # Base class for declarative models
 Base = declarative_base()
 
@@ -77,6 +103,25 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides an async database session.
+    
+    Only available when DATABASE_ASYNC is enabled.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    
+    Raises:
+        RuntimeError: If the async database stack is not enabled
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database access requires DATABASE_ASYNC=true")
+    
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 async def init_db() -> bool:
     """
     Initialize and test the database connection.
@@ -89,9 +134,13 @@ async def init_db() -> bool:
     """
     try:
         # Test the connection with a simple query
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-            conn.commit()
+        if async_engine is not None:
+            async with async_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        else:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.commit()
         
         logger.info("Database connection established successfully")
         return True
@@ -99,3 +148,14 @@ async def init_db() -> bool:
     except Exception as e:
         logger.error(f"Failed to connect to database: {e}")
         return False
+
+
+async def close_db() -> None:
+    """
+    Dispose of database connection pools.
+    
+    Called on application shutdown.
+    """
+    if async_engine is not None:
+        await async_engine.dispose()
+    engine.dispose()
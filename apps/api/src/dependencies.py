@@ -0,0 +1,193 @@
+"""
+Service dependencies for Geonosis API.
+
+Routers depend on services rather than on a raw session, so the same
+async handlers run on either database stack:
+- DATABASE_ASYNC=true: async services on an AsyncSession
+- otherwise: the sync services, with every call run in the threadpool
+
+Usage:
+    from src.dependencies import get_project_service
+
+    @router.get("/{project_id}")
+    async def get_project(
+        project_id: UUID,
+        service: AsyncProjectService = Depends(get_project_service),
+    ):
+        return await service.get_by_id(project_id)
+"""
+
+import inspect
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import partial
+from typing import Any, TypeVar, cast
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src import database
+from src.log_sink import AgentLogSink
+from src.log_stream import AgentLogHub
+from src.schemas.agent_log import AgentLogCreate
+from src.services.agent_log_service import (AgentLogService,
+                                              AsyncAgentLogService)
+from src.services.feature_service import AsyncFeatureService, FeatureService
+from src.services.project_service import AsyncProjectService, ProjectService
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+AsyncServiceT = TypeVar("AsyncServiceT")
+
+
+class ThreadedService:
+    """
+    Awaitable facade over a sync service.
+
+    Exposes the same interface as the matching async service: each method
+    call is dispatched to the threadpool and returns an awaitable, and
+    generator methods return an async iterator whose every step runs in
+    the threadpool.
+    """
+
+    def __init__(self, service: Any) -> None:
+        """
+        Wrap a sync service.
+
+        Args:
+            service: Sync service instance bound to a Session
+        """
+        self._service = service
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._service, name)
+        if not callable(attr):
+            return attr
+        if inspect.isgeneratorfunction(attr):
+            return lambda *args, **kwargs: iterate_in_threadpool(
+                attr(*args, **kwargs)
+            )
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await run_in_threadpool(partial(attr, *args, **kwargs))
+
+        return call
+
+
+@asynccontextmanager
+async def service_scope(
+    sync_service: Callable[[Session], Any],
+    async_service: Callable[[AsyncSession], AsyncServiceT],
+) -> AsyncIterator[AsyncServiceT]:
+    """
+    Open a session for the configured stack and bind a service to it.
+
+    Also usable outside of a request, e.g. from background tasks.
+
+    Args:
+        sync_service: Service class used with the sync engine
+        async_service: Service class used with the async engine
+
+    Yields:
+        A service exposing the async interface
+    """
+    if database.AsyncSessionLocal is not None:
+        async with database.AsyncSessionLocal() as db:
+            yield async_service(db)
+        return
+
+    session = database.SessionLocal()
+    try:
+        yield cast(AsyncServiceT, ThreadedService(sync_service(session)))
+    finally:
+        await run_in_threadpool(session.close)
+
+
+async def get_project_service() -> AsyncGenerator[AsyncProjectService, None]:
+    """
+    Dependency that provides a ProjectService for the configured stack.
+
+    Yields:
+        AsyncProjectService (or the threaded sync equivalent)
+    """
+    async with service_scope(ProjectService, AsyncProjectService) as service:
+        yield service
+
+
+async def get_feature_service() -> AsyncGenerator[AsyncFeatureService, None]:
+    """
+    Dependency that provides a FeatureService for the configured stack.
+
+    Yields:
+        AsyncFeatureService (or the threaded sync equivalent)
+    """
+    async with service_scope(FeatureService, AsyncFeatureService) as service:
+        yield service
+
+
+async def get_agent_log_service() -> AsyncGenerator[AsyncAgentLogService, None]:
+    """
+    Dependency that provides an AgentLogService for the configured stack.
+
+    Yields:
+        AsyncAgentLogService (or the threaded sync equivalent)
+    """
+    async with service_scope(AgentLogService, AsyncAgentLogService) as service:
+        yield service
+
+
+def get_agent_log_sink(request: Request) -> AgentLogSink:
+    """
+    Dependency that provides the agent log write-behind buffer.
+
+    The sink is created and started in the application lifespan.
+
+    Returns:
+        The application's AgentLogSink
+    """
+    return request.app.state.agent_log_sink
+
+
+async def write_agent_logs(logs: list[AgentLogCreate]) -> int:
+    """
+    Write a batch of agent logs in a session of its own.
+
+    Used by the AgentLogSink worker, outside of any request.
+
+    Args:
+        logs: List of log entries
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If a project or PBI referenced by the batch is not found
+    """
+    async with service_scope(AgentLogService, AsyncAgentLogService) as service:
+        return await service.create_many(logs)
+
+
+def get_agent_log_hub(request: Request) -> AgentLogHub:
+    """
+    Dependency that provides the live agent log fan-out.
+
+    The hub is created and attached to the LISTEN connection in the
+    application lifespan.
+
+    Returns:
+        The application's AgentLogHub
+    """
+    return request.app.state.agent_log_hub
+
+
+def agent_log_service_scope() -> AbstractAsyncContextManager[AsyncAgentLogService]:
+    """
+    Open an AgentLogService session outside of a request.
+
+    Used by long-running streams, which must not hold a session (and a
+    pooled connection) for as long as the viewer stays connected, and
+    by exports, which outlive the request's dependencies.
+
+    Returns:
+        Async context manager yielding an AsyncAgentLogService
+    """
+    return service_scope(AgentLogService, AsyncAgentLogService)
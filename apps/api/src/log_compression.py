@@ -0,0 +1,264 @@
+"""
+Compressed and deduplicated storage of large agent log contents.
+
+CODE logs routinely carry whole files and diffs, often the same ones
+again across retries and review loops. Two opt-in storage modes apply
+to them:
+- with log_blobs_enabled, content over log_blob_threshold_bytes is
+  stored once per distinct body in log_blobs and agent_logs.content_hash
+  references it (see blob_hash())
+- with log_compression_enabled, content over
+  log_compression_threshold_bytes is written zstd-compressed to
+  content_zstd instead of content, in agent_logs or in log_blobs (see
+  store_content())
+
+A log stored in a blob or compressed keeps its first
+CONTENT_PREVIEW_CHARS characters in content_head. Exactly one of
+content, content_zstd and content_hash is set per row.
+
+AgentLog.content decompresses only when it is read; listings that ask
+for AgentLog.content_preview never load the compressed bytes at all.
+
+Rows written before compression was enabled are converted in batches
+by backfill(), e.g. from a shell:
+
+    LOG_COMPRESSION_ENABLED=true python -m src.log_compression
+"""
+
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+import zstandard
+from sqlalchemy import Engine, text
+from src.config import get_settings
+from src.database import engine as default_engine
+from src.models.agent_log import CONTENT_PREVIEW_CHARS
+from src.models.enums import AgentMessageType
+from src.schemas.agent_log import AgentLogCompressionStats
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED_MESSAGE_TYPES = frozenset({AgentMessageType.CODE})
+BLOB_MESSAGE_TYPES = frozenset({AgentMessageType.CODE})
+
+_BACKFILL_SELECT_SQL = text(
+    "SELECT id, created_at, content FROM agent_logs "
+    "WHERE (id, created_at) > (:id, :created_at) "
+    "AND message_type = 'CODE' AND content IS NOT NULL "
+    "AND octet_length(content) > :threshold "
+    "ORDER BY id, created_at LIMIT :limit"
+)
+
+_BACKFILL_UPDATE_SQL = text(
+    "UPDATE agent_logs "
+    "SET content = NULL, content_zstd = :content_zstd, content_head = :content_head "
+    "WHERE id = :id AND created_at = :created_at"
+)
+
+
+class StoredContent(NamedTuple):
+    """Values of the content, content_zstd and content_head columns."""
+
+    content: str | None
+    content_zstd: bytes | None
+    content_head: str | None
+
+
+class BackfillResult(NamedTuple):
+    """Rows converted by a backfill and their size before and after."""
+
+    rows: int
+    original_bytes: int
+    compressed_bytes: int
+
+
+class _Counters:
+    # Shared by the event loop and the threadpool in sync mode
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.compressed = 0
+        self.original_bytes = 0
+        self.compressed_bytes = 0
+
+
+_counters = _Counters()
+
+
+def _compress(content: str, threshold: int, level: int) -> bytes | None:
+    if len(content) <= threshold // 4:
+        # Too short to exceed the threshold even in 4-byte characters
+        return None
+    raw = content.encode()
+    if len(raw) <= threshold:
+        return None
+    data = zstandard.compress(raw, level)
+    if len(data) >= len(raw):
+        return None
+    with _counters.lock:
+        _counters.compressed += 1
+        _counters.original_bytes += len(raw)
+        _counters.compressed_bytes += len(data)
+    return data
+
+
+def store_content(message_type: AgentMessageType, content: str) -> StoredContent:
+    """
+    Column values for writing a log's content.
+
+    Args:
+        message_type: Type of the log
+        content: Log content as received
+
+    Returns:
+        The content compressed if compression is enabled, the message
+        type is compressed and the content is over the threshold (and
+        actually shrinks); the plain content otherwise
+    """
+    settings = get_settings()
+    if (
+        settings.log_compression_enabled
+        and message_type in COMPRESSED_MESSAGE_TYPES
+    ):
+        data = _compress(
+            content,
+            settings.log_compression_threshold_bytes,
+            settings.log_compression_level,
+        )
+        if data is not None:
+            return StoredContent(None, data, content[:CONTENT_PREVIEW_CHARS])
+    return StoredContent(content, None, None)
+
+
+def blob_hash(message_type: AgentMessageType, content: str) -> bytes | None:
+    """
+    Blob key for a log's content.
+
+    Args:
+        message_type: Type of the log
+        content: Log content as received
+
+    Returns:
+        SHA-256 digest of the content if blobs are enabled, the message
+        type is stored in blobs and the content is over the threshold;
+        None if the content is stored inline
+    """
+    settings = get_settings()
+    if (
+        not settings.log_blobs_enabled
+        or message_type not in BLOB_MESSAGE_TYPES
+        or len(content) <= settings.log_blob_threshold_bytes // 4
+    ):
+        return None
+    raw = content.encode()
+    if len(raw) <= settings.log_blob_threshold_bytes:
+        return None
+    return hashlib.sha256(raw).digest()
+
+
+def stats() -> AgentLogCompressionStats:
+    """
+    Snapshot of the compression counters of this process.
+
+    Returns:
+        Current settings and totals since startup
+    """
+    settings = get_settings()
+    with _counters.lock:
+        return AgentLogCompressionStats(
+            enabled=settings.log_compression_enabled,
+            threshold_bytes=settings.log_compression_threshold_bytes,
+            compressed=_counters.compressed,
+            original_bytes=_counters.original_bytes,
+            compressed_bytes=_counters.compressed_bytes,
+            ratio=(
+                _counters.original_bytes / _counters.compressed_bytes
+                if _counters.compressed_bytes
+                else None
+            ),
+        )
+
+
+def backfill(
+    engine: Engine,
+    threshold: int,
+    level: int,
+    batch_size: int = 500,
+) -> BackfillResult:
+    """
+    Compress existing CODE logs over the threshold.
+
+    Walks agent_logs in primary key order and commits after every
+    batch, so it can be stopped and rerun at any time; rows already
+    compressed are skipped.
+
+    Args:
+        engine: Sync engine
+        threshold: Content size in bytes above which logs are compressed
+        level: zstd compression level
+        batch_size: Rows read and updated per transaction
+
+    Returns:
+        Rows compressed and their total size before and after
+    """
+    rows = original_bytes = compressed_bytes = 0
+    last_key: tuple[UUID, datetime] = (UUID(int=0), datetime.min)
+    while True:
+        with engine.begin() as connection:
+            batch = connection.execute(
+                _BACKFILL_SELECT_SQL,
+                {
+                    "id": last_key[0],
+                    "created_at": last_key[1],
+                    "threshold": threshold,
+                    "limit": batch_size,
+                },
+            ).all()
+            if not batch:
+                break
+            last_key = (batch[-1].id, batch[-1].created_at)
+
+            updates = []
+            for log in batch:
+                data = _compress(log.content, threshold, level)
+                if data is None:
+                    continue
+                updates.append(
+                    {
+                        "id": log.id,
+                        "created_at": log.created_at,
+                        "content_zstd": data,
+                        "content_head": log.content[:CONTENT_PREVIEW_CHARS],
+                    }
+                )
+                original_bytes += len(log.content.encode())
+                compressed_bytes += len(data)
+            if updates:
+                connection.execute(_BACKFILL_UPDATE_SQL, updates)
+                rows += len(updates)
+        logger.info("Compressed %d agent logs so far", rows)
+
+    return BackfillResult(rows, original_bytes, compressed_bytes)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    settings = get_settings()
+    if not settings.log_compression_enabled:
+        raise SystemExit("Set LOG_COMPRESSION_ENABLED=true before compressing")
+    result = backfill(
+        default_engine,
+        settings.log_compression_threshold_bytes,
+        settings.log_compression_level,
+    )
+    if result.rows:
+        logger.info(
+            "Compressed %d agent logs from %d to %d bytes (%.1fx)",
+            result.rows,
+            result.original_bytes,
+            result.compressed_bytes,
+            result.original_bytes / result.compressed_bytes,
+        )
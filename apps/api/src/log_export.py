@@ -0,0 +1,160 @@
+"""
+Bulk export of a project's agent log history.
+
+The logs are read through a server-side cursor EXPORT_CHUNK_SIZE rows
+at a time, and each chunk is encoded and sent before the next one is
+fetched, so an export holds one chunk in memory however many logs the
+project has.
+
+Two formats are supported:
+
+- ndjson: one AgentLogResponse JSON object per line
+- arrow: an Arrow IPC stream, one record batch per chunk; extra_data is
+  carried as a JSON string
+
+Either can be gzip-compressed on the fly.
+"""
+
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+from enum import Enum
+from uuid import UUID
+
+import pyarrow as pa
+from src.models import AgentLog
+from src.schemas.agent_log import AgentLogResponse
+from src.services.agent_log_service import AsyncAgentLogService
+
+# Logs fetched, encoded and sent at a time
+EXPORT_CHUNK_SIZE = 1000
+
+GZIP_LEVEL = 6
+
+ServiceScope = Callable[[], AbstractAsyncContextManager[AsyncAgentLogService]]
+
+ARROW_SCHEMA = pa.schema(
+    [
+        pa.field("id", pa.string(), nullable=False),
+        pa.field("project_id", pa.string(), nullable=False),
+        pa.field("pbi_id", pa.string()),
+        pa.field("agent_name", pa.string(), nullable=False),
+        pa.field("message_type", pa.string(), nullable=False),
+        pa.field("content", pa.large_string(), nullable=False),
+        pa.field("extra_data", pa.large_string()),
+        pa.field("created_at", pa.timestamp("us", tz="UTC"), nullable=False),
+    ]
+)
+
+
+class ExportFormat(str, Enum):
+    """
+    Encoding of an agent log export.
+
+    - NDJSON: Newline-delimited JSON
+    - ARROW: Apache Arrow IPC stream
+    """
+
+    NDJSON = "ndjson"
+    ARROW = "arrow"
+
+    @property
+    def media_type(self) -> str:
+        """Content type of the encoded export."""
+        if self is ExportFormat.ARROW:
+            return "application/vnd.apache.arrow.stream"
+        return "application/x-ndjson"
+
+    @property
+    def extension(self) -> str:
+        """File name extension of the encoded export."""
+        return "arrow" if self is ExportFormat.ARROW else "ndjson"
+
+
+def _ndjson_chunk(logs: list[AgentLog]) -> bytes:
+    return b"".join(
+        AgentLogResponse.model_validate(log).model_dump_json().encode() + b"\n"
+        for log in logs
+    )
+
+
+def _arrow_batch(logs: list[AgentLog]) -> pa.RecordBatch:
+    return pa.record_batch(
+        [
+            [str(log.id) for log in logs],
+            [str(log.project_id) for log in logs],
+            [None if log.pbi_id is None else str(log.pbi_id) for log in logs],
+            [log.agent_name for log in logs],
+            [log.message_type.value for log in logs],
+            [log.content for log in logs],
+            [
+                None if log.extra_data is None else json.dumps(log.extra_data)
+                for log in logs
+            ],
+            # created_at is naive UTC
+            [log.created_at for log in logs],
+        ],
+        schema=ARROW_SCHEMA,
+    )
+
+
+async def _encode(
+    chunks: AsyncIterator[list[AgentLog]], export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    if export_format is ExportFormat.NDJSON:
+        async for logs in chunks:
+            yield _ndjson_chunk(logs)
+        return
+
+    # The writer appends to buffer, which is drained after every batch
+    buffer = io.BytesIO()
+    with pa.ipc.new_stream(buffer, ARROW_SCHEMA) as writer:
+        async for logs in chunks:
+            writer.write_batch(_arrow_batch(logs))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    # Schema (for an empty export) and end-of-stream marker
+    yield buffer.getvalue()
+
+
+async def _gzip(data: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for block in data:
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def export_project_logs(
+    service_scope: ServiceScope,
+    project_id: UUID,
+    export_format: ExportFormat,
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """
+    Encode all of a project's logs, oldest first.
+
+    Opens its own session, held until the export is fully sent or the
+    client goes away.
+
+    Args:
+        service_scope: Opens an AgentLogService session
+        project_id: UUID of the project
+        export_format: Encoding of the export
+        gzip: Compress the encoded export with gzip
+
+    Yields:
+        The encoded export, one block per chunk of logs
+    """
+    async with service_scope() as service:
+        chunks = service.iter_by_project(project_id, EXPORT_CHUNK_SIZE)
+        data = _encode(chunks, export_format)
+        if gzip:
+            data = _gzip(data)
+        async for block in data:
+            if block:
+                yield block
@@ -0,0 +1,312 @@
+"""
+Retention of agent logs of finished projects.
+
+Once a project is COMPLETED or FAILED, its logs are only looked at in
+aggregate. For every message type with a retention period in
+log_retention_days, each pass collapses the logs of finished projects
+older than that period into agent_log_summaries (one row per PBI and
+message type: count, first and last timestamps, ERROR logs verbatim)
+and deletes them. Types without a period are kept.
+
+Logs are deleted batch_size rows per transaction, each batch summarized
+and deleted by a single statement, so no lock is held for long and an
+interrupted pass loses nothing. Batches skip rows locked by another
+worker's pass. Blobs no longer referenced by any log are deleted the
+same way at the end of a pass.
+
+The API runs a pass every log_retention_interval_hours when any period
+is configured (see src/main.py). A pass can also be run by hand:
+
+    python -m src.log_retention
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy import Engine, LargeBinary, bindparam, column, text
+from sqlalchemy.exc import IntegrityError
+from src.config import get_settings
+from src.database import engine as default_engine
+from src.models.enums import AgentMessageType, ProjectStatus
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = (ProjectStatus.COMPLETED, ProjectStatus.FAILED)
+
+_FINISHED_PROJECTS_SQL = text(
+    "SELECT id FROM projects WHERE status IN :statuses ORDER BY id"
+).bindparams(
+    bindparam(
+        "statuses",
+        [status.value for status in FINISHED_STATUSES],
+        expanding=True,
+    )
+)
+
+_ROLLUP_SQL = text(
+    """
+    WITH expired AS (
+        SELECT id, created_at FROM agent_logs
+        WHERE project_id = :project_id
+            AND message_type = :message_type
+            AND created_at < :cutoff
+        ORDER BY created_at
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    ),
+    deleted AS (
+        DELETE FROM agent_logs USING expired
+        WHERE agent_logs.id = expired.id
+            AND agent_logs.created_at = expired.created_at
+        RETURNING agent_logs.pbi_id, agent_logs.message_type,
+            agent_logs.agent_name, agent_logs.content, agent_logs.extra_data,
+            agent_logs.created_at
+    ),
+    summarized AS (
+        INSERT INTO agent_log_summaries AS summary
+            (project_id, pbi_id, message_type, log_count, first_at, last_at,
+            errors)
+        SELECT
+            :project_id, pbi_id, CAST(:message_type AS agentmessagetype),
+            count(*), min(created_at), max(created_at),
+            coalesce(
+                jsonb_agg(
+                    jsonb_build_object(
+                        'created_at', created_at,
+                        'agent_name', agent_name,
+                        'content', content,
+                        'extra_data', extra_data
+                    )
+                    ORDER BY created_at
+                ) FILTER (WHERE message_type = 'ERROR'),
+                '[]'
+            )
+        FROM deleted
+        GROUP BY pbi_id
+        ON CONFLICT (project_id, pbi_id, message_type) DO UPDATE SET
+            log_count = summary.log_count + excluded.log_count,
+            first_at = least(summary.first_at, excluded.first_at),
+            last_at = greatest(summary.last_at, excluded.last_at),
+            errors = summary.errors || excluded.errors
+    )
+    SELECT count(*) FROM deleted
+    """
+)
+
+# Walks unreferenced blobs in hash order. Blobs locked FOR KEY SHARE by
+# a batch about to reference them are skipped.
+_PRUNE_BLOBS_SQL = text(
+    """
+    DELETE FROM log_blobs WHERE hash IN (
+        SELECT hash FROM log_blobs
+        WHERE hash > :after
+            AND NOT EXISTS (
+                SELECT 1 FROM agent_logs
+                WHERE agent_logs.content_hash = log_blobs.hash
+            )
+        ORDER BY hash
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING hash
+    """
+).columns(column("hash", LargeBinary))
+
+
+class RetentionResult(NamedTuple):
+    """Rows removed by one retention pass."""
+
+    logs_deleted: int
+    blobs_deleted: int
+
+
+def retention_periods(days: dict[str, int]) -> dict[AgentMessageType, timedelta]:
+    """
+    Parse the log_retention_days setting.
+
+    Args:
+        days: Days to keep, by message type name
+
+    Returns:
+        Retention period by message type
+
+    Raises:
+        ValueError: If a message type is unknown or a period is not positive
+    """
+    periods = {}
+    for name, count in days.items():
+        message_type = AgentMessageType(name)
+        if count <= 0:
+            raise ValueError(f"Retention of {name} logs must be at least 1 day")
+        periods[message_type] = timedelta(days=count)
+    return periods
+
+
+def finished_projects(engine: Engine) -> list[UUID]:
+    """
+    IDs of the projects whose logs retention applies to.
+
+    Args:
+        engine: Sync engine
+
+    Returns:
+        IDs of the COMPLETED and FAILED projects
+    """
+    with engine.connect() as connection:
+        return list(connection.scalars(_FINISHED_PROJECTS_SQL))
+
+
+def rollup_batch(
+    engine: Engine,
+    project_id: UUID,
+    message_type: AgentMessageType,
+    cutoff: datetime,
+    batch_size: int,
+) -> int:
+    """
+    Summarize and delete the oldest expired logs of a project and type.
+
+    Args:
+        engine: Sync engine
+        project_id: UUID of the project
+        message_type: Type of the logs
+        cutoff: Logs created before this (naive UTC) are expired
+        batch_size: Maximum number of logs to delete
+
+    Returns:
+        Number of logs deleted; fewer than batch_size once none are left
+    """
+    with engine.begin() as connection:
+        return connection.scalar(
+            _ROLLUP_SQL,
+            {
+                "project_id": project_id,
+                "message_type": message_type.value,
+                "cutoff": cutoff,
+                "limit": batch_size,
+            },
+        )
+
+
+def prune_blobs_batch(
+    engine: Engine, after: bytes, batch_size: int
+) -> list[bytes]:
+    """
+    Delete blobs that no log references any more.
+
+    Args:
+        engine: Sync engine
+        after: Only blobs with a greater hash are considered
+        batch_size: Maximum number of blobs to delete
+
+    Returns:
+        Hashes of the deleted blobs
+    """
+    with engine.begin() as connection:
+        return list(
+            connection.scalars(
+                _PRUNE_BLOBS_SQL, {"after": after, "limit": batch_size}
+            )
+        )
+
+
+async def run_retention(
+    engine: Engine,
+    periods: dict[AgentMessageType, timedelta],
+    batch_size: int,
+) -> RetentionResult:
+    """
+    Run one retention pass.
+
+    Every batch runs in the threadpool, so cancelling the pass stops it
+    after the current batch.
+
+    Args:
+        engine: Sync engine
+        periods: Retention period by message type
+        batch_size: Rows deleted per transaction
+
+    Returns:
+        Number of logs and blobs deleted
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    logs_deleted = 0
+    for project_id in await run_in_threadpool(finished_projects, engine):
+        for message_type, period in periods.items():
+            while True:
+                deleted = await run_in_threadpool(
+                    rollup_batch,
+                    engine,
+                    project_id,
+                    message_type,
+                    now - period,
+                    batch_size,
+                )
+                logs_deleted += deleted
+                if deleted < batch_size:
+                    break
+
+    blobs_deleted = 0
+    after = b""
+    while True:
+        try:
+            hashes = await run_in_threadpool(
+                prune_blobs_batch, engine, after, batch_size
+            )
+        except IntegrityError:
+            # A blob was referenced again after it was selected; it is
+            # still in use, so leave the rest for the next pass.
+            break
+        blobs_deleted += len(hashes)
+        if len(hashes) < batch_size:
+            break
+        after = max(hashes)
+
+    if logs_deleted or blobs_deleted:
+        logger.info(
+            "Retention deleted %d agent logs and %d blobs",
+            logs_deleted,
+            blobs_deleted,
+        )
+    return RetentionResult(logs_deleted, blobs_deleted)
+
+
+async def run_retention_periodically(
+    engine: Engine,
+    interval: float,
+    periods: dict[AgentMessageType, timedelta],
+    batch_size: int,
+) -> None:
+    """
+    Run a retention pass now and then every interval seconds, forever.
+
+    Failures are logged and retried on the next pass.
+
+    Args:
+        engine: Sync engine
+        interval: Seconds between the end of a pass and the next one
+        periods: Retention period by message type
+        batch_size: Rows deleted per transaction
+    """
+    while True:
+        try:
+            await run_retention(engine, periods, batch_size)
+        except Exception:
+            logger.exception("Agent log retention failed")
+        await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    settings = get_settings()
+    asyncio.run(
+        run_retention(
+            default_engine,
+            retention_periods(settings.log_retention_days),
+            settings.log_retention_batch_size,
+        )
+    )
@@ -0,0 +1,203 @@
+"""
+Write-behind buffer for agent logs.
+
+Agents emit many small log messages. Instead of a commit per message,
+POST /api/v1/logs puts entries on a bounded in-process queue and returns
+straight away; a single worker task drains the queue and writes entries
+in bulk with one COPY per batch.
+
+The sink is created, started and drained in the FastAPI lifespan
+(src/main.py). Entries still queued when the process dies are lost, so
+callers that need durability use POST /api/v1/logs/batch instead.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from src.schemas.agent_log import AgentLogCreate, AgentLogSinkStats
+
+logger = logging.getLogger(__name__)
+
+# Writes a batch and returns the number of rows written
+LogWriter = Callable[[list[AgentLogCreate]], Awaitable[int]]
+
+
+class AgentLogSink:
+    """
+    Bounded queue of agent log entries flushed in bulk by a worker task.
+
+    A batch is flushed once batch_size entries are collected or
+    flush_interval seconds after its first entry, whichever comes first.
+    When the queue is full, writers wait up to block_timeout seconds for
+    room (backpressure) and are then dropped. A batch referencing a
+    missing project or PBI is split and retried until only the entries
+    at fault are left; those are counted as failed.
+    """
+
+    def __init__(
+        self,
+        write: LogWriter,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 0.2,
+        block_timeout: float = 0.1,
+    ) -> None:
+        """
+        Create a stopped sink.
+
+        Args:
+            write: Coroutine function writing one batch to the database
+            max_queue: Maximum number of entries waiting to be written
+            batch_size: Maximum number of entries per write
+            flush_interval: Seconds an entry may wait for its batch to fill
+            block_timeout: Seconds a writer waits for room in a full queue
+        """
+        self._write = write
+        self._queue: asyncio.Queue[AgentLogCreate | None] = asyncio.Queue(max_queue)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._block_timeout = block_timeout
+        self._worker: asyncio.Task[None] | None = None
+        self._closed = False
+        # Writers waiting for room in a full queue
+        self._waiting = 0
+        self._no_waiters = asyncio.Event()
+
+        self._accepted = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._flushes = 0
+
+    def start(self) -> None:
+        """Start the worker task on the running event loop."""
+        self._worker = asyncio.create_task(self._run(), name="agent-log-sink")
+
+    async def stop(self) -> None:
+        """
+        Stop accepting entries and wait until everything queued is written.
+        """
+        if self._worker is None:
+            return
+        self._closed = True
+        # Writers already waiting for room get their entry in (or time
+        # out) first; anything queued after the marker would be lost.
+        while self._waiting:
+            self._no_waiters.clear()
+            await self._no_waiters.wait()
+        # Queued behind the remaining entries, so it is seen after them
+        await self._queue.put(None)
+        await self._worker
+        self._worker = None
+
+    async def put(self, log: AgentLogCreate) -> bool:
+        """
+        Queue an entry for writing.
+
+        Args:
+            log: Log entry to write
+
+        Returns:
+            True if queued, False if dropped because the queue stayed full
+            (or the sink is shutting down)
+        """
+        if self._closed:
+            self._dropped += 1
+            return False
+
+        try:
+            self._queue.put_nowait(log)
+        except asyncio.QueueFull:
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._queue.put(log), self._block_timeout)
+            except TimeoutError:
+                self._dropped += 1
+                return False
+            finally:
+                self._waiting -= 1
+                if not self._waiting:
+                    self._no_waiters.set()
+
+        self._accepted += 1
+        return True
+
+    def stats(self) -> AgentLogSinkStats:
+        """
+        Snapshot of the sink counters.
+
+        Returns:
+            Current queue depth and totals since startup
+        """
+        return AgentLogSinkStats(
+            queued=self._queue.qsize(),
+            accepted=self._accepted,
+            written=self._written,
+            dropped=self._dropped,
+            failed=self._failed,
+            flushes=self._flushes,
+        )
+
+    # =========================================================================
+    # Worker
+    # =========================================================================
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                return
+            batch, stopping = await self._collect(first)
+            await self._flush(batch)
+
+    async def _collect(
+        self, first: AgentLogCreate
+    ) -> tuple[list[AgentLogCreate], bool]:
+        # Fill the batch until it is full, the interval since the first
+        # entry runs out, or the stop marker comes up.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._flush_interval
+        batch = [first]
+        while len(batch) < self._batch_size:
+            try:
+                log = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    log = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+            if log is None:
+                return batch, True
+            batch.append(log)
+        return batch, False
+
+    async def _flush(self, batch: list[AgentLogCreate]) -> None:
+        self._flushes += 1
+        try:
+            self._written += await self._write(batch)
+        except ValueError:
+            # A project or PBI that was deleted (or never existed) fails
+            # the whole COPY; retry in halves so only its entries are lost.
+            await self._bisect(batch)
+        except Exception:
+            self._failed += len(batch)
+            logger.exception("Failed to write %d agent logs", len(batch))
+
+    async def _bisect(self, batch: list[AgentLogCreate]) -> None:
+        if len(batch) == 1:
+            log = batch[0]
+            self._failed += 1
+            logger.warning(
+                "Dropped an agent log for project %s, PBI %s: not found",
+                log.project_id,
+                log.pbi_id,
+            )
+            return
+        middle = len(batch) // 2
+        await self._flush(batch[:middle])
+        await self._flush(batch[middle:])
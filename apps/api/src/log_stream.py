@@ -0,0 +1,364 @@
+"""
+Live agent log fan-out for Server-Sent Events and long polling.
+
+The agent_logs_notify trigger publishes the ids of new logs per project,
+with the oldest of their timestamps, on the agent_logs channel.
+AgentLogHub receives them through the worker's shared PgListener, loads
+each batch of new logs once (from the recent partitions only) and hands
+the rendered events to every subscriber of that project.
+
+Every subscriber has a bounded queue. The hub never waits on a viewer:
+when a queue is full the subscriber is marked as lagging, its queue is
+dropped and its stream catches up from the database, starting after the
+last event it sent. The same catch-up serves Last-Event-ID resumes and
+notifications missed while the LISTEN connection was down.
+
+Both rely on a project's logs becoming visible, and being announced, in
+(created_at, id) order: log writes hold a per-project lock until they
+commit (see AgentLogService.create_many) and the trigger publishes the
+chunks of a write oldest first. A log at or before a cursor can then no
+longer appear after it, so skipping such events only drops duplicates.
+
+Long polls (AgentLogHub.poll) hold no queue: they wait on an event set
+by the next notification for their project and then read the new logs
+from the database.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractAsyncContextManager, contextmanager
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+from src.models import AgentLog
+from src.pg_listener import PgListener
+from src.schemas.agent_log import AgentLogResponse
+from src.services.agent_log_service import AsyncAgentLogService
+from src.services.pagination import decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "agent_logs"
+
+# Logs fetched per query while catching up
+CATCH_UP_PAGE_SIZE = 200
+
+# Long polls woken by the same notification read one after another in
+# groups of this size, rather than all competing for pooled connections
+# (and, in sync mode, threadpool threads) at once.
+POLL_READ_CONCURRENCY = 5
+
+ServiceScope = Callable[[], AbstractAsyncContextManager[AsyncAgentLogService]]
+
+
+class LogEvent(NamedTuple):
+    """A log rendered once and shared by every subscriber."""
+
+    key: tuple[datetime, UUID]
+    data: str
+
+    def frame(self) -> str:
+        """Format the event as an SSE message; its id is a resume cursor."""
+        return f"id: {encode_cursor(*self.key)}\nevent: log\ndata: {self.data}\n\n"
+
+
+def _log_event(log: AgentLog) -> LogEvent:
+    return LogEvent(
+        key=(log.created_at, log.id),
+        data=AgentLogResponse.model_validate(log).model_dump_json(),
+    )
+
+
+class LogSubscription:
+    """Bounded queue of live events for one viewer of a project."""
+
+    def __init__(self, project_id: UUID, max_pending: int) -> None:
+        self.project_id = project_id
+        self.lagging = False
+        # One extra slot for the wake-up marker put by mark_lagging()
+        self._queue: asyncio.Queue[LogEvent | None] = asyncio.Queue(max_pending + 1)
+        self._max_pending = max_pending
+
+    def deliver(self, events: list[LogEvent]) -> None:
+        """Queue live events without waiting; overflow marks the viewer lagging."""
+        if self.lagging:
+            return
+        if self._queue.qsize() + len(events) > self._max_pending:
+            self.mark_lagging()
+            return
+        for event in events:
+            self._queue.put_nowait(event)
+
+    def mark_lagging(self) -> None:
+        """Drop queued events and wake the stream so it catches up instead."""
+        self.lagging = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    def resume(self) -> None:
+        """Accept live events again once the stream has caught up."""
+        self.lagging = False
+
+    async def get(self, timeout: float) -> LogEvent | None:
+        """Next live event, or None on timeout or after mark_lagging()."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+
+class AgentLogHub:
+    """
+    Fans new agent logs out to the live streams of this worker.
+    """
+
+    def __init__(
+        self,
+        service_scope: ServiceScope,
+        max_pending: int = 1000,
+        keepalive: float = 15.0,
+    ) -> None:
+        """
+        Create a stopped hub.
+
+        Args:
+            service_scope: Opens a short-lived AgentLog service session
+            max_pending: Live events a subscriber may fall behind by
+            keepalive: Seconds of silence before a keepalive comment is sent
+        """
+        self._service_scope = service_scope
+        self._max_pending = max_pending
+        self._keepalive = keepalive
+        self._subscriptions: dict[UUID, set[LogSubscription]] = defaultdict(set)
+        self._watchers: dict[UUID, set[asyncio.Event]] = defaultdict(set)
+        self._poll_reads = asyncio.Semaphore(POLL_READ_CONCURRENCY)
+        self._pending: dict[UUID, list[UUID]] = defaultdict(list)
+        self._pending_since: dict[UUID, datetime] = {}
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def attach(self, listener: PgListener) -> None:
+        """
+        Subscribe to new-log notifications on the shared listener.
+
+        Args:
+            listener: The worker's PgListener (not yet started)
+        """
+        listener.listen(CHANNEL, self._on_notify)
+        listener.on_connect(self._on_connect)
+
+    def start(self) -> None:
+        """Start the fan-out task on the running event loop."""
+        self._task = asyncio.create_task(self._run(), name="agent-log-hub")
+
+    async def stop(self) -> None:
+        """Stop the fan-out task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stream(self, project_id: UUID, after: str | None) -> AsyncIterator[str]:
+        """
+        Open a live SSE stream of a project's logs.
+
+        Args:
+            project_id: UUID of the project
+            after: Cursor (SSE event id) of the last log already seen; the
+                stream starts with every later log. Without it the stream
+                starts with logs written from now on.
+
+        Returns:
+            Async iterator of SSE messages
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        if after is not None:
+            decode_cursor(after, datetime, UUID)
+        return self._stream(project_id, after)
+
+    async def poll(
+        self, project_id: UUID, after: str | None, limit: int, wait: float
+    ) -> tuple[list[AgentLog], str | None]:
+        """
+        Read a project's logs after a cursor, waiting for new ones if needed.
+
+        While waiting nothing but an event is held: no session, pooled
+        connection or threadpool thread.
+
+        Args:
+            project_id: UUID of the project
+            after: Cursor of the last log already seen; without it
+                reading starts at the oldest log
+            limit: Maximum number of logs to return
+            wait: Seconds to wait for new logs when there are none yet
+
+        Returns:
+            (logs oldest first, cursor to pass back as after). The cursor
+            is that of the last log returned, or after itself if there is
+            none.
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        if after is not None:
+            decode_cursor(after, datetime, UUID)
+        # Watch before reading, so logs written in between wake the wait
+        with self._watch(project_id) as announced:
+            logs = await self._read_after(project_id, after, limit)
+            if not logs and wait > 0:
+                try:
+                    await asyncio.wait_for(announced.wait(), wait)
+                except TimeoutError:
+                    return [], after
+                logs = await self._read_after(project_id, after, limit)
+
+        if not logs:
+            return [], after
+        return logs, encode_cursor(logs[-1].created_at, logs[-1].id)
+
+    # =========================================================================
+    # Streams
+    # =========================================================================
+
+    @contextmanager
+    def _subscribe(self, project_id: UUID) -> Iterator[LogSubscription]:
+        subscription = LogSubscription(project_id, self._max_pending)
+        self._subscriptions[project_id].add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscriptions[project_id]
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[project_id]
+
+    async def _stream(self, project_id: UUID, after: str | None) -> AsyncIterator[str]:
+        # Subscribe first so nothing written during the catch-up is
+        # missed; events at or before the last key sent are duplicates.
+        with self._subscribe(project_id) as subscription:
+            if after is None:
+                async with self._service_scope() as service:
+                    latest = await service.get_latest(project_id)
+                last_key = None if latest is None else (latest.created_at, latest.id)
+            else:
+                last_key = decode_cursor(after, datetime, UUID)
+                subscription.lagging = True
+
+            while True:
+                if subscription.lagging:
+                    subscription.resume()
+                    async for event in self._catch_up(project_id, last_key):
+                        last_key = event.key
+                        yield event.frame()
+                    continue
+
+                event = await subscription.get(self._keepalive)
+                if event is None:
+                    if not subscription.lagging:
+                        yield ": keepalive\n\n"
+                    continue
+                if last_key is not None and event.key <= last_key:
+                    continue
+                last_key = event.key
+                yield event.frame()
+
+    @contextmanager
+    def _watch(self, project_id: UUID) -> Iterator[asyncio.Event]:
+        announced = asyncio.Event()
+        self._watchers[project_id].add(announced)
+        try:
+            yield announced
+        finally:
+            watchers = self._watchers[project_id]
+            watchers.discard(announced)
+            if not watchers:
+                del self._watchers[project_id]
+
+    async def _read_after(
+        self, project_id: UUID, after: str | None, limit: int
+    ) -> list[AgentLog]:
+        async with self._poll_reads, self._service_scope() as service:
+            logs, _ = await service.list_by_project(project_id, limit, after)
+        return logs
+
+    async def _catch_up(
+        self, project_id: UUID, last_key: tuple[datetime, UUID] | None
+    ) -> AsyncIterator[LogEvent]:
+        # One short session per page; nothing is held open while the
+        # viewer reads.
+        cursor = None if last_key is None else encode_cursor(*last_key)
+        while True:
+            async with self._service_scope() as service:
+                logs, cursor = await service.list_by_project(
+                    project_id, CATCH_UP_PAGE_SIZE, cursor
+                )
+            for log in logs:
+                yield _log_event(log)
+            if cursor is None:
+                return
+
+    # =========================================================================
+    # Fan-out
+    # =========================================================================
+
+    def _on_notify(self, payload: str) -> None:
+        message = json.loads(payload)
+        project_id = UUID(message["project_id"])
+        for announced in self._watchers.get(project_id, ()):
+            announced.set()
+        if project_id not in self._subscriptions:
+            return
+        self._pending[project_id].extend(UUID(log_id) for log_id in message["ids"])
+        since = datetime.fromisoformat(message["since"])
+        self._pending_since[project_id] = min(
+            since, self._pending_since.get(project_id, since)
+        )
+        self._wake.set()
+
+    def _on_connect(self) -> None:
+        # Anything published while disconnected was missed
+        for watchers in self._watchers.values():
+            for announced in watchers:
+                announced.set()
+        for subscribers in self._subscriptions.values():
+            for subscription in subscribers:
+                subscription.mark_lagging()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            pending, self._pending = self._pending, defaultdict(list)
+            since, self._pending_since = self._pending_since, {}
+            for project_id, log_ids in pending.items():
+                await self._fan_out(project_id, log_ids, since[project_id])
+
+    async def _fan_out(
+        self, project_id: UUID, log_ids: list[UUID], since: datetime
+    ) -> None:
+        subscribers = self._subscriptions.get(project_id)
+        if not subscribers:
+            return
+        try:
+            async with self._service_scope() as service:
+                logs = await service.list_by_ids(log_ids, since)
+        except Exception:
+            logger.exception("Failed to load new logs for project %s", project_id)
+            for subscription in list(subscribers):
+                subscription.mark_lagging()
+            return
+
+        events = [_log_event(log) for log in logs]
+        for subscription in list(subscribers):
+            subscription.deliver(events)
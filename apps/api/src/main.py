@@ -8,6 +8,7 @@ This module initializes the FastAPI application with:
 - Lifespan events for startup/shutdown
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
@@ -15,8 +16,16 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.config import get_settings
-from src.database import init_db
-from src.routers import features_router, projects_router
+from src.database import close_db, engine, init_db
+from src.dependencies import agent_log_service_scope, write_agent_logs
+from src.log_retention import retention_periods, run_retention_periodically
+from src.log_sink import AgentLogSink
+from src.log_stream import AgentLogHub
+from src.partitions import run_maintenance_periodically
+from src.pg_listener import PgListener, listener_dsn
+from src.routers import features_router, logs_router, projects_router
+from src.schemas.cache import EntityCacheStats
+from src.services.cache import get_entity_cache
 
 # Get settings
 settings = get_settings()
@@ -37,9 +46,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     On startup:
         - Logs application start
         - Tests database connection
+        - Starts agent_logs partition maintenance
+        - Starts agent log retention, if configured
+        - Starts the agent log write-behind buffer
+        - Opens the shared LISTEN connection for live log streams and
+          entity cache invalidations
     
     On shutdown:
         - Logs application shutdown
+        - Stops partition maintenance and log retention, letting a batch
+          in progress finish
+        - Drains the agent log buffer
+        - Closes the LISTEN connection
+        - Disposes of database connection pools
     """
     # Startup
     logger.info("Starting Geonosis API...")
@@ -49,10 +68,68 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if not db_connected:
         logger.warning("Database connection failed - some features may be unavailable")
     
+    # Creates upcoming agent_logs partitions before any log is written
+    partition_maintenance = asyncio.create_task(
+        run_maintenance_periodically(
+            engine,
+            interval=settings.log_partition_check_interval_hours * 3600,
+            months_ahead=settings.log_partition_months_ahead,
+            retention_months=settings.log_partition_retention_months,
+            detach_only=settings.log_partition_detach_only,
+        )
+    )
+    
+    retention = None
+    periods = retention_periods(settings.log_retention_days)
+    if periods:
+        retention = asyncio.create_task(
+            run_retention_periodically(
+                engine,
+                interval=settings.log_retention_interval_hours * 3600,
+                periods=periods,
+                batch_size=settings.log_retention_batch_size,
+            )
+        )
+    
+    app.state.agent_log_sink = AgentLogSink(
+        write_agent_logs,
+        max_queue=settings.log_sink_max_queue,
+        batch_size=settings.log_sink_batch_size,
+        flush_interval=settings.log_sink_flush_interval_ms / 1000,
+        block_timeout=settings.log_sink_block_timeout_ms / 1000,
+    )
+    app.state.agent_log_sink.start()
+    
+    # One LISTEN connection per worker, shared by every live log stream
+    # and the entity cache
+    listener = PgListener(listener_dsn(settings.database_url))
+    app.state.agent_log_hub = AgentLogHub(
+        agent_log_service_scope,
+        max_pending=settings.log_stream_max_pending,
+        keepalive=settings.log_stream_keepalive_seconds,
+    )
+    app.state.agent_log_hub.attach(listener)
+    app.state.agent_log_hub.start()
+    # Per-worker entity caches evict what any worker writes
+    get_entity_cache().attach(listener)
+    listener.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Geonosis API...")
+    await app.state.agent_log_sink.stop()
+    await listener.stop()
+    await app.state.agent_log_hub.stop()
+    # A batch already running in the threadpool finishes before the
+    # pools are disposed
+    background = [partition_maintenance]
+    if retention is not None:
+        background.append(retention)
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await close_db()
 
 
 # Create FastAPI application
@@ -110,7 +187,19 @@ async def health() -> dict:
     }
 
 
+@app.get("/health/cache", response_model=EntityCacheStats)
+async def entity_cache_stats() -> EntityCacheStats:
+    """
+    Entity cache counters of this worker.
+    
+    Returns:
+        EntityCacheStats: Hits, misses, invalidations and evictions
+    """
+    return get_entity_cache().stats()
+
+
 # Register routers
 app.include_router(projects_router, prefix="/api/v1")
 app.include_router(features_router, prefix="/api/v1")
+app.include_router(logs_router, prefix="/api/v1")
 
@@ -11,11 +11,14 @@ Usage:
 
 # Models
 from src.models.agent_log import AgentLog
+from src.models.agent_log_summary import AgentLogSummary
 from src.models.base import Base
 # Enums
 from src.models.enums import (AgentMessageType, FeatureStatus, PBIStatus,
                               PBIType, ProjectStatus, ProjectType, PRStatus)
 from src.models.feature import Feature
+from src.models.feature_order_counter import FeatureOrderCounter
+from src.models.log_blob import LogBlob
 from src.models.pbi import PBI
 from src.models.project import Project
 
@@ -33,7 +36,10 @@ __all__ = [
     # Models
     "Project",
     "Feature",
+    "FeatureOrderCounter",
     "PBI",
     "AgentLog",
+    "AgentLogSummary",
+    "LogBlob",
 ]
 
@@ -7,20 +7,27 @@ providing an audit trail and debugging information.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
-from sqlalchemy import Enum, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSON
+import zstandard
+from sqlalchemy import (CheckConstraint, DateTime, Enum, ForeignKey, Index,
+                        LargeBinary, String, Text, func, text)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from src.models.base import Base, TimestampMixin, UUIDMixin
 from src.models.enums import AgentMessageType
 
 if TYPE_CHECKING:
+    from src.models.log_blob import LogBlob
     from src.models.pbi import PBI
     from src.models.project import Project
 
+# Characters of a compressed content kept in plain text in content_head
+CONTENT_PREVIEW_CHARS = 200
+
 
 class AgentLog(UUIDMixin, TimestampMixin, Base):
     """
@@ -30,28 +37,73 @@ class AgentLog(UUIDMixin, TimestampMixin, Base):
     as they work on projects and PBIs. This provides transparency
     into the agent's decision-making process.
 
+    The table is range-partitioned by month on created_at (see
+    src/partitions.py), so the primary key is (id, created_at).
+
     Attributes:
         project_id: Reference to the project this log belongs to
-        pbi_id: Optional reference to a specific PBI
+        pbi_id: Optional reference to a specific PBI (cleared if the PBI is deleted)
         agent_name: Name of the agent that created this log
         message_type: Type of message (THOUGHT, ACTION, CODE, ERROR, COMMUNICATION)
-        content: The actual log message content
-        extra_data: Additional structured data as JSON
+        content: The actual log message content, read from the blob or
+            decompressed on access if not stored inline (see
+            src/log_compression.py)
+        content_text: Plain stored content (the content column), or None
+        content_zstd: zstd-compressed content, or None; loaded on demand
+        content_hash: Hash of the LogBlob holding the content, or None
+        content_head: Start of the content when not stored in content
+        content_preview: Start of the content, without loading all of it;
+            loaded on demand
+        extra_data: Additional structured data as JSONB
         project: Parent project relationship
         pbi: Optional PBI relationship
+        blob: LogBlob holding the content, if any
     """
 
     __tablename__ = "agent_logs"
+    __table_args__ = (
+        # Serves a project's logs in time order; also covers plain
+        # project_id lookups
+        Index("ix_agent_logs_project_id_created_at_id", "project_id", "created_at", "id"),
+        # Serve searches without a project: by time only, by agent and by
+        # message type
+        Index("ix_agent_logs_created_at_id", "created_at", "id"),
+        Index("ix_agent_logs_agent_name_created_at_id", "agent_name", "created_at", "id"),
+        Index(
+            "ix_agent_logs_message_type_created_at_id",
+            "message_type",
+            "created_at",
+            "id",
+        ),
+        # Serves the existence checks before unreferenced blobs are
+        # deleted
+        Index(
+            "ix_agent_logs_content_hash",
+            "content_hash",
+            postgresql_where=text("content_hash IS NOT NULL"),
+        ),
+        # Serves containment filters (extra_data @> '{"tool": "git"}')
+        Index(
+            "ix_agent_logs_extra_data",
+            "extra_data",
+            postgresql_using="gin",
+            postgresql_ops={"extra_data": "jsonb_path_ops"},
+        ),
+        CheckConstraint(
+            "num_nonnulls(content, content_zstd, content_hash) = 1",
+            name="ck_agent_logs_content_stored_once",
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     project_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
-        ForeignKey("projects.id"),
+        ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     pbi_id: Mapped[UUID | None] = mapped_column(
         PGUUID(as_uuid=True),
-        ForeignKey("pbis.id"),
+        ForeignKey("pbis.id", ondelete="SET NULL"),
         nullable=True,
         index=True,
     )
@@ -60,13 +112,38 @@ class AgentLog(UUIDMixin, TimestampMixin, Base):
         Enum(AgentMessageType),
         nullable=False,
     )
-    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_text: Mapped[str | None] = mapped_column("content", Text, nullable=True)
+    content_zstd: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        deferred=True,
+    )
+    content_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        ForeignKey("log_blobs.hash"),
+        nullable=True,
+    )
+    content_head: Mapped[str | None] = mapped_column(Text, nullable=True)
     extra_data: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True,
         default=dict,
     )
 
+    # Time of the row rather than of the transaction, so the logs of one
+    # batch keep their order on (created_at, id). Also the partition key.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        primary_key=True,
+        server_default=func.timezone("utc", func.clock_timestamp()),
+        nullable=False,
+    )
+
+    content_preview: Mapped[str] = column_property(
+        func.coalesce(content_head, func.left(content_text, CONTENT_PREVIEW_CHARS)),
+        deferred=True,
+    )
+
     # Relationships
     project: Mapped["Project"] = relationship(
         "Project",
@@ -75,6 +152,20 @@ class AgentLog(UUIDMixin, TimestampMixin, Base):
     pbi: Mapped["PBI | None"] = relationship(
         "PBI",
     )
+    blob: Mapped["LogBlob | None"] = relationship(
+        "LogBlob",
+    )
+
+    @property
+    def content(self) -> str:
+        """The log message content."""
+        # Checked first so plain rows never load content_zstd; the check
+        # constraint guarantees exactly one of the three is set.
+        if self.content_text is not None:
+            return self.content_text
+        if self.content_hash is not None:
+            return cast("LogBlob", self.blob).content
+        return zstandard.decompress(cast(bytes, self.content_zstd)).decode()
 
     def __repr__(self) -> str:
         return f"<AgentLog(id={self.id}, agent='{self.agent_name}', type={self.message_type.value})>"
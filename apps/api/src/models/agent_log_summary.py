@@ -0,0 +1,81 @@
+"""
+AgentLogSummary model for Geonosis.
+
+Once the agent logs of a finished project pass their retention period,
+they are collapsed into one summary row per PBI and message type (see
+src/log_retention.py).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import DateTime, Enum, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base, TimestampMixin, UUIDMixin
+from src.models.enums import AgentMessageType
+
+
+class AgentLogSummary(UUIDMixin, TimestampMixin, Base):
+    """
+    Rolled-up agent logs of one PBI and message type.
+
+    Each retention batch adds to the row with an upsert, so the counts
+    and bounds cover every log deleted so far.
+
+    Attributes:
+        project_id: Reference to the project the logs belonged to
+        pbi_id: The PBI the logs belonged to, None for project-level logs
+        message_type: Type of the summarized logs
+        log_count: Number of logs deleted
+        first_at: created_at of the oldest deleted log
+        last_at: created_at of the newest deleted log
+        errors: ERROR logs kept verbatim (created_at, agent_name, content
+            and extra_data), oldest first
+    """
+
+    __tablename__ = "agent_log_summaries"
+    __table_args__ = (
+        # Project-level logs (pbi_id NULL) share one row per type too
+        UniqueConstraint(
+            "project_id",
+            "pbi_id",
+            "message_type",
+            name="uq_agent_log_summaries_project_id_pbi_id_message_type",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    project_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    pbi_id: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("pbis.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    message_type: Mapped[AgentMessageType] = mapped_column(
+        Enum(AgentMessageType),
+        nullable=False,
+    )
+    log_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    first_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    errors: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=list,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AgentLogSummary(project_id={self.project_id}, pbi_id={self.pbi_id}, "
+            f"type={self.message_type.value}, count={self.log_count})>"
+        )
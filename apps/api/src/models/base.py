@@ -16,32 +16,39 @@ Usage:
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, FetchedValue, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from src.database import Base
 
+# Naive UTC timestamp, matching the column type
+UTC_NOW = func.timezone("utc", func.now())
+
 
 class TimestampMixin:
     """
     Mixin that adds created_at and updated_at timestamp columns.
 
-    - created_at: Set automatically when the record is created
-    - updated_at: Updated automatically on every modification
+    - created_at: Set by the database when the record is created
+    - updated_at: Set by the database on every modification
+      (the set_updated_at trigger)
 
-    Both timestamps are stored in UTC.
+    Both timestamps are stored in UTC. eager_defaults makes INSERT and
+    UPDATE return them via RETURNING, so no refresh is needed afterwards.
     """
 
+    __mapper_args__ = {"eager_defaults": True}
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=UTC_NOW,
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UTC_NOW,
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -50,14 +57,14 @@ class UUIDMixin:
     """
     Mixin that adds a UUID primary key column.
 
-    The id is automatically generated using uuid4 when a new record is created.
+    The id is generated by the database with gen_random_uuid().
     Uses PostgreSQL's native UUID type for efficient storage.
     """
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        server_default=text("gen_random_uuid()"),
     )
 
 
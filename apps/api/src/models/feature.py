@@ -10,7 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models.base import Base, TimestampMixin, UUIDMixin
@@ -37,16 +37,26 @@ class Feature(UUIDMixin, TimestampMixin, Base):
         branch_name: Git branch name for this feature
         order: Display order within the project
         project: Parent project relationship
-        pbis: List of PBIs implementing this feature
+        pbis: List of PBIs implementing this feature, in order
     """
 
     __tablename__ = "features"
+    __table_args__ = (
+        # Serves per-project listing in display order, max(order) and
+        # feature counts; also covers plain project_id lookups
+        Index(
+            "ix_features_project_id_order_created_at_id",
+            "project_id",
+            "order",
+            "created_at",
+            "id",
+        ),
+    )
 
     project_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
-        ForeignKey("projects.id"),
+        ForeignKey("projects.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
@@ -66,7 +76,9 @@ class Feature(UUIDMixin, TimestampMixin, Base):
     pbis: Mapped[list["PBI"]] = relationship(
         "PBI",
         back_populates="feature",
+        order_by="(PBI.order, PBI.created_at, PBI.id)",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
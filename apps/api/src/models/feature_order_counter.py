@@ -0,0 +1,42 @@
+"""
+FeatureOrderCounter model for Geonosis.
+
+Holds the next free Feature.order value for each project, so new features
+get their order from a single-row upsert instead of scanning max(order).
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base
+
+
+class FeatureOrderCounter(Base):
+    """
+    Per-project feature order counter.
+
+    Allocation is an INSERT ... ON CONFLICT DO UPDATE ... RETURNING on
+    this row. The row stays locked until the allocating transaction
+    commits, so concurrent creates for the same project cannot receive
+    the same order.
+
+    Attributes:
+        project_id: The project this counter belongs to
+        next_order: The next unallocated order value
+    """
+
+    __tablename__ = "feature_order_counters"
+
+    project_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    next_order: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<FeatureOrderCounter(project_id={self.project_id}, next_order={self.next_order})>"
@@ -0,0 +1,63 @@
+"""
+LogBlob model for Geonosis.
+
+Holds large agent log contents once per distinct body, so the same file
+or diff logged again (retries, review loops) adds only a reference.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import cast
+
+import zstandard
+from sqlalchemy import CheckConstraint, DateTime, Integer, LargeBinary, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import UTC_NOW, Base
+
+
+class LogBlob(Base):
+    """
+    A log content addressed by its SHA-256 hash.
+
+    Blobs are immutable and written with INSERT ... ON CONFLICT DO
+    NOTHING, so concurrent writers of the same body share one row. Like
+    agent_logs, the body is stored either plain or zstd-compressed (see
+    src/log_compression.py).
+
+    Attributes:
+        hash: SHA-256 digest of the UTF-8 encoded content
+        content: The content, decompressed on access if stored compressed
+        content_text: Plain stored content (the content column), or None
+        content_zstd: zstd-compressed content, or None
+        size: Length of the content in bytes (UTF-8)
+        created_at: When the body was first stored
+    """
+
+    __tablename__ = "log_blobs"
+    __table_args__ = (
+        CheckConstraint(
+            "(content IS NULL) <> (content_zstd IS NULL)",
+            name="ck_log_blobs_content_stored_once",
+        ),
+    )
+
+    hash: Mapped[bytes] = mapped_column(LargeBinary, primary_key=True)
+    content_text: Mapped[str | None] = mapped_column("content", Text, nullable=True)
+    content_zstd: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        server_default=UTC_NOW,
+        nullable=False,
+    )
+
+    @property
+    def content(self) -> str:
+        """The blob content."""
+        if self.content_text is not None:
+            return self.content_text
+        return zstandard.decompress(cast(bytes, self.content_zstd)).decode()
+
+    def __repr__(self) -> str:
+        return f"<LogBlob(hash={self.hash.hex()}, size={self.size})>"
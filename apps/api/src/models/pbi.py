@@ -49,7 +49,7 @@ class PBI(UUIDMixin, TimestampMixin, Base):
 
     feature_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
-        ForeignKey("features.id"),
+        ForeignKey("features.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
@@ -73,8 +73,9 @@ class PBI(UUIDMixin, TimestampMixin, Base):
     )
     blocked_by_id: Mapped[UUID | None] = mapped_column(
         PGUUID(as_uuid=True),
-        ForeignKey("pbis.id"),
+        ForeignKey("pbis.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
     order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
@@ -95,6 +96,7 @@ class PBI(UUIDMixin, TimestampMixin, Base):
         "PBI",
         foreign_keys=[blocked_by_id],
         back_populates="blocked_by",
+        passive_deletes=True,
     )
 
     def get_pr_url(self, github_repo_url: str) -> str | None:
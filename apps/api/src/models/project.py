@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Enum, String, Text
+from sqlalchemy import Enum, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models.base import Base, TimestampMixin, UUIDMixin
 from src.models.enums import ProjectStatus, ProjectType
@@ -33,11 +33,15 @@ class Project(UUIDMixin, TimestampMixin, Base):
         status: Current status in the project lifecycle
         github_repo_url: URL to the GitHub repository (once created)
         github_repo_name: Name of the GitHub repository
-        features: List of features belonging to this project
+        features: List of features belonging to this project, in order
         logs: Agent activity logs for this project
     """
 
     __tablename__ = "projects"
+    __table_args__ = (
+        # Serves ORDER BY created_at DESC, id DESC keyset pages
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     epic: Mapped[str] = mapped_column(Text, nullable=False)
@@ -58,12 +62,15 @@ class Project(UUIDMixin, TimestampMixin, Base):
     features: Mapped[list["Feature"]] = relationship(
         "Feature",
         back_populates="project",
+        order_by="(Feature.order, Feature.created_at, Feature.id)",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     logs: Mapped[list["AgentLog"]] = relationship(
         "AgentLog",
         back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def get_pr_url(self, pr_number: int) -> str | None:
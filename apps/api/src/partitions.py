@@ -0,0 +1,249 @@
+"""
+Monthly partition maintenance for agent_logs.
+
+agent_logs is range-partitioned on created_at, one partition per
+calendar month, named agent_logs_yYYYYmMM. There is no default
+partition, so a month must exist before its rows arrive. Each
+maintenance pass:
+- creates the partitions for the current month and the next
+  months_ahead months
+- detaches, and unless detach_only drops, the partitions of months that
+  ended more than retention_months months ago. Removing a month this way
+  is a catalog operation instead of a DELETE.
+
+The API runs a pass at startup and then periodically (see src/main.py).
+When several workers run it at once, only the one holding the advisory
+lock does the work. A pass can also be run by hand, e.g. from cron:
+
+    python -m src.partitions
+"""
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timezone
+from typing import NamedTuple
+
+from sqlalchemy import Connection, Engine, text
+from src.config import get_settings
+from src.database import engine as default_engine
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLE = "agent_logs"
+
+_PARTITION_NAME = re.compile(rf"^{PARTITIONED_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+# Key for pg_try_advisory_xact_lock, shared by every worker
+_ADVISORY_LOCK_KEY = 0x6167656E746C6F67
+
+_LIST_PARTITIONS_SQL = text(
+    "SELECT child.relname FROM pg_inherits "
+    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+    "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+)
+
+
+class PartitionChanges(NamedTuple):
+    """Partitions created and removed by one maintenance pass."""
+
+    created: list[str]
+    removed: list[str]
+
+
+def add_months(month: date, months: int) -> date:
+    """
+    First day of the month a number of months away.
+
+    Args:
+        month: Any day of the starting month
+        months: Months to move forward (negative to move back)
+
+    Returns:
+        First day of the resulting month
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """
+    Name of the partition holding a month.
+
+    Args:
+        month: Any day of the month
+
+    Returns:
+        Table name, e.g. agent_logs_y2026m10
+    """
+    return f"{PARTITIONED_TABLE}_y{month.year}m{month.month:02d}"
+
+
+def partition_month(name: str) -> date | None:
+    """
+    Month held by a partition, parsed from its name.
+
+    Also used by Alembic to leave partitions out of autogenerate.
+
+    Args:
+        name: Table name
+
+    Returns:
+        First day of the month, or None if name is not a partition
+    """
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return date(int(match[1]), int(match[2]), 1)
+
+
+def maintain_partitions(
+    connection: Connection,
+    months_ahead: int,
+    retention_months: int = 0,
+    detach_only: bool = False,
+    today: date | None = None,
+) -> PartitionChanges:
+    """
+    Create upcoming partitions and remove expired ones.
+
+    Runs in the connection's current transaction; the caller commits.
+
+    Args:
+        connection: Connection inside a transaction
+        months_ahead: Months after the current one to create partitions for
+        retention_months: Full months to keep before the current one;
+            0 keeps every partition
+        detach_only: Detach expired partitions but keep them as plain
+            tables (e.g. for archiving) instead of dropping them
+        today: Reference date, the current UTC date by default
+
+    Returns:
+        Names of the partitions created and removed. Both are empty if
+        another worker is running a pass at the same time.
+    """
+    locked = connection.scalar(
+        text("SELECT pg_try_advisory_xact_lock(:key)"),
+        {"key": _ADVISORY_LOCK_KEY},
+    )
+    if not locked:
+        return PartitionChanges([], [])
+    # Attaching and detaching lock agent_logs; give up rather than stall
+    # inserts behind a long-running query.
+    connection.execute(text("SET LOCAL lock_timeout = '5s'"))
+
+    names = connection.scalars(_LIST_PARTITIONS_SQL, {"table": PARTITIONED_TABLE})
+    existing = {
+        month: name
+        for name in names
+        if (month := partition_month(name)) is not None
+    }
+    this_month = (today or datetime.now(timezone.utc).date()).replace(day=1)
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(this_month, offset)
+        if month in existing:
+            continue
+        name = partition_name(month)
+        connection.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF {PARTITIONED_TABLE} "
+                f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+            )
+        )
+        created.append(name)
+
+    removed = []
+    if retention_months > 0:
+        cutoff = add_months(this_month, -retention_months)
+        for month, name in sorted(existing.items()):
+            if month >= cutoff:
+                break
+            connection.execute(
+                text(f"ALTER TABLE {PARTITIONED_TABLE} DETACH PARTITION {name}")
+            )
+            if not detach_only:
+                connection.execute(text(f"DROP TABLE {name}"))
+            removed.append(name)
+
+    return PartitionChanges(created, removed)
+
+
+def run_maintenance(
+    engine: Engine,
+    months_ahead: int,
+    retention_months: int = 0,
+    detach_only: bool = False,
+) -> PartitionChanges:
+    """
+    Run one maintenance pass in a transaction of its own.
+
+    Args:
+        engine: Sync engine
+        months_ahead: See maintain_partitions
+        retention_months: See maintain_partitions
+        detach_only: See maintain_partitions
+
+    Returns:
+        Names of the partitions created and removed
+    """
+    with engine.begin() as connection:
+        changes = maintain_partitions(
+            connection, months_ahead, retention_months, detach_only
+        )
+    if changes.created or changes.removed:
+        logger.info(
+            "Partitions of %s created: %s, removed: %s",
+            PARTITIONED_TABLE,
+            changes.created,
+            changes.removed,
+        )
+    return changes
+
+
+async def run_maintenance_periodically(
+    engine: Engine,
+    interval: float,
+    months_ahead: int,
+    retention_months: int = 0,
+    detach_only: bool = False,
+) -> None:
+    """
+    Run a maintenance pass now and then every interval seconds, forever.
+
+    Failures are logged and retried on the next pass.
+
+    Args:
+        engine: Sync engine
+        interval: Seconds between passes
+        months_ahead: See maintain_partitions
+        retention_months: See maintain_partitions
+        detach_only: See maintain_partitions
+    """
+    while True:
+        try:
+            await run_in_threadpool(
+                run_maintenance,
+                engine,
+                months_ahead,
+                retention_months,
+                detach_only,
+            )
+        except Exception:
+            logger.exception(
+                "Partition maintenance of %s failed", PARTITIONED_TABLE
+            )
+        await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    settings = get_settings()
+    run_maintenance(
+        default_engine,
+        settings.log_partition_months_ahead,
+        settings.log_partition_retention_months,
+        settings.log_partition_detach_only,
+    )
@@ -0,0 +1,167 @@
+"""
+Shared Postgres LISTEN connection.
+
+Each API worker keeps one dedicated asyncpg connection for LISTEN and
+dispatches notifications to in-process callbacks, so the number of
+database connections does not grow with the number of live viewers.
+
+Notifications sent while the connection is down are lost. After every
+(re)connect the connect callbacks run, so consumers can catch up from
+the database.
+
+Usage:
+    listener = PgListener(dsn)
+    listener.listen("agent_logs", on_agent_logs)
+    listener.on_connect(on_reconnected)
+    listener.start()
+    ...
+    await listener.stop()
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+
+import asyncpg
+from sqlalchemy import make_url
+
+logger = logging.getLogger(__name__)
+
+NotificationCallback = Callable[[str], None]
+
+
+def listener_dsn(database_url: str) -> str:
+    """
+    Turn a SQLAlchemy database URL into a DSN asyncpg.connect accepts.
+
+    Args:
+        database_url: URL as configured, e.g. postgresql+psycopg2://...
+
+    Returns:
+        The same URL with the driver suffix removed
+    """
+    url = make_url(database_url).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+class PgListener:
+    """
+    One LISTEN connection serving every channel, reconnecting on failure.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        health_check_interval: float = 30.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        """
+        Create a stopped listener.
+
+        Args:
+            dsn: Postgres connection string for asyncpg
+            health_check_interval: Seconds between liveness checks
+            max_reconnect_delay: Upper bound for the reconnect backoff
+        """
+        self._dsn = dsn
+        self._health_check_interval = health_check_interval
+        self._max_reconnect_delay = max_reconnect_delay
+        self._channels: dict[str, list[NotificationCallback]] = defaultdict(list)
+        self._connect_callbacks: list[Callable[[], None]] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def listen(self, channel: str, callback: NotificationCallback) -> None:
+        """
+        Register a callback for a channel. Must be called before start().
+
+        Callbacks run on the event loop and must not block.
+
+        Args:
+            channel: NOTIFY channel name
+            callback: Called with each notification payload
+        """
+        self._channels[channel].append(callback)
+
+    def on_connect(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback run after every successful (re)connect.
+
+        Args:
+            callback: Called with no arguments
+        """
+        self._connect_callbacks.append(callback)
+
+    def start(self) -> None:
+        """Start the connection task on the running event loop."""
+        self._task = asyncio.create_task(self._run(), name="pg-listener")
+
+    async def stop(self) -> None:
+        """Close the connection and stop reconnecting."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    # =========================================================================
+    # Connection
+    # =========================================================================
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                connection = await asyncpg.connect(self._dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(
+                    "LISTEN connection failed (%s), retrying in %.0fs", e, delay
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+                continue
+
+            delay = 1.0
+            try:
+                await self._serve(connection)
+            except (
+                OSError,
+                TimeoutError,
+                asyncpg.PostgresError,
+                asyncpg.InterfaceError,
+            ) as e:
+                logger.warning("LISTEN connection lost (%s), reconnecting", e)
+            finally:
+                connection.terminate()
+
+    async def _serve(self, connection: asyncpg.Connection) -> None:
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        for channel in self._channels:
+            await connection.add_listener(channel, self._dispatch)
+
+        for callback in self._connect_callbacks:
+            callback()
+
+        # Termination is reported when the socket closes; the periodic
+        # query also catches connections that silently went away.
+        while not lost.is_set():
+            try:
+                await asyncio.wait_for(lost.wait(), self._health_check_interval)
+            except TimeoutError:
+                await asyncio.wait_for(
+                    connection.execute("SELECT 1"), self._health_check_interval
+                )
+        raise asyncpg.InterfaceError("connection closed")
+
+    def _dispatch(
+        self, _connection: object, _pid: int, channel: str, payload: str
+    ) -> None:
+        for callback in self._channels[channel]:
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception("Notification callback failed on %s", channel)
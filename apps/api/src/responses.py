@@ -0,0 +1,151 @@
+"""
+Response helpers: the JSON fast path and conditional GETs.
+
+Routers that assemble response schemas by hand (feature counts, PBI
+counts) validate every row once when building the schema, and FastAPI
+then checks the result against response_model again before serializing
+it. With fast_json_responses enabled, those routes skip both: the
+schema's fields are read straight off the rows and the result is dumped
+with orjson. The rows come from the database, so there is nothing left
+to validate; response_model still documents the shape in OpenAPI.
+
+orjson writes UUIDs, str enums and naive datetimes exactly as Pydantic
+does, so both paths return the same body.
+
+Polled routes also answer conditional GETs with a weak ETag, and a
+request whose If-None-Match carries it gets an empty 304 Not Modified.
+A single project or feature derives it from the resource as read (from
+the entity cache, when enabled). A list page derives it from the
+updated_at and the counts shown of each item on it, and from whether
+another page follows: read off the page itself, or, for a request
+carrying If-None-Match, from a narrower version query run first, so a
+matching one is answered without reading the page.
+"""
+
+import hashlib
+from collections.abc import Callable
+from typing import Any, TypeVar
+from uuid import UUID
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from src.config import get_settings
+
+T = TypeVar("T")
+
+
+def _default(value: Any) -> Any:
+    # asyncpg returns its own uuid.UUID subclass, which orjson only
+    # serializes natively when exact.
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
+
+
+def row_fields(schema: type[BaseModel], row: Any, **values: Any) -> dict[str, Any]:
+    """
+    Read the fields of a response schema off an ORM row.
+
+    Args:
+        schema: Response schema whose fields to read
+        row: ORM instance holding the fields
+        **values: Fields not on the row (or overridden), e.g. counts
+
+    Returns:
+        Field values by name, unvalidated
+    """
+    fields = {
+        name: getattr(row, name)
+        for name in schema.model_fields
+        if name not in values
+    }
+    fields.update(values)
+    return fields
+
+
+def respond(
+    validate: Callable[[Any], T],
+    content: Any,
+    status_code: int = status.HTTP_200_OK,
+    response: Response | None = None,
+) -> T | Response:
+    """
+    Build the response of a route from plain content.
+
+    Args:
+        validate: Turns content into the response schema, e.g.
+            FeatureResponse.model_validate
+        content: Response content, as built by row_fields
+        status_code: Status of the fast path response; routes set the
+            default path's status with status_code as usual
+        response: The route's Response parameter, whose headers are
+            copied to the fast path response
+
+    Returns:
+        The validated schema, or the content dumped by orjson when
+        fast_json_responses is enabled
+    """
+    if get_settings().fast_json_responses:
+        headers = None if response is None else dict(response.headers)
+        return ORJSONResponse(content, status_code=status_code, headers=headers)
+    return validate(content)
+
+
+def weak_etag(*version: Any) -> str:
+    """
+    Build a weak ETag from the values identifying a response version.
+
+    Args:
+        *version: Resource key and version fingerprint
+
+    Returns:
+        The ETag, e.g. W/"3f2a..."
+    """
+    digest = hashlib.blake2b(repr(version).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's copy is current.
+
+    If-None-Match is compared weakly, as conditional GETs require.
+
+    Args:
+        request: The incoming request
+        etag: Current ETag of the requested resource
+
+    Returns:
+        True if If-None-Match is * or lists etag
+    """
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in header.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Build an empty 304 Not Modified response.
+
+    Args:
+        etag: Current ETag of the requested resource
+
+    Returns:
+        The response
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -7,6 +7,7 @@ and imported here for easy registration with the app.
 """
 
 from src.routers.features import router as features_router
+from src.routers.logs import router as logs_router
 from src.routers.projects import router as projects_router
 
-__all__: list[str] = ["features_router", "projects_router"]
+__all__: list[str] = ["features_router", "logs_router", "projects_router"]
@@ -6,47 +6,81 @@ Handles all CRUD operations for Feature resources.
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from src.database import get_db
+from fastapi import (APIRouter, Depends, HTTPException, Query, Request,
+                     Response, status)
+from pydantic import TypeAdapter
+from src.dependencies import get_feature_service
+from src.responses import (etag_matches, not_modified, respond, row_fields,
+                           weak_etag)
 from src.schemas.feature import (FeatureBulkCreate, FeatureCreate,
                                  FeatureListResponse, FeatureResponse,
                                  FeatureUpdate)
-from src.services.feature_service import FeatureService
+from src.schemas.pagination import Page
+from src.services.feature_service import AsyncFeatureService
 
 router = APIRouter(prefix="/features", tags=["features"])
 
+_FEATURE_LIST = TypeAdapter(list[FeatureResponse])
+
 
 # =============================================================================
 # Endpoints
 # =============================================================================
 
 
-@router.get("/project/{project_id}", response_model=list[FeatureListResponse])
-def list_features_by_project(
+@router.get("/project/{project_id}", response_model=Page[FeatureListResponse])
+async def list_features_by_project(
     project_id: UUID,
-    db: Session = Depends(get_db),
-) -> list[FeatureListResponse]:
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    after: str | None = Query(None, description="Cursor from the previous page"),
+    service: AsyncFeatureService = Depends(get_feature_service),
+) -> Page[FeatureListResponse] | Response:
     """
-    List all features for a project.
+    List features for a project, one page at a time.
 
     Returns features ordered by their order field, then by creation date.
-    Each feature includes a count of its PBIs.
+    Each feature includes a count of its PBIs. Pass next_cursor back as
+    `after` to get the following page.
+
+    Responds 304 Not Modified when If-None-Match carries the page's
+    current ETag.
     """
-    service = FeatureService(db)
-    features = service.list_by_project(project_id)
-
-    return [
-        FeatureListResponse(
-            id=feature.id,
-            name=feature.name,
-            status=feature.status,
-            branch_name=feature.branch_name,
-            order=feature.order,
-            pbi_count=len(feature.pbis),
+    try:
+        # Only a client holding an ETag pays for the version query
+        if "if-none-match" in request.headers:
+            versions, more = await service.list_by_project_version(
+                project_id, limit, after
+            )
+            etag = weak_etag(project_id, limit, after, versions, more)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+        rows, next_cursor = await service.list_by_project_with_pbi_counts(
+            project_id, limit, after
         )
-        for feature in features
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    # The same version, from the page just read
+    versions = tuple(
+        (feature.id, feature.updated_at, pbi_count) for feature, pbi_count in rows
+    )
+    response.headers["ETag"] = weak_etag(
+        project_id, limit, after, versions, next_cursor is not None
+    )
+    items = [
+        row_fields(FeatureListResponse, feature, pbi_count=pbi_count)
+        for feature, pbi_count in rows
     ]
+    return respond(
+        Page[FeatureListResponse].model_validate,
+        {"items": items, "next_cursor": next_cursor},
+        response=response,
+    )
 
 
 @router.post(
@@ -54,10 +88,10 @@ def list_features_by_project(
     response_model=FeatureResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_feature(
+async def create_feature(
     data: FeatureCreate,
-    db: Session = Depends(get_db),
-) -> FeatureResponse:
+    service: AsyncFeatureService = Depends(get_feature_service),
+) -> FeatureResponse | Response:
     """
     Create a new feature.
 
@@ -65,27 +99,18 @@ def create_feature(
     If order is not provided, it will be set to the next available order
     for the project.
     """
-    service = FeatureService(db)
-
     try:
-        feature = service.create(data)
+        feature = await service.create(data)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
 
-    return FeatureResponse(
-        id=feature.id,
-        name=feature.name,
-        description=feature.description,
-        project_id=feature.project_id,
-        status=feature.status,
-        branch_name=feature.branch_name,
-        order=feature.order,
-        created_at=feature.created_at,
-        updated_at=feature.updated_at,
-        pbi_count=len(feature.pbis) if feature.pbis else 0,
+    return respond(
+        FeatureResponse.model_validate,
+        row_fields(FeatureResponse, feature, pbi_count=0),
+        status.HTTP_201_CREATED,
     )
 
 
@@ -94,10 +119,10 @@ def create_feature(
     response_model=list[FeatureResponse],
     status_code=status.HTTP_201_CREATED,
 )
-def create_features_bulk(
+async def create_features_bulk(
     data: FeatureBulkCreate,
-    db: Session = Depends(get_db),
-) -> list[FeatureResponse]:
+    service: AsyncFeatureService = Depends(get_feature_service),
+) -> list[FeatureResponse] | Response:
     """
     Create multiple features at once.
 
@@ -105,8 +130,6 @@ def create_features_bulk(
     all features for a project in a single request.
     Features will be assigned sequential order values.
     """
-    service = FeatureService(db)
-
     # Convert bulk items to FeatureCreate objects
     feature_creates = [
         FeatureCreate(
@@ -119,118 +142,90 @@ def create_features_bulk(
     ]
 
     try:
-        features = service.create_many(data.project_id, feature_creates)
+        features = await service.create_many(data.project_id, feature_creates)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
 
-    return [
-        FeatureResponse(
-            id=feature.id,
-            name=feature.name,
-            description=feature.description,
-            project_id=feature.project_id,
-            status=feature.status,
-            branch_name=feature.branch_name,
-            order=feature.order,
-            created_at=feature.created_at,
-            updated_at=feature.updated_at,
-            pbi_count=0,
-        )
-        for feature in features
-    ]
+    return respond(
+        _FEATURE_LIST.validate_python,
+        [row_fields(FeatureResponse, feature, pbi_count=0) for feature in features],
+        status.HTTP_201_CREATED,
+    )
 
 
 @router.get("/{feature_id}", response_model=FeatureResponse)
-def get_feature(
+async def get_feature(
     feature_id: UUID,
-    db: Session = Depends(get_db),
-) -> FeatureResponse:
+    request: Request,
+    response: Response,
+    service: AsyncFeatureService = Depends(get_feature_service),
+) -> FeatureResponse | Response:
     """
     Get a feature by ID.
 
-    Returns the full feature details including PBI count.
+    Returns the full feature details including PBI count. Responds 304
+    Not Modified when If-None-Match carries the feature's current ETag.
     """
-    service = FeatureService(db)
-    feature = service.get_by_id(feature_id)
+    row = await service.get_with_pbi_count(feature_id)
 
-    if feature is None:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Feature not found",
         )
 
-    return FeatureResponse(
-        id=feature.id,
-        name=feature.name,
-        description=feature.description,
-        project_id=feature.project_id,
-        status=feature.status,
-        branch_name=feature.branch_name,
-        order=feature.order,
-        created_at=feature.created_at,
-        updated_at=feature.updated_at,
-        pbi_count=len(feature.pbis) if feature.pbis else 0,
+    feature, pbi_count = row
+    etag = weak_etag(feature_id, feature.updated_at, pbi_count)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return respond(
+        FeatureResponse.model_validate,
+        row_fields(FeatureResponse, feature, pbi_count=pbi_count),
+        response=response,
     )
 
 
 @router.patch("/{feature_id}", response_model=FeatureResponse)
-def update_feature(
+async def update_feature(
     feature_id: UUID,
     data: FeatureUpdate,
-    db: Session = Depends(get_db),
-) -> FeatureResponse:
+    service: AsyncFeatureService = Depends(get_feature_service),
+) -> FeatureResponse | Response:
     """
     Update a feature.
 
     Only provided fields will be updated.
     """
-    service = FeatureService(db)
-    feature = service.update(feature_id, data)
-
-    if feature is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Feature not found",
-        )
-
-    # Re-fetch to get pbis loaded
-    feature = service.get_by_id(feature_id)
+    row = await service.update_with_pbi_count(feature_id, data)
 
-    if feature is None:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Feature not found",
         )
 
-    return FeatureResponse(
-        id=feature.id,
-        name=feature.name,
-        description=feature.description,
-        project_id=feature.project_id,
-        status=feature.status,
-        branch_name=feature.branch_name,
-        order=feature.order,
-        created_at=feature.created_at,
-        updated_at=feature.updated_at,
-        pbi_count=len(feature.pbis) if feature.pbis else 0,
+    feature, pbi_count = row
+    return respond(
+        FeatureResponse.model_validate,
+        row_fields(FeatureResponse, feature, pbi_count=pbi_count),
     )
 
 
 @router.delete("/{feature_id}")
-def delete_feature(
+async def delete_feature(
     feature_id: UUID,
-    db: Session = Depends(get_db),
+    service: AsyncFeatureService = Depends(get_feature_service),
 ) -> dict[str, str]:
     """
     Delete a feature.
 
     This will also delete all associated PBIs due to cascade delete.
     """
-    service = FeatureService(db)
-    deleted = service.delete(feature_id)
+    deleted = await service.delete(feature_id)
 
     if not deleted:
         raise HTTPException(
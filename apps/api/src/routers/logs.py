@@ -0,0 +1,164 @@
+"""
+Agent logs API router.
+
+Handles ingestion and search of AgentLog entries written by AI agents.
+"""
+
+import json
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import (APIRouter, Depends, HTTPException, Query, Response,
+                     status)
+from src import log_compression
+from src.dependencies import get_agent_log_service, get_agent_log_sink
+from src.log_sink import AgentLogSink
+from src.models.enums import AgentMessageType
+from src.schemas.agent_log import (AgentLogBatchCreate, AgentLogBatchResponse,
+                                   AgentLogCompressionStats, AgentLogCreate,
+                                   AgentLogFilter, AgentLogPreviewResponse,
+                                   AgentLogResponse, AgentLogSinkStats)
+from src.schemas.pagination import Page
+from src.services.agent_log_service import AsyncAgentLogService
+
+router = APIRouter(prefix="/logs", tags=["logs"])
+
+
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+
+@router.get(
+    "/",
+    response_model=Page[AgentLogResponse] | Page[AgentLogPreviewResponse],
+)
+async def search_logs(
+    project_id: UUID | None = None,
+    pbi_id: UUID | None = None,
+    agent_name: str | None = None,
+    message_type: AgentMessageType | None = None,
+    since: datetime | None = Query(None, description="created_at >= since"),
+    until: datetime | None = Query(None, description="created_at < until"),
+    contains: str | None = Query(
+        None,
+        description='JSON object extra_data must contain, e.g. {"tool": "git"}',
+    ),
+    limit: int = Query(50, ge=1, le=200),
+    after: str | None = Query(None, description="Cursor from the previous page"),
+    preview: bool = Query(
+        False, description="Return content_preview instead of the full content"
+    ),
+    service: AsyncAgentLogService = Depends(get_agent_log_service),
+) -> Page[AgentLogResponse] | Page[AgentLogPreviewResponse]:
+    """
+    Search agent logs, one page at a time.
+
+    Returns the logs matching every given filter, newest first. Pass
+    next_cursor back as `after` to get the following page. Narrowing by
+    project and time range keeps the search to the relevant partitions.
+    With `preview`, each log carries only the start of its content, and
+    compressed contents are neither loaded nor decompressed.
+    """
+    try:
+        extra_data = None if contains is None else json.loads(contains)
+    except json.JSONDecodeError:
+        extra_data = None
+    if contains is not None and not isinstance(extra_data, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="contains must be a JSON object",
+        )
+
+    filters = AgentLogFilter(
+        project_id=project_id,
+        pbi_id=pbi_id,
+        agent_name=agent_name,
+        message_type=message_type,
+        since=since,
+        until=until,
+        contains=extra_data,
+    )
+    try:
+        logs, next_cursor = await service.search(filters, limit, after, preview)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    if preview:
+        return Page[AgentLogPreviewResponse](
+            items=[AgentLogPreviewResponse.model_validate(log) for log in logs],
+            next_cursor=next_cursor,
+        )
+    return Page[AgentLogResponse](
+        items=[AgentLogResponse.model_validate(log) for log in logs],
+        next_cursor=next_cursor,
+    )
+
+
+@router.post("/", status_code=status.HTTP_202_ACCEPTED)
+async def create_log(
+    data: AgentLogCreate,
+    sink: AgentLogSink = Depends(get_agent_log_sink),
+) -> Response:
+    """
+    Queue a single agent log entry.
+
+    Entries are written in bulk shortly after being accepted. If the
+    buffer stays full the entry is dropped and 503 is returned; callers
+    may retry later.
+    """
+    if not await sink.put(data):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Log buffer is full",
+            headers={"Retry-After": "1"},
+        )
+
+    return Response(status_code=status.HTTP_202_ACCEPTED)
+
+
+@router.get("/sink", response_model=AgentLogSinkStats)
+async def get_log_sink_stats(
+    sink: AgentLogSink = Depends(get_agent_log_sink),
+) -> AgentLogSinkStats:
+    """
+    Get the counters of the agent log write-behind buffer.
+    """
+    return sink.stats()
+
+
+@router.get("/compression", response_model=AgentLogCompressionStats)
+async def get_log_compression_stats() -> AgentLogCompressionStats:
+    """
+    Get the compression counters of this worker's agent log writes.
+    """
+    return log_compression.stats()
+
+
+@router.post(
+    "/batch",
+    response_model=AgentLogBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_logs_batch(
+    data: AgentLogBatchCreate,
+    service: AsyncAgentLogService = Depends(get_agent_log_service),
+) -> AgentLogBatchResponse:
+    """
+    Write a batch of agent log entries.
+
+    The whole batch is written with a single COPY; it is rejected as a
+    whole if any entry references a project or PBI that does not exist.
+    """
+    try:
+        inserted = await service.create_many(data.logs)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+
+    return AgentLogBatchResponse(inserted=inserted)
@@ -1,44 +1,83 @@
 """
 Projects API router.
 
-Handles all CRUD operations for Project resources.
+Handles all CRUD operations for Project resources, the nested project
+tree, incremental reads, the live stream and the bulk export of a
+project's agent logs, and the summaries of its expired logs.
 """
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from src.database import get_db
+from fastapi import (APIRouter, Depends, Header, HTTPException, Query,
+                     Request, Response, status)
+from fastapi.responses import StreamingResponse
+from src.dependencies import (agent_log_service_scope, get_agent_log_hub,
+                              get_agent_log_service, get_project_service,
+                              service_scope)
+from src.log_export import ExportFormat, export_project_logs
+from src.log_stream import AgentLogHub
+from src.responses import (etag_matches, not_modified, respond, row_fields,
+                           weak_etag)
+from src.schemas.agent_log import AgentLogResponse, AgentLogSummaryResponse
+from src.schemas.pagination import Page
 from src.schemas.project import (ProjectCreate, ProjectListResponse,
-                                 ProjectResponse, ProjectUpdate)
-from src.services.project_service import ProjectService
+                                 ProjectResponse, ProjectTreeResponse,
+                                 ProjectUpdate)
+from src.services.agent_log_service import AsyncAgentLogService
+from src.services.project_service import AsyncProjectService, ProjectService
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-@router.get("/", response_model=list[ProjectListResponse])
-def list_projects(db: Session = Depends(get_db)) -> list[ProjectListResponse]:
+@router.get("/", response_model=Page[ProjectListResponse])
+async def list_projects(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    after: str | None = Query(None, description="Cursor from the previous page"),
+    service: AsyncProjectService = Depends(get_project_service),
+) -> Page[ProjectListResponse] | Response:
     """
-    List all projects.
+    List projects, one page at a time.
 
-    Returns a list of all projects with summary information,
-    ordered by creation date (newest first).
-    """
-    service = ProjectService(db)
-    projects = service.list_all()
+    Returns projects with summary information, ordered by creation
+    date (newest first). Pass next_cursor back as `after` to get the
+    following page.
 
-    # Compute feature_count for each project
-    return [
-        ProjectListResponse(
-            id=project.id,
-            name=project.name,
-            type=project.type,
-            status=project.status,
-            created_at=project.created_at,
-            feature_count=len(project.features),
+    Responds 304 Not Modified when If-None-Match carries the page's
+    current ETag.
+    """
+    try:
+        # Only a client holding an ETag pays for the version query
+        if "if-none-match" in request.headers:
+            versions, more = await service.list_version(limit, after)
+            etag = weak_etag(limit, after, versions, more)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+        rows, next_cursor = await service.list_with_feature_counts(limit, after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
-        for project in projects
+
+    # The same version, from the page just read
+    versions = tuple(
+        (project.id, project.updated_at, feature_count)
+        for project, feature_count in rows
+    )
+    response.headers["ETag"] = weak_etag(
+        limit, after, versions, next_cursor is not None
+    )
+    items = [
+        row_fields(ProjectListResponse, project, feature_count=feature_count)
+        for project, feature_count in rows
     ]
+    return respond(
+        Page[ProjectListResponse].model_validate,
+        {"items": items, "next_cursor": next_cursor},
+        response=response,
+    )
 
 
 @router.post(
@@ -46,9 +85,9 @@ def list_projects(db: Session = Depends(get_db)) -> list[ProjectListResponse]:
     response_model=ProjectResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_project(
+async def create_project(
     data: ProjectCreate,
-    db: Session = Depends(get_db),
+    service: AsyncProjectService = Depends(get_project_service),
 ) -> ProjectResponse:
     """
     Create a new project.
@@ -56,22 +95,50 @@ def create_project(
     Creates a project with DRAFT status. The epic field should contain
     the project requirements in markdown format.
     """
-    service = ProjectService(db)
-    return service.create(data)
+    return await service.create(data)
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-def get_project(
+async def get_project(
     project_id: UUID,
-    db: Session = Depends(get_db),
-) -> ProjectResponse:
+    request: Request,
+    response: Response,
+    service: AsyncProjectService = Depends(get_project_service),
+) -> ProjectResponse | Response:
     """
     Get a project by ID.
 
     Returns the full project details including GitHub repository info.
+    Responds 304 Not Modified when If-None-Match carries the project's
+    current ETag.
+    """
+    project = await service.get_by_id(project_id)
+
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    etag = weak_etag(project_id, project.updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return project
+
+
+@router.get("/{project_id}/tree", response_model=ProjectTreeResponse)
+async def get_project_tree(
+    project_id: UUID,
+    service: AsyncProjectService = Depends(get_project_service),
+) -> ProjectTreeResponse:
+    """
+    Get a project with all its features and their PBIs.
+
+    Features and PBIs are nested in display order. Replaces fetching the
+    project, its features and every feature's PBIs one call at a time.
     """
-    service = ProjectService(db)
-    project = service.get_by_id(project_id)
+    project = await service.get_tree(project_id)
 
     if project is None:
         raise HTTPException(
@@ -83,10 +150,10 @@ def get_project(
 
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
-def update_project(
+async def update_project(
     project_id: UUID,
     data: ProjectUpdate,
-    db: Session = Depends(get_db),
+    service: AsyncProjectService = Depends(get_project_service),
 ) -> ProjectResponse:
     """
     Update a project.
@@ -94,8 +161,7 @@ def update_project(
     Only provided fields will be updated. Use this to change
     project name, epic, or status.
     """
-    service = ProjectService(db)
-    project = service.update(project_id, data)
+    project = await service.update(project_id, data)
 
     if project is None:
         raise HTTPException(
@@ -107,9 +173,9 @@ def update_project(
 
 
 @router.delete("/{project_id}")
-def delete_project(
+async def delete_project(
     project_id: UUID,
-    db: Session = Depends(get_db),
+    service: AsyncProjectService = Depends(get_project_service),
 ) -> dict[str, str]:
     """
     Delete a project.
@@ -117,8 +183,7 @@ def delete_project(
     This will also delete all associated features, PBIs, and logs
     due to cascade delete.
     """
-    service = ProjectService(db)
-    deleted = service.delete(project_id)
+    deleted = await service.delete(project_id)
 
     if not deleted:
         raise HTTPException(
@@ -127,3 +192,153 @@ def delete_project(
         )
 
     return {"message": "Project deleted"}
+
+
+@router.get("/{project_id}/logs", response_model=Page[AgentLogResponse])
+async def tail_project_logs(
+    project_id: UUID,
+    after: str | None = Query(None, description="Cursor of the last log already seen"),
+    limit: int = Query(100, ge=1, le=200),
+    wait: float = Query(
+        0, ge=0, le=60, description="Seconds to wait for new logs if there are none"
+    ),
+    hub: AgentLogHub = Depends(get_agent_log_hub),
+) -> Page[AgentLogResponse]:
+    """
+    Read a project's agent logs incrementally, oldest first.
+
+    Returns the logs after the `after` cursor (from the first log without
+    one). With `wait`, a request finding no new logs is held open until
+    one is written or `wait` seconds pass, so clients can long-poll
+    instead of polling in a tight loop. next_cursor is where the next
+    read continues; pass it back as `after` even when no logs were
+    returned.
+    """
+    # Own short sessions: a held request must not keep one open
+    async with service_scope(ProjectService, AsyncProjectService) as service:
+        project = await service.get_by_id(project_id)
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    try:
+        logs, next_cursor = await hub.poll(project_id, after, limit, wait)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return Page[AgentLogResponse](
+        items=[AgentLogResponse.model_validate(log) for log in logs],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/{project_id}/logs/stream")
+async def stream_project_logs(
+    project_id: UUID,
+    after: str | None = Query(None, description="Cursor of the last log already seen"),
+    last_event_id: str | None = Header(None),
+    hub: AgentLogHub = Depends(get_agent_log_hub),
+) -> StreamingResponse:
+    """
+    Stream a project's agent logs live as Server-Sent Events.
+
+    Each `log` event carries an AgentLogResponse; its event id is a
+    cursor. Reconnecting browsers send it back as Last-Event-ID (or
+    `after` on a fresh EventSource) and receive every log written since.
+    Without a cursor the stream starts with new logs.
+    """
+    # Own short session: the stream must not keep one open
+    async with service_scope(ProjectService, AsyncProjectService) as service:
+        project = await service.get_by_id(project_id)
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    try:
+        events = hub.stream(project_id, last_event_id or after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{project_id}/logs/export")
+async def export_project_log_history(
+    project_id: UUID,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    gzip: bool = Query(False, description="Compress the export with gzip"),
+    service: AsyncProjectService = Depends(get_project_service),
+) -> StreamingResponse:
+    """
+    Download all of a project's agent logs, oldest first.
+
+    `format=ndjson` returns one AgentLogResponse per line, `format=arrow`
+    an Arrow IPC stream (extra_data as a JSON string). The logs are read
+    and sent in chunks, so exports of any size use constant memory. With
+    `gzip`, the body is sent with Content-Encoding: gzip.
+    """
+    project = await service.get_by_id(project_id)
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    headers = {
+        "Content-Disposition": (
+            f'attachment; filename="{project_id}-logs.{export_format.extension}"'
+        ),
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    # The export outlives the request's dependencies, so it reads the
+    # logs in its own session.
+    return StreamingResponse(
+        export_project_logs(
+            agent_log_service_scope, project_id, export_format, gzip
+        ),
+        media_type=export_format.media_type,
+        headers=headers,
+    )
+
+
+@router.get(
+    "/{project_id}/logs/summaries",
+    response_model=list[AgentLogSummaryResponse],
+)
+async def list_project_log_summaries(
+    project_id: UUID,
+    service: AsyncProjectService = Depends(get_project_service),
+    log_service: AsyncAgentLogService = Depends(get_agent_log_service),
+) -> list[AgentLogSummaryResponse]:
+    """
+    Get the rolled-up agent logs of a finished project.
+
+    Logs removed by the retention job are summarized per PBI and message
+    type: how many there were, when the first and last were written and,
+    for ERROR logs, the entries themselves.
+    """
+    project = await service.get_by_id(project_id)
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+
+    summaries = await log_service.list_summaries(project_id)
+    return [AgentLogSummaryResponse.model_validate(summary) for summary in summaries]
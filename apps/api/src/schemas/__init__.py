@@ -6,15 +6,35 @@ All request and response schemas should be defined in this package
 and imported here for easy access.
 """
 
+from src.schemas.agent_log import (AgentLogBatchCreate, AgentLogBatchResponse,
+                                   AgentLogCompressionStats, AgentLogCreate,
+                                   AgentLogFilter, AgentLogPreviewResponse,
+                                   AgentLogResponse, AgentLogSinkStats,
+                                   AgentLogSummaryResponse)
+from src.schemas.cache import EntityCacheStats
 from src.schemas.feature import (FeatureBase, FeatureBulkCreate,
                                  FeatureBulkCreateItem, FeatureCreate,
                                  FeatureListResponse, FeatureResponse,
-                                 FeatureUpdate)
+                                 FeatureTreeResponse, FeatureUpdate)
+from src.schemas.pagination import Page
+from src.schemas.pbi import PBIResponse
 from src.schemas.project import (ProjectBase, ProjectCreate,
                                  ProjectListResponse, ProjectResponse,
-                                 ProjectUpdate)
+                                 ProjectTreeResponse, ProjectUpdate)
 
 __all__: list[str] = [
+    # AgentLog schemas
+    "AgentLogBatchCreate",
+    "AgentLogBatchResponse",
+    "AgentLogCompressionStats",
+    "AgentLogCreate",
+    "AgentLogFilter",
+    "AgentLogPreviewResponse",
+    "AgentLogResponse",
+    "AgentLogSinkStats",
+    "AgentLogSummaryResponse",
+    # Cache schemas
+    "EntityCacheStats",
     # Feature schemas
     "FeatureBase",
     "FeatureBulkCreate",
@@ -22,11 +42,17 @@ __all__: list[str] = [
     "FeatureCreate",
     "FeatureListResponse",
     "FeatureResponse",
+    "FeatureTreeResponse",
     "FeatureUpdate",
+    # Pagination schemas
+    "Page",
+    # PBI schemas
+    "PBIResponse",
     # Project schemas
     "ProjectBase",
     "ProjectCreate",
     "ProjectListResponse",
     "ProjectResponse",
+    "ProjectTreeResponse",
     "ProjectUpdate",
 ]
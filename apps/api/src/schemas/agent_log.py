@@ -0,0 +1,169 @@
+"""
+Pydantic schemas for AgentLog resources.
+
+AgentLogs are the thoughts, actions and outputs recorded by AI agents
+while they work on a Project.
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from src.models.enums import AgentMessageType
+
+# Upper bound on entries accepted by a single batch request
+MAX_BATCH_SIZE = 10_000
+
+
+def _contains_nul(value: Any) -> bool:
+    if isinstance(value, str):
+        return "\x00" in value
+    if isinstance(value, dict):
+        return any(_contains_nul(k) or _contains_nul(v) for k, v in value.items())
+    if isinstance(value, list):
+        return any(_contains_nul(item) for item in value)
+    return False
+
+
+class AgentLogCreate(BaseModel):
+    """Schema for a single log entry written by an agent."""
+
+    project_id: UUID
+    pbi_id: UUID | None = None
+    agent_name: str = Field(..., min_length=1, max_length=100)
+    message_type: AgentMessageType
+    content: str = Field(..., min_length=1)
+    extra_data: dict[str, Any] | None = Field(default_factory=dict)
+
+    @field_validator("agent_name", "content", "extra_data")
+    @classmethod
+    def reject_nul(cls, value: Any) -> Any:
+        """Postgres text and jsonb cannot hold NUL characters; COPY would fail."""
+        if _contains_nul(value):
+            raise ValueError("must not contain NUL (\\u0000) characters")
+        return value
+
+
+class AgentLogResponse(BaseModel):
+    """
+    Full AgentLog response schema.
+
+    Includes all fields returned when reading or streaming logs.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    project_id: UUID
+    pbi_id: UUID | None
+    agent_name: str
+    message_type: AgentMessageType
+    content: str
+    extra_data: dict[str, Any] | None
+    created_at: datetime
+
+
+class AgentLogPreviewResponse(BaseModel):
+    """
+    AgentLog response schema for listings.
+
+    Carries only the start of the content, so compressed logs are
+    returned without being loaded in full or decompressed.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    project_id: UUID
+    pbi_id: UUID | None
+    agent_name: str
+    message_type: AgentMessageType
+    content_preview: str
+    extra_data: dict[str, Any] | None
+    created_at: datetime
+
+
+class AgentLogSummaryResponse(BaseModel):
+    """
+    Rolled-up agent logs of one PBI and message type.
+
+    Written by the retention job in place of the logs it deletes.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    pbi_id: UUID | None
+    message_type: AgentMessageType
+    log_count: int
+    first_at: datetime
+    last_at: datetime
+    errors: list[dict[str, Any]]
+
+
+class AgentLogFilter(BaseModel):
+    """
+    Filters for searching agent logs.
+
+    Every filter given must match; omitted filters match everything.
+    """
+
+    project_id: UUID | None = None
+    pbi_id: UUID | None = None
+    agent_name: str | None = None
+    message_type: AgentMessageType | None = None
+    since: datetime | None = Field(default=None, description="created_at >= since")
+    until: datetime | None = Field(default=None, description="created_at < until")
+    contains: dict[str, Any] | None = Field(
+        default=None,
+        description="JSON object extra_data must contain, e.g. {\"tool\": \"git\"}",
+    )
+
+    @field_validator("since", "until")
+    @classmethod
+    def to_naive_utc(cls, value: datetime | None) -> datetime | None:
+        """Timestamps are stored as naive UTC; convert aware input to match."""
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class AgentLogBatchCreate(BaseModel):
+    """
+    Request schema for batched log ingestion.
+
+    Agents buffer their output and send it in batches of hundreds to
+    thousands of entries.
+    """
+
+    logs: list[AgentLogCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class AgentLogBatchResponse(BaseModel):
+    """Response schema for batched log ingestion."""
+
+    inserted: int
+
+
+class AgentLogSinkStats(BaseModel):
+    """Counters for the agent log write-behind buffer."""
+
+    queued: int = Field(..., description="Entries currently waiting in the queue")
+    accepted: int = Field(..., description="Entries accepted since startup")
+    written: int = Field(..., description="Entries written to the database")
+    dropped: int = Field(..., description="Entries rejected because the queue was full")
+    failed: int = Field(..., description="Entries lost to failed writes")
+    flushes: int = Field(..., description="Bulk writes issued")
+
+
+class AgentLogCompressionStats(BaseModel):
+    """Counters for compressed agent log storage in this process."""
+
+    enabled: bool = Field(..., description="Whether new CODE logs are compressed")
+    threshold_bytes: int = Field(..., description="Size above which content is compressed")
+    compressed: int = Field(..., description="Contents compressed since startup")
+    original_bytes: int = Field(..., description="Size of the compressed contents before compression")
+    compressed_bytes: int = Field(..., description="Size of the compressed contents as stored")
+    ratio: float | None = Field(
+        ..., description="original_bytes / compressed_bytes, None before the first compression"
+    )
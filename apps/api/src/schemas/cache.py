@@ -0,0 +1,35 @@
+"""
+Pydantic schemas for the entity cache.
+
+Projects and features read by ID are cached by src/services/cache.py.
+"""
+
+from pydantic import BaseModel, Field
+
+
+class EntityCacheStats(BaseModel):
+    """Counters for the entity cache in this process."""
+
+    enabled: bool = Field(..., description="Whether entities are cached")
+    backend: str | None = Field(..., description="memory or redis, None when disabled")
+    hits: int = Field(..., description="Reads answered from the cache since startup")
+    misses: int = Field(..., description="Reads that went to the database")
+    stale: int = Field(
+        ..., description="Misses on entries found older than the version just read"
+    )
+    hit_ratio: float | None = Field(
+        ..., description="hits / (hits + misses), None before the first read"
+    )
+    invalidations: int = Field(..., description="Entries dropped after writes")
+    notifications: int = Field(
+        ..., description="Entries dropped on invalidations announced by any worker"
+    )
+    flushes: int = Field(
+        ..., description="Full flushes after the LISTEN connection (re)connected"
+    )
+    evictions: int | None = Field(
+        ..., description="Entries evicted to make room; None unless the backend is memory"
+    )
+    entries: int | None = Field(
+        ..., description="Entries currently cached; None unless the backend is memory"
+    )
@@ -10,6 +10,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 from src.models.enums import FeatureStatus
+from src.schemas.pbi import PBIResponse
 
 
 class FeatureBase(BaseModel):
@@ -59,6 +60,25 @@ class FeatureResponse(FeatureBase):
     pbi_count: int = 0
 
 
+class FeatureTreeResponse(FeatureBase):
+    """
+    Feature schema nested in a project tree.
+
+    Carries the Feature's PBIs, in order, instead of their count.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    project_id: UUID
+    status: FeatureStatus
+    branch_name: str | None
+    order: int
+    created_at: datetime
+    updated_at: datetime
+    pbis: list[PBIResponse]
+
+
 class FeatureListResponse(BaseModel):
     """
     Summary Feature schema for listing.
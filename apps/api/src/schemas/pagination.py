@@ -0,0 +1,22 @@
+"""
+Pydantic schemas for paginated responses.
+
+List endpoints return one page of items plus an opaque cursor; pass it
+back as `after` to fetch the next page.
+"""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, Field
+
+ItemT = TypeVar("ItemT")
+
+
+class Page(BaseModel, Generic[ItemT]):
+    """A page of items from a cursor-paginated listing."""
+
+    items: list[ItemT]
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page, or null on the last page",
+    )
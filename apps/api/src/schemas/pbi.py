@@ -0,0 +1,37 @@
+"""
+Pydantic schemas for PBI resources.
+
+PBIs (Product Backlog Items) are the units of work within a Feature
+that agents implement.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+from src.models.enums import PBIStatus, PBIType, PRStatus
+
+
+class PBIResponse(BaseModel):
+    """
+    Full PBI response schema.
+
+    Includes all fields returned when fetching a PBI.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    feature_id: UUID
+    title: str
+    description: str
+    type: PBIType
+    status: PBIStatus
+    assigned_agent: str | None
+    branch_name: str | None
+    pr_number: int | None
+    pr_status: PRStatus | None
+    blocked_by_id: UUID | None
+    order: int
+    created_at: datetime
+    updated_at: datetime
@@ -10,6 +10,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 from src.models.enums import ProjectStatus, ProjectType
+from src.schemas.feature import FeatureTreeResponse
 
 
 class ProjectBase(BaseModel):
@@ -55,6 +56,12 @@ class ProjectResponse(ProjectBase):
     updated_at: datetime
 
 
+class ProjectTreeResponse(ProjectResponse):
+    """Schema for a full project with its features and their PBIs."""
+
+    features: list[FeatureTreeResponse]
+
+
 class ProjectListResponse(BaseModel):
     """Schema for project list item with summary info."""
 
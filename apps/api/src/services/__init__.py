@@ -6,7 +6,16 @@ All service classes and functions should be defined in this package
 and imported here for easy access.
 """
 
-from src.services.feature_service import FeatureService
-from src.services.project_service import ProjectService
+from src.services.agent_log_service import (AgentLogService,
+                                              AsyncAgentLogService)
+from src.services.feature_service import AsyncFeatureService, FeatureService
+from src.services.project_service import AsyncProjectService, ProjectService
 
-__all__: list[str] = ["FeatureService", "ProjectService"]
+__all__: list[str] = [
+    "AgentLogService",
+    "AsyncAgentLogService",
+    "AsyncFeatureService",
+    "AsyncProjectService",
+    "FeatureService",
+    "ProjectService",
+]
@@ -0,0 +1,616 @@
+"""
+AgentLog service for business logic operations.
+
+This service handles ingestion and reads of AgentLog entries, the
+highest-volume table in the database. Batches are written with Postgres
+COPY straight from the validated request data; no ORM objects are built.
+Large CODE contents may be stored compressed or as shared LogBlobs (see
+src/log_compression.py).
+Reads are keyed on (created_at, id), oldest first.
+
+created_at is the clock time of the insert, but rows only become
+visible when their transaction commits. So that a reader which has seen
+a log never sees an older one appear later (and skip it with its
+cursor), writes hold a per-project advisory lock from before their
+first insert until they commit: a project's logs become visible in key
+order.
+
+AgentLogService works on a sync Session (psycopg2) and
+AsyncAgentLogService on an AsyncSession (asyncpg). Both build their rows
+from the same helpers.
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from asyncpg.exceptions import ForeignKeyViolationError
+from psycopg2.errors import ForeignKeyViolation
+from sqlalchemy import Insert, Select, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer, selectinload, undefer
+from src.log_compression import blob_hash, store_content
+from src.models import AgentLog, AgentLogSummary, LogBlob
+from src.models.agent_log import CONTENT_PREVIEW_CHARS
+from src.schemas.agent_log import AgentLogCreate, AgentLogFilter
+from src.services.pagination import decode_cursor, paginate
+
+# =============================================================================
+# Statements
+# =============================================================================
+
+# Loads compressed contents and blobs with the rows, for reading
+# AgentLog.content; a blob shared by several logs is loaded once.
+_WITH_CONTENT = (undefer(AgentLog.content_zstd), selectinload(AgentLog.blob))
+
+# Loads only the start of every content, for AgentLogPreviewResponse
+_WITH_PREVIEW = (defer(AgentLog.content_text), undefer(AgentLog.content_preview))
+
+
+def _list_by_project_stmt(
+    project_id: UUID, limit: int, after: str | None
+) -> Select[tuple[AgentLog]]:
+    stmt = (
+        select(AgentLog)
+        .options(*_WITH_CONTENT)
+        .where(AgentLog.project_id == project_id)
+        .order_by(AgentLog.created_at.asc(), AgentLog.id.asc())
+        .limit(limit + 1)
+    )
+    if after is not None:
+        created_at, log_id = decode_cursor(after, datetime, UUID)
+        # The plain created_at bound lets the planner skip older
+        # partitions; the row comparison alone does not prune.
+        stmt = stmt.where(
+            AgentLog.created_at >= created_at,
+            tuple_(AgentLog.created_at, AgentLog.id) > (created_at, log_id),
+        )
+    return stmt
+
+
+def _iter_by_project_stmt(
+    project_id: UUID, chunk_size: int
+) -> Select[tuple[AgentLog]]:
+    # yield_per fetches through a server-side cursor, chunk_size rows at
+    # a time, and runs the blob selectinload once per chunk.
+    return (
+        select(AgentLog)
+        .options(*_WITH_CONTENT)
+        .where(AgentLog.project_id == project_id)
+        .order_by(AgentLog.created_at.asc(), AgentLog.id.asc())
+        .execution_options(yield_per=chunk_size)
+    )
+
+
+def _list_by_ids_stmt(
+    log_ids: list[UUID], since: datetime
+) -> Select[tuple[AgentLog]]:
+    return (
+        select(AgentLog)
+        .options(*_WITH_CONTENT)
+        .where(AgentLog.id.in_(log_ids), AgentLog.created_at >= since)
+        .order_by(AgentLog.created_at.asc(), AgentLog.id.asc())
+    )
+
+
+def _get_latest_stmt(project_id: UUID) -> Select[tuple[AgentLog]]:
+    return (
+        select(AgentLog)
+        .where(AgentLog.project_id == project_id)
+        .order_by(AgentLog.created_at.desc(), AgentLog.id.desc())
+        .limit(1)
+    )
+
+
+def _search_stmt(
+    filters: AgentLogFilter, limit: int, after: str | None, preview: bool
+) -> Select[tuple[AgentLog]]:
+    # Every filter is a plain predicate: created_at bounds prune
+    # partitions and contains uses the GIN index on extra_data. A page is
+    # read backwards from the (..., created_at, id) index of project_id,
+    # else agent_name, else message_type, else of created_at alone;
+    # pbi_id has its own index (a PBI has few logs).
+    stmt = (
+        select(AgentLog)
+        .options(*(_WITH_PREVIEW if preview else _WITH_CONTENT))
+        .order_by(AgentLog.created_at.desc(), AgentLog.id.desc())
+        .limit(limit + 1)
+    )
+    if filters.project_id is not None:
+        stmt = stmt.where(AgentLog.project_id == filters.project_id)
+    if filters.pbi_id is not None:
+        stmt = stmt.where(AgentLog.pbi_id == filters.pbi_id)
+    if filters.agent_name is not None:
+        stmt = stmt.where(AgentLog.agent_name == filters.agent_name)
+    if filters.message_type is not None:
+        stmt = stmt.where(AgentLog.message_type == filters.message_type)
+    if filters.since is not None:
+        stmt = stmt.where(AgentLog.created_at >= filters.since)
+    if filters.until is not None:
+        stmt = stmt.where(AgentLog.created_at < filters.until)
+    if filters.contains is not None:
+        stmt = stmt.where(AgentLog.extra_data.contains(filters.contains))
+    if after is not None:
+        created_at, log_id = decode_cursor(after, datetime, UUID)
+        stmt = stmt.where(
+            AgentLog.created_at <= created_at,
+            tuple_(AgentLog.created_at, AgentLog.id) < (created_at, log_id),
+        )
+    return stmt
+
+
+def _list_summaries_stmt(project_id: UUID) -> Select[tuple[AgentLogSummary]]:
+    return (
+        select(AgentLogSummary)
+        .where(AgentLogSummary.project_id == project_id)
+        .order_by(
+            AgentLogSummary.pbi_id.asc().nulls_first(),
+            AgentLogSummary.message_type.asc(),
+        )
+    )
+
+
+def _existing_blobs_stmt(hashes: list[bytes]) -> Select[tuple[bytes]]:
+    # The key share lock keeps the retention job from deleting a blob
+    # this batch is about to reference.
+    return (
+        select(LogBlob.hash)
+        .where(LogBlob.hash.in_(hashes))
+        .with_for_update(key_share=True)
+    )
+
+
+def _insert_blobs_stmt() -> Insert:
+    # A concurrent batch may store the same body first
+    return pg_insert(LogBlob).on_conflict_do_nothing(index_elements=[LogBlob.hash])
+
+
+# First key of the per-project write locks (pg_advisory_xact_lock(int, int))
+_WRITE_LOCK_CLASS = 0x61676C77
+
+# Locks every project of a batch, in one fixed order so concurrent
+# batches cannot deadlock. Held until commit.
+_LOCK_PROJECTS_SQL = text(
+    """
+    SELECT pg_advisory_xact_lock(:lock_class, key)
+    FROM (
+        SELECT DISTINCT hashtext(project_id) AS key
+        FROM unnest(CAST(:project_ids AS text[])) AS project_id
+        ORDER BY key
+    ) AS keys
+    """
+).bindparams(lock_class=_WRITE_LOCK_CLASS)
+
+
+def _lock_params(logs: list[AgentLogCreate]) -> dict[str, Any]:
+    return {"project_ids": sorted({str(log.project_id) for log in logs})}
+
+
+def _log_sort_key(log: AgentLog) -> tuple[datetime, UUID]:
+    return log.created_at, log.id
+
+
+# =============================================================================
+# COPY helpers
+# =============================================================================
+
+# id, created_at and updated_at are left to their server defaults
+_COPY_COLUMNS = (
+    "project_id",
+    "pbi_id",
+    "agent_name",
+    "message_type",
+    "content",
+    "content_zstd",
+    "content_head",
+    "content_hash",
+    "extra_data",
+)
+
+_COPY_CSV_SQL = (
+    f"COPY {AgentLog.__tablename__} ({', '.join(_COPY_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+
+def _blob_hashes(logs: list[AgentLogCreate]) -> list[bytes | None]:
+    return [blob_hash(log.message_type, log.content) for log in logs]
+
+
+def _new_blob_rows(
+    logs: list[AgentLogCreate],
+    hashes: list[bytes | None],
+    existing: set[bytes],
+) -> list[dict[str, Any]]:
+    # One row per body not stored yet, in hash order so concurrent
+    # batches wait on each other's new blobs without deadlocking.
+    bodies = {
+        content_hash: log
+        for content_hash, log in zip(hashes, logs)
+        if content_hash is not None and content_hash not in existing
+    }
+    rows = []
+    for content_hash, log in sorted(bodies.items()):
+        stored = store_content(log.message_type, log.content)
+        rows.append(
+            {
+                "hash": content_hash,
+                "content_text": stored.content,
+                "content_zstd": stored.content_zstd,
+                "size": len(log.content.encode()),
+            }
+        )
+    return rows
+
+
+def _copy_records(
+    logs: list[AgentLogCreate], hashes: list[bytes | None]
+) -> list[tuple[Any, ...]]:
+    return [
+        (
+            log.project_id,
+            log.pbi_id,
+            log.agent_name,
+            log.message_type.value,
+            *(
+                store_content(log.message_type, log.content)
+                if content_hash is None
+                else (None, None, log.content[:CONTENT_PREVIEW_CHARS])
+            ),
+            content_hash,
+            None if log.extra_data is None else json.dumps(log.extra_data),
+        )
+        for log, content_hash in zip(logs, hashes)
+    ]
+
+
+def _csv_value(value: Any) -> Any:
+    # bytea is written in its hex text form
+    return "\\x" + value.hex() if isinstance(value, bytes) else value
+
+
+def _csv_buffer(records: list[tuple[Any, ...]]) -> io.StringIO:
+    # Unquoted empty fields are read back as NULL; every non-null text
+    # column has min_length=1, so None is the only value written empty.
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [_csv_value(value) for value in record] for record in records
+    )
+    buffer.seek(0)
+    return buffer
+
+
+# =============================================================================
+# Services
+# =============================================================================
+
+
+class AgentLogService:
+    """Service class for AgentLog operations."""
+
+    def __init__(self, db: Session) -> None:
+        """
+        Initialize the service with a database session.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def create_many(self, logs: list[AgentLogCreate]) -> int:
+        """
+        Bulk insert log entries with a single COPY.
+
+        Contents stored as blobs are hashed first, and only bodies not
+        stored yet are written to log_blobs. The batch is all or nothing,
+        and waits for other writes to its projects to commit first.
+
+        Args:
+            logs: List of log entries
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            ValueError: If a project or PBI referenced by the batch is not found
+        """
+        hashes = _blob_hashes(logs)
+        self.db.execute(_LOCK_PROJECTS_SQL, _lock_params(logs))
+        self._store_blobs(logs, hashes)
+        buffer = _csv_buffer(_copy_records(logs, hashes))
+        dbapi_connection = self.db.connection().connection.dbapi_connection
+        try:
+            with dbapi_connection.cursor() as cursor:
+                cursor.copy_expert(_COPY_CSV_SQL, buffer)
+        except ForeignKeyViolation:
+            self.db.rollback()
+            raise ValueError("Batch references a project or PBI that does not exist")
+        self.db.commit()
+        return len(logs)
+
+    def _store_blobs(
+        self, logs: list[AgentLogCreate], hashes: list[bytes | None]
+    ) -> None:
+        wanted = [content_hash for content_hash in hashes if content_hash is not None]
+        if not wanted:
+            return
+        existing = set(self.db.scalars(_existing_blobs_stmt(wanted)))
+        rows = _new_blob_rows(logs, hashes, existing)
+        if rows:
+            self.db.execute(_insert_blobs_stmt(), rows)
+
+    def list_by_project(
+        self, project_id: UUID, limit: int, after: str | None = None
+    ) -> tuple[list[AgentLog], str | None]:
+        """
+        Retrieve a page of a project's logs, oldest first.
+
+        Args:
+            project_id: UUID of the project
+            limit: Maximum number of logs to return
+            after: Cursor returned with the previous page
+
+        Returns:
+            (list of logs, next page cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _list_by_project_stmt(project_id, limit, after)
+        return paginate(list(self.db.scalars(stmt)), limit, _log_sort_key)
+
+    def iter_by_project(
+        self, project_id: UUID, chunk_size: int
+    ) -> Iterator[list[AgentLog]]:
+        """
+        Retrieve all of a project's logs, oldest first, chunk by chunk.
+
+        Rows are read from a server-side cursor, so only the current
+        chunk is held in memory. The session must stay open until the
+        iterator is exhausted.
+
+        Args:
+            project_id: UUID of the project
+            chunk_size: Number of logs per chunk
+
+        Yields:
+            Lists of at most chunk_size logs
+        """
+        stmt = _iter_by_project_stmt(project_id, chunk_size)
+        for chunk in self.db.scalars(stmt).partitions():
+            yield list(chunk)
+
+    def list_by_ids(
+        self, log_ids: list[UUID], since: datetime
+    ) -> list[AgentLog]:
+        """
+        Retrieve logs by their IDs, oldest first.
+
+        Args:
+            log_ids: UUIDs of the logs to retrieve
+            since: Lower bound of their created_at, so only the
+                partitions from then on are searched
+
+        Returns:
+            List of the logs that exist
+        """
+        return list(self.db.scalars(_list_by_ids_stmt(log_ids, since)))
+
+    def get_latest(self, project_id: UUID) -> AgentLog | None:
+        """
+        Retrieve a project's most recent log.
+
+        Args:
+            project_id: UUID of the project
+
+        Returns:
+            The newest log if the project has any, None otherwise
+        """
+        return self.db.scalars(_get_latest_stmt(project_id)).first()
+
+    def search(
+        self,
+        filters: AgentLogFilter,
+        limit: int,
+        after: str | None = None,
+        preview: bool = False,
+    ) -> tuple[list[AgentLog], str | None]:
+        """
+        Retrieve a page of logs matching every given filter, newest first.
+
+        Args:
+            filters: Filters to apply
+            limit: Maximum number of logs to return
+            after: Cursor returned with the previous page
+            preview: Load only content_preview instead of the content
+
+        Returns:
+            (list of logs, next page cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _search_stmt(filters, limit, after, preview)
+        return paginate(list(self.db.scalars(stmt)), limit, _log_sort_key)
+
+    def list_summaries(self, project_id: UUID) -> list[AgentLogSummary]:
+        """
+        Retrieve the rolled-up logs of a project.
+
+        Args:
+            project_id: UUID of the project
+
+        Returns:
+            Summaries by PBI (project-level first) and message type
+        """
+        return list(self.db.scalars(_list_summaries_stmt(project_id)))
+
+
+class AsyncAgentLogService:
+    """Async service class for AgentLog operations."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Initialize the service with an async database session.
+
+        Args:
+            db: SQLAlchemy async database session
+        """
+        self.db = db
+
+    async def create_many(self, logs: list[AgentLogCreate]) -> int:
+        """
+        Bulk insert log entries with a single COPY.
+
+        Contents stored as blobs are hashed first, and only bodies not
+        stored yet are written to log_blobs. The batch is all or nothing,
+        and waits for other writes to its projects to commit first.
+
+        Args:
+            logs: List of log entries
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            ValueError: If a project or PBI referenced by the batch is not found
+        """
+        hashes = _blob_hashes(logs)
+        await self.db.execute(_LOCK_PROJECTS_SQL, _lock_params(logs))
+        await self._store_blobs(logs, hashes)
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        try:
+            # Binary COPY through asyncpg's native API
+            await raw_connection.driver_connection.copy_records_to_table(
+                AgentLog.__tablename__,
+                records=_copy_records(logs, hashes),
+                columns=_COPY_COLUMNS,
+            )
+        except ForeignKeyViolationError:
+            await self.db.rollback()
+            raise ValueError("Batch references a project or PBI that does not exist")
+        await self.db.commit()
+        return len(logs)
+
+    async def _store_blobs(
+        self, logs: list[AgentLogCreate], hashes: list[bytes | None]
+    ) -> None:
+        wanted = [content_hash for content_hash in hashes if content_hash is not None]
+        if not wanted:
+            return
+        existing = set(await self.db.scalars(_existing_blobs_stmt(wanted)))
+        rows = _new_blob_rows(logs, hashes, existing)
+        if rows:
+            await self.db.execute(_insert_blobs_stmt(), rows)
+
+    async def list_by_project(
+        self, project_id: UUID, limit: int, after: str | None = None
+    ) -> tuple[list[AgentLog], str | None]:
+        """
+        Retrieve a page of a project's logs, oldest first.
+
+        Args:
+            project_id: UUID of the project
+            limit: Maximum number of logs to return
+            after: Cursor returned with the previous page
+
+        Returns:
+            (list of logs, next page cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _list_by_project_stmt(project_id, limit, after)
+        return paginate(list(await self.db.scalars(stmt)), limit, _log_sort_key)
+
+    async def iter_by_project(
+        self, project_id: UUID, chunk_size: int
+    ) -> AsyncIterator[list[AgentLog]]:
+        """
+        Retrieve all of a project's logs, oldest first, chunk by chunk.
+
+        Rows are read from a server-side cursor, so only the current
+        chunk is held in memory. The session must stay open until the
+        iterator is exhausted.
+
+        Args:
+            project_id: UUID of the project
+            chunk_size: Number of logs per chunk
+
+        Yields:
+            Lists of at most chunk_size logs
+        """
+        stmt = _iter_by_project_stmt(project_id, chunk_size)
+        async for chunk in (await self.db.stream_scalars(stmt)).partitions():
+            yield list(chunk)
+
+    async def list_by_ids(
+        self, log_ids: list[UUID], since: datetime
+    ) -> list[AgentLog]:
+        """
+        Retrieve logs by their IDs, oldest first.
+
+        Args:
+            log_ids: UUIDs of the logs to retrieve
+            since: Lower bound of their created_at, so only the
+                partitions from then on are searched
+
+        Returns:
+            List of the logs that exist
+        """
+        return list(await self.db.scalars(_list_by_ids_stmt(log_ids, since)))
+
+    async def get_latest(self, project_id: UUID) -> AgentLog | None:
+        """
+        Retrieve a project's most recent log.
+
+        Args:
+            project_id: UUID of the project
+
+        Returns:
+            The newest log if the project has any, None otherwise
+        """
+        return (await self.db.scalars(_get_latest_stmt(project_id))).first()
+
+    async def search(
+        self,
+        filters: AgentLogFilter,
+        limit: int,
+        after: str | None = None,
+        preview: bool = False,
+    ) -> tuple[list[AgentLog], str | None]:
+        """
+        Retrieve a page of logs matching every given filter, newest first.
+
+        Args:
+            filters: Filters to apply
+            limit: Maximum number of logs to return
+            after: Cursor returned with the previous page
+            preview: Load only content_preview instead of the content
+
+        Returns:
+            (list of logs, next page cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _search_stmt(filters, limit, after, preview)
+        return paginate(list(await self.db.scalars(stmt)), limit, _log_sort_key)
+
+    async def list_summaries(self, project_id: UUID) -> list[AgentLogSummary]:
+        """
+        Retrieve the rolled-up logs of a project.
+
+        Args:
+            project_id: UUID of the project
+
+        Returns:
+            Summaries by PBI (project-level first) and message type
+        """
+        return list(await self.db.scalars(_list_summaries_stmt(project_id)))
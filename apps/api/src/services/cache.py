@@ -0,0 +1,581 @@
+"""
+Read-through cache of the entities loaded by the services.
+
+ProjectService.get_by_id and FeatureService.get_with_pbi_count look
+entities up here before querying, so the routes reading a single
+project or feature answer a hit, and its conditional GET, without a
+round trip. The services drop the entries they write (update,
+update_status, delete) once committed. Misses are not cached, so
+creating an entity has nothing to invalidate.
+
+Entries hold the row a service loaded, as JSON: the column values of
+the entity and the plain values selected with it (a feature's PBI
+count). A hit is rebuilt as a detached instance: its columns are set,
+and lazy-loading a relationship raises instead of silently returning
+nothing.
+
+Backends:
+
+- MemoryCache: per-worker LRU with a TTL (the default)
+- RedisCache: any server speaking the Redis protocol, shared by every
+  worker (entity_cache_url=redis://...)
+
+With MemoryCache, every worker also drops the entries other workers
+write: the writing transaction publishes the keys of the entities on
+the geonosis_invalidate channel, delivered when it commits, and each
+worker evicts them as they arrive through its PgListener. Notifications
+sent while a worker's LISTEN connection is down are lost, so the whole
+cache is flushed on every (re)connect.
+
+Entries expire after entity_cache_ttl_seconds, which bounds how stale an
+entry can get when a row is changed outside of the services (as PBIs,
+and with them PBI counts, always are), or while a worker is
+reconnecting. Callers that have just read an entity's updated_at can
+pass it along: a hit with another updated_at is stale and is reloaded.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, TypeVar
+from uuid import UUID
+
+import orjson
+import redis
+import redis.asyncio
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from src.config import get_settings
+from src.models import Base
+from src.pg_listener import PgListener
+from src.schemas.cache import EntityCacheStats
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+REDIS_KEY_PREFIX = "geonosis:"
+
+# NOTIFY channel carrying the keys of written entities, one per payload
+INVALIDATE_CHANNEL = "geonosis_invalidate"
+
+_NOTIFY_SQL = text(
+    "SELECT pg_notify(:channel, key) FROM unnest(CAST(:keys AS text[])) AS key"
+).bindparams(channel=INVALIDATE_CHANNEL)
+
+
+# =============================================================================
+# Backends
+# =============================================================================
+
+
+class MemoryCache:
+    """
+    In-process LRU cache with a TTL.
+
+    Thread-safe, as sync services run in the threadpool. Expired entries
+    are dropped when next read; the least recently used entry is evicted
+    once max_entries are stored.
+    """
+
+    name = "memory"
+    shared = False
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries: Number of entries kept at most
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, keys: list[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int | None:
+        return len(self._entries)
+
+    # No I/O: the async variants run inline
+
+    async def get_async(self, key: str) -> bytes | None:
+        return self.get(key)
+
+    async def set_async(self, key: str, value: bytes, ttl: float) -> None:
+        self.set(key, value, ttl)
+
+    async def delete_async(self, keys: list[str]) -> None:
+        self.delete(keys)
+
+
+class RedisCache:
+    """
+    Cache kept in a Redis-protocol server, shared by all workers.
+
+    Sync services use a blocking client and async services an asyncio
+    one, both connecting to url. Evictions are up to the server's
+    maxmemory policy and are not counted here.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str) -> None:
+        """
+        Create clients for a server; nothing is connected until used.
+
+        Args:
+            url: Server URL, e.g. redis://localhost:6379/0
+        """
+        self._client = redis.Redis.from_url(url)
+        self._async_client = redis.asyncio.Redis.from_url(url)
+        self.evictions: int | None = None
+
+    def get(self, key: str) -> bytes | None:
+        return self._client.get(REDIS_KEY_PREFIX + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._client.set(REDIS_KEY_PREFIX + key, value, px=int(ttl * 1000))
+
+    def delete(self, keys: list[str]) -> None:
+        self._client.delete(*[REDIS_KEY_PREFIX + key for key in keys])
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=REDIS_KEY_PREFIX + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+    def size(self) -> int | None:
+        return None
+
+    async def get_async(self, key: str) -> bytes | None:
+        return await self._async_client.get(REDIS_KEY_PREFIX + key)
+
+    async def set_async(self, key: str, value: bytes, ttl: float) -> None:
+        await self._async_client.set(
+            REDIS_KEY_PREFIX + key, value, px=int(ttl * 1000)
+        )
+
+    async def delete_async(self, keys: list[str]) -> None:
+        await self._async_client.delete(*[REDIS_KEY_PREFIX + key for key in keys])
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+
+def _decoder(column_type: Any) -> Callable[[Any], Any] | None:
+    enum_class = getattr(column_type, "enum_class", None)
+    if enum_class is not None:
+        return enum_class
+    try:
+        python_type = column_type.python_type
+    except NotImplementedError:
+        return None
+    if python_type is UUID:
+        return UUID
+    if python_type is datetime:
+        return datetime.fromisoformat
+    return None
+
+
+@lru_cache
+def _columns(model: type[Base]) -> tuple[tuple[str, Any], ...]:
+    return tuple(
+        (attr.key, _decoder(attr.columns[0].type))
+        for attr in inspect(model).column_attrs
+    )
+
+
+def _encode_default(value: Any) -> Any:
+    # asyncpg returns its own uuid.UUID subclass
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _row(entity: Base) -> dict[str, Any]:
+    return {key: getattr(entity, key) for key, _ in _columns(type(entity))}
+
+
+def _build(model: type[ModelT], row: dict[str, Any]) -> ModelT:
+    values = {}
+    for key, decode in _columns(model):
+        value = row[key]
+        values[key] = value if value is None or decode is None else decode(value)
+    entity = model(**values)
+    make_transient_to_detached(entity)
+    return entity
+
+
+def encode(row: Sequence[Any]) -> bytes:
+    """
+    Serialize a loaded row.
+
+    Args:
+        row: The entity, followed by any plain values selected with it
+
+    Returns:
+        JSON-encoded column values and values
+    """
+    entity, *values = row
+    return orjson.dumps([_row(entity), *values], default=_encode_default)
+
+
+def decode(model: type[ModelT], value: bytes) -> tuple[Any, ...]:
+    """
+    Rebuild a row serialized by encode().
+
+    Args:
+        model: Model class of the entity
+        value: Cached value
+
+    Returns:
+        The entity, as a detached instance with its columns set, followed
+        by the values stored with it
+    """
+    columns, *values = orjson.loads(value)
+    return (_build(model, columns), *values)
+
+
+def cache_key(model: type[Base], entity_id: UUID) -> str:
+    """
+    Key of an entity in the cache.
+
+    Args:
+        model: Model class of the entity
+        entity_id: Primary key of the entity
+
+    Returns:
+        The key, e.g. projects:<uuid>
+    """
+    return f"{model.__tablename__}:{entity_id}"
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class EntityCache:
+    """
+    Read-through entity cache in front of a backend.
+
+    A read that misses stores what it loaded only if no entry was
+    invalidated in this process meanwhile, so a slow read cannot put back
+    a row that a concurrent write has just replaced.
+    """
+
+    def __init__(
+        self, backend: MemoryCache | RedisCache | None, ttl: float
+    ) -> None:
+        """
+        Create a cache.
+
+        Args:
+            backend: Where entries are stored; None disables caching
+            ttl: Seconds an entry is kept at most
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._invalidations = 0
+        self._notifications = 0
+        self._flushes = 0
+        self._writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entities are cached at all."""
+        return self.backend is not None
+
+    @property
+    def broadcasts(self) -> bool:
+        """Whether writes are announced to the other workers' caches."""
+        return self.backend is not None and not self.backend.shared
+
+    def _count(self, hit: bool, stale: bool = False) -> int:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+                self._stale += stale
+            return self._writes
+
+    def _fresh(self, writes: int) -> bool:
+        with self._lock:
+            return self._writes == writes
+
+    def _invalidated(self, count: int) -> None:
+        with self._lock:
+            self._writes += 1
+            self._invalidations += count
+
+    def _usable(self, row: tuple[Any, ...] | None, version: datetime | None) -> bool:
+        stale = row is not None and version is not None and (
+            row[0].updated_at != version
+        )
+        return row is not None and not stale
+
+    def read_through(
+        self,
+        model: type[ModelT],
+        entity_id: UUID,
+        load: Callable[[], Sequence[Any] | None],
+        version: datetime | None = None,
+    ) -> tuple[Any, ...] | None:
+        """
+        Get an entity's row from the cache, or load and cache it.
+
+        Args:
+            model: Model class of the entity
+            entity_id: Primary key of the entity
+            load: Loads the row from the database: the entity, followed
+                by any JSON-serializable values selected with it
+            version: updated_at the entity was just read with, if known;
+                a cached copy with another one is reloaded and replaced
+
+        Returns:
+            The row, None if the entity does not exist
+        """
+        if self.backend is None:
+            row = load()
+            return None if row is None else tuple(row)
+        key = cache_key(model, entity_id)
+        value = self.backend.get(key)
+        cached = None if value is None else decode(model, value)
+        usable = self._usable(cached, version)
+        writes = self._count(usable, stale=cached is not None and not usable)
+        if usable:
+            return cached
+        row = load()
+        if row is None:
+            return None
+        if self._fresh(writes):
+            self.backend.set(key, encode(row), self.ttl)
+        return tuple(row)
+
+    async def read_through_async(
+        self,
+        model: type[ModelT],
+        entity_id: UUID,
+        load: Callable[[], Awaitable[Sequence[Any] | None]],
+        version: datetime | None = None,
+    ) -> tuple[Any, ...] | None:
+        """
+        Get an entity's row from the cache, or load and cache it.
+
+        Args:
+            model: Model class of the entity
+            entity_id: Primary key of the entity
+            load: Loads the row from the database: the entity, followed
+                by any JSON-serializable values selected with it
+            version: updated_at the entity was just read with, if known;
+                a cached copy with another one is reloaded and replaced
+
+        Returns:
+            The row, None if the entity does not exist
+        """
+        if self.backend is None:
+            row = await load()
+            return None if row is None else tuple(row)
+        key = cache_key(model, entity_id)
+        value = await self.backend.get_async(key)
+        cached = None if value is None else decode(model, value)
+        usable = self._usable(cached, version)
+        writes = self._count(usable, stale=cached is not None and not usable)
+        if usable:
+            return cached
+        row = await load()
+        if row is None:
+            return None
+        if self._fresh(writes):
+            await self.backend.set_async(key, encode(row), self.ttl)
+        return tuple(row)
+
+    def announce(
+        self, db: Session, model: type[Base], entity_ids: list[UUID]
+    ) -> None:
+        """
+        Publish the keys of entities being written to every worker.
+
+        Runs in the writing transaction, before it commits: Postgres
+        delivers the notifications on commit, and drops them on rollback.
+
+        Args:
+            db: Session of the writing transaction
+            model: Model class of the entities
+            entity_ids: Primary keys of the entities
+        """
+        if not self.broadcasts or not entity_ids:
+            return
+        keys = [cache_key(model, entity_id) for entity_id in entity_ids]
+        db.execute(_NOTIFY_SQL, {"keys": keys})
+
+    async def announce_async(
+        self, db: AsyncSession, model: type[Base], entity_ids: list[UUID]
+    ) -> None:
+        """
+        Publish the keys of entities being written to every worker.
+
+        Runs in the writing transaction, before it commits: Postgres
+        delivers the notifications on commit, and drops them on rollback.
+
+        Args:
+            db: Async session of the writing transaction
+            model: Model class of the entities
+            entity_ids: Primary keys of the entities
+        """
+        if not self.broadcasts or not entity_ids:
+            return
+        keys = [cache_key(model, entity_id) for entity_id in entity_ids]
+        await db.execute(_NOTIFY_SQL, {"keys": keys})
+
+    def invalidate(self, model: type[Base], entity_ids: list[UUID]) -> None:
+        """
+        Drop entities from the cache after they were written.
+
+        Args:
+            model: Model class of the entities
+            entity_ids: Primary keys of the entities
+        """
+        if self.backend is None or not entity_ids:
+            return
+        self._invalidated(len(entity_ids))
+        self.backend.delete([cache_key(model, entity_id) for entity_id in entity_ids])
+
+    async def invalidate_async(
+        self, model: type[Base], entity_ids: list[UUID]
+    ) -> None:
+        """
+        Drop entities from the cache after they were written.
+
+        Args:
+            model: Model class of the entities
+            entity_ids: Primary keys of the entities
+        """
+        if self.backend is None or not entity_ids:
+            return
+        self._invalidated(len(entity_ids))
+        await self.backend.delete_async(
+            [cache_key(model, entity_id) for entity_id in entity_ids]
+        )
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        if self.backend is None:
+            return
+        self._invalidated(0)
+        self.backend.clear()
+
+    def attach(self, listener: PgListener) -> None:
+        """
+        Evict the entities announced by any worker, via the shared listener.
+
+        Only a per-worker backend needs this; a shared one is invalidated
+        by the writing worker directly.
+
+        Args:
+            listener: The worker's PgListener (not yet started)
+        """
+        if not self.broadcasts:
+            return
+        listener.listen(INVALIDATE_CHANNEL, self._on_notify)
+        listener.on_connect(self._on_connect)
+
+    def _on_notify(self, payload: str) -> None:
+        with self._lock:
+            self._writes += 1
+            self._notifications += 1
+        self.backend.delete([payload])
+
+    def _on_connect(self) -> None:
+        # Anything announced while disconnected was missed
+        with self._lock:
+            self._flushes += 1
+        self.clear()
+
+    def stats(self) -> EntityCacheStats:
+        """
+        Counters of this process since startup.
+
+        Returns:
+            Hits, misses (stale hits among them), invalidations and, for
+            the memory backend, notifications received, flushes, evictions
+            and the number of entries
+        """
+        with self._lock:
+            hits, misses, stale = self._hits, self._misses, self._stale
+            invalidations = self._invalidations
+            notifications, flushes = self._notifications, self._flushes
+        lookups = hits + misses
+        return EntityCacheStats(
+            enabled=self.backend is not None,
+            backend=None if self.backend is None else self.backend.name,
+            hits=hits,
+            misses=misses,
+            stale=stale,
+            hit_ratio=hits / lookups if lookups else None,
+            invalidations=invalidations,
+            notifications=notifications,
+            flushes=flushes,
+            evictions=None if self.backend is None else self.backend.evictions,
+            entries=None if self.backend is None else self.backend.size(),
+        )
+
+
+@lru_cache
+def get_entity_cache() -> EntityCache:
+    """
+    Get the process-wide entity cache configured in the settings.
+
+    Returns:
+        The EntityCache, with no backend when entity_cache_enabled is off
+    """
+    settings = get_settings()
+    backend: MemoryCache | RedisCache | None = None
+    if settings.entity_cache_enabled:
+        if settings.entity_cache_url:
+            backend = RedisCache(settings.entity_cache_url)
+        else:
+            backend = MemoryCache(settings.entity_cache_max_entries)
+    return EntityCache(backend, settings.entity_cache_ttl_seconds)
@@ -3,27 +3,218 @@ Feature service for business logic operations.
 
 This service handles all CRUD operations and business logic
 for Feature resources.
+
+FeatureService works on a sync Session and AsyncFeatureService on an
+AsyncSession. Both build their queries from the same statement helpers.
+
+Features read by ID with their PBI count go through the entity cache
+(src/services/cache.py); writes drop the entries they touch once
+committed, in every worker.
 """
 
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import (Delete, Insert, Label, Select, Update, delete, func,
+                        insert, select, tuple_, update)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from src.models import Feature, FeatureStatus, Project
+from src.models import PBI, Feature, FeatureOrderCounter, FeatureStatus
 from src.schemas.feature import FeatureCreate, FeatureUpdate
+from src.services.cache import EntityCache, get_entity_cache
+from src.services.pagination import decode_cursor, paginate
+
+# =============================================================================
+# Statements
+# =============================================================================
+
+
+def _list_by_project_stmt(project_id: UUID) -> Select[tuple[Feature]]:
+    return (
+        select(Feature)
+        .options(joinedload(Feature.pbis))
+        .where(Feature.project_id == project_id)
+        .order_by(Feature.order.asc(), Feature.created_at.asc())
+    )
+
+
+def _get_by_id_stmt(feature_id: UUID) -> Select[tuple[Feature]]:
+    return (
+        select(Feature)
+        .options(joinedload(Feature.pbis))
+        .where(Feature.id == feature_id)
+    )
+
+
+def _pbi_count_expr() -> Label[int]:
+    # Correlated count per feature row; PBIs are never loaded.
+    return (
+        select(func.count(PBI.id))
+        .where(PBI.feature_id == Feature.id)
+        .correlate(Feature)
+        .scalar_subquery()
+        .label("pbi_count")
+    )
+
+
+def _list_with_pbi_counts_stmt(
+    project_id: UUID, limit: int, after: str | None
+) -> Select[tuple[Feature, int]]:
+    stmt = (
+        select(Feature, _pbi_count_expr())
+        .where(Feature.project_id == project_id)
+        .order_by(Feature.order.asc(), Feature.created_at.asc(), Feature.id.asc())
+        .limit(limit + 1)
+    )
+    if after is not None:
+        order, created_at, feature_id = decode_cursor(after, int, datetime, UUID)
+        stmt = stmt.where(
+            tuple_(Feature.order, Feature.created_at, Feature.id)
+            > (order, created_at, feature_id)
+        )
+    return stmt
+
+
+def _feature_sort_key(row: tuple[Feature, int]) -> tuple[int, datetime, UUID]:
+    return row[0].order, row[0].created_at, row[0].id
+
+
+def _get_with_pbi_count_stmt(feature_id: UUID) -> Select[tuple[Feature, int]]:
+    return select(Feature, _pbi_count_expr()).where(Feature.id == feature_id)
+
+
+def _list_by_project_version_stmt(
+    project_id: UUID, limit: int, after: str | None
+) -> Select[tuple[UUID, datetime, int]]:
+    # The same page as the list (order, cursor and limit), reduced to
+    # what can change in an item
+    return _list_with_pbi_counts_stmt(project_id, limit, after).with_only_columns(
+        Feature.id, Feature.updated_at, _pbi_count_expr()
+    )
+
+
+def _get_plain_stmt(feature_id: UUID) -> Select[tuple[Feature]]:
+    return select(Feature).where(Feature.id == feature_id)
+
+
+def _update_stmt(feature_id: UUID, values: dict[str, Any]) -> Update:
+    # Single round trip: the trigger sets updated_at, RETURNING hands back
+    # the whole row, and no row means the feature does not exist.
+    return (
+        update(Feature)
+        .where(Feature.id == feature_id)
+        .values(**values)
+        .returning(Feature)
+    )
+
+
+def _update_with_pbi_count_stmt(
+    feature_id: UUID, values: dict[str, Any]
+) -> Update:
+    return (
+        update(Feature)
+        .where(Feature.id == feature_id)
+        .values(**values)
+        .returning(Feature, _pbi_count_expr())
+    )
+
+
+def _delete_stmt(feature_id: UUID) -> Delete:
+    # PBIs go with it via ON DELETE CASCADE; nothing is loaded.
+    return (
+        delete(Feature)
+        .where(Feature.id == feature_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _allocate_orders_stmt(project_id: UUID, count: int) -> Insert:
+    # Reserves the block [first, first + count) and returns first. The
+    # upserted counter row stays locked until commit, so concurrent
+    # creates for the same project queue on it rather than racing. A
+    # missing project fails the foreign key.
+    stmt = pg_insert(FeatureOrderCounter).values(
+        project_id=project_id, next_order=count
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[FeatureOrderCounter.project_id],
+        set_={"next_order": FeatureOrderCounter.next_order + count},
+    ).returning(FeatureOrderCounter.next_order - count)
+
+
+def _reserve_order_stmt(project_id: UUID, order: int) -> Insert:
+    # Moves the counter past an explicitly requested order.
+    stmt = pg_insert(FeatureOrderCounter).values(
+        project_id=project_id, next_order=order + 1
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[FeatureOrderCounter.project_id],
+        set_={
+            "next_order": func.greatest(
+                FeatureOrderCounter.next_order, stmt.excluded.next_order
+            )
+        },
+    )
+
+
+def _bulk_insert_stmt() -> Insert:
+    # Executed with a list of parameter sets: insertmanyvalues batches
+    # them into multi-row INSERT ... RETURNING statements. Ids are
+    # generated server side, so rows can't be matched back to parameter
+    # order (sort_by_parameter_order would fall back to one INSERT per
+    # row); callers sort by the distinct order values instead.
+    return insert(Feature).returning(Feature)
+
+
+def _bulk_insert_rows(
+    project_id: UUID, features: list[FeatureCreate], first_order: int
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": data.name,
+            "description": data.description,
+            "project_id": project_id,
+            "status": FeatureStatus.PENDING,
+            "order": first_order + i,
+        }
+        for i, data in enumerate(features)
+    ]
+
+
+def _new_feature(
+    project_id: UUID, data: FeatureCreate, order: int
+) -> Feature:
+    return Feature(
+        name=data.name,
+        description=data.description,
+        project_id=project_id,
+        status=FeatureStatus.PENDING,
+        order=order,
+    )
+
+
+# =============================================================================
+# Services
+# =============================================================================
 
 
 class FeatureService:
     """Service class for Feature operations."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, cache: EntityCache | None = None) -> None:
         """
         Initialize the service with a database session.
 
         Args:
             db: SQLAlchemy database session
+            cache: Entity cache, the configured one by default
         """
         self.db = db
+        self.cache = cache or get_entity_cache()
 
     def list_by_project(self, project_id: UUID) -> list[Feature]:
         """
@@ -35,12 +226,8 @@ class FeatureService:
         Returns:
             List of features ordered by order field, then created_at
         """
-        return (
-            self.db.query(Feature)
-            .options(joinedload(Feature.pbis))
-            .filter(Feature.project_id == project_id)
-            .order_by(Feature.order.asc(), Feature.created_at.asc())
-            .all()
+        return list(
+            self.db.scalars(_list_by_project_stmt(project_id)).unique()
         )
 
     def get_by_id(self, feature_id: UUID) -> Feature | None:
@@ -53,47 +240,117 @@ class FeatureService:
         Returns:
             Feature if found, None otherwise
         """
-        return (
-            self.db.query(Feature)
-            .options(joinedload(Feature.pbis))
-            .filter(Feature.id == feature_id)
-            .first()
-        )
+        return self.db.scalars(_get_by_id_stmt(feature_id)).unique().first()
 
-    def _get_next_order(self, project_id: UUID) -> int:
+    def list_by_project_with_pbi_counts(
+        self, project_id: UUID, limit: int, after: str | None = None
+    ) -> tuple[list[tuple[Feature, int]], str | None]:
         """
-        Get the next order value for a feature in a project.
+        Retrieve a page of a project's features together with their PBI counts.
+
+        Counts are computed in the same query, so PBIs are not loaded.
+        Pages are keyed on (order, created_at, id), ascending.
 
         Args:
             project_id: UUID of the project
+            limit: Maximum number of features to return
+            after: Cursor returned with the previous page
+
+        Returns:
+            (list of (feature, pbi_count) tuples, next page cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _list_with_pbi_counts_stmt(project_id, limit, after)
+        result = self.db.execute(stmt)
+        rows = [(feature, count) for feature, count in result]
+        return paginate(rows, limit, _feature_sort_key)
+
+    def get_with_pbi_count(
+        self, feature_id: UUID
+    ) -> tuple[Feature, int] | None:
+        """
+        Retrieve a feature by its ID together with its PBI count.
+
+        The row comes from the entity cache if present, count included.
+
+        Args:
+            feature_id: UUID of the feature to retrieve
 
         Returns:
-            Next order value (max + 1, or 0 if no features exist)
+            (feature, pbi_count) if found, None otherwise; a cached
+            feature is detached, with only its columns loaded
         """
-        max_order = (
-            self.db.query(func.max(Feature.order))
-            .filter(Feature.project_id == project_id)
-            .scalar()
+        row = self.cache.read_through(
+            Feature,
+            feature_id,
+            lambda: self.db.execute(_get_with_pbi_count_stmt(feature_id)).first(),
         )
-        return (max_order or -1) + 1
+        return None if row is None else (row[0], row[1])
 
-    def _verify_project_exists(self, project_id: UUID) -> Project:
+    def list_by_project_version(
+        self, project_id: UUID, limit: int, after: str | None = None
+    ) -> tuple[tuple[tuple[UUID, datetime, int], ...], bool]:
         """
-        Verify a project exists.
+        Retrieve the version of a page of a project's feature list.
+
+        Reads the same page as list_by_project_with_pbi_counts, but only
+        the key, updated_at and PBI count of each feature on it.
+        Answers conditional GETs without reading the page itself.
 
         Args:
             project_id: UUID of the project
+            limit: Maximum number of features on the page
+            after: Cursor from the previous page
 
         Returns:
-            Project if found
+            ((id, updated_at, pbi_count) of each feature on the page,
+            whether another page follows)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _list_by_project_version_stmt(project_id, limit, after)
+        rows = self.db.execute(stmt).all()
+        return tuple(tuple(row) for row in rows[:limit]), len(rows) > limit
+
+    def _allocate_orders(self, project_id: UUID, count: int) -> int:
+        """
+        Allocate a contiguous block of order values for a project.
+
+        Args:
+            project_id: UUID of the project
+            count: Number of order values to allocate
+
+        Returns:
+            First order value of the block
 
         Raises:
             ValueError: If project not found
         """
-        project = self.db.query(Project).filter(Project.id == project_id).first()
-        if project is None:
+        try:
+            return self.db.scalar(_allocate_orders_stmt(project_id, count))
+        except IntegrityError:
+            self.db.rollback()
+            raise ValueError(f"Project with id {project_id} not found")
+
+    def _reserve_order(self, project_id: UUID, order: int) -> None:
+        """
+        Keep future allocations above an explicitly chosen order value.
+
+        Args:
+            project_id: UUID of the project
+            order: Order value chosen by the caller
+
+        Raises:
+            ValueError: If project not found
+        """
+        try:
+            self.db.execute(_reserve_order_stmt(project_id, order))
+        except IntegrityError:
+            self.db.rollback()
             raise ValueError(f"Project with id {project_id} not found")
-        return project
 
     def create(self, data: FeatureCreate) -> Feature:
         """
@@ -108,23 +365,16 @@ class FeatureService:
         Raises:
             ValueError: If project not found
         """
-        self._verify_project_exists(data.project_id)
-
         # Calculate order if not explicitly provided or is default
         order = data.order
         if order == 0:
-            order = self._get_next_order(data.project_id)
-
-        feature = Feature(
-            name=data.name,
-            description=data.description,
-            project_id=data.project_id,
-            status=FeatureStatus.PENDING,
-            order=order,
-        )
+            order = self._allocate_orders(data.project_id, 1)
+        else:
+            self._reserve_order(data.project_id, order)
+
+        feature = _new_feature(data.project_id, data, order)
         self.db.add(feature)
         self.db.commit()
-        self.db.refresh(feature)
         return feature
 
     def create_many(
@@ -145,35 +395,26 @@ class FeatureService:
         Raises:
             ValueError: If project not found
         """
-        self._verify_project_exists(project_id)
-
-        # Get starting order
-        next_order = self._get_next_order(project_id)
-
-        created_features: list[Feature] = []
-        for i, data in enumerate(features):
-            feature = Feature(
-                name=data.name,
-                description=data.description,
-                project_id=project_id,
-                status=FeatureStatus.PENDING,
-                order=next_order + i,
-            )
-            self.db.add(feature)
-            created_features.append(feature)
+        # Allocate the whole block of orders in one statement
+        next_order = self._allocate_orders(project_id, len(features))
 
+        # One INSERT ... RETURNING per batch; no per-row refresh needed
+        result = self.db.scalars(
+            _bulk_insert_stmt(),
+            _bulk_insert_rows(project_id, features, next_order),
+        )
+        created_features = sorted(result, key=lambda feature: feature.order)
         self.db.commit()
-
-        # Refresh all features to get generated fields
-        for feature in created_features:
-            self.db.refresh(feature)
-
         return created_features
 
     def update(self, feature_id: UUID, data: FeatureUpdate) -> Feature | None:
         """
         Update an existing feature.
 
+        Issues a single UPDATE ... RETURNING, and moves the project's
+        order counter past an explicitly set order so later creates do
+        not reuse it.
+
         Args:
             feature_id: UUID of the feature to update
             data: Feature update data (only provided fields will be updated)
@@ -181,36 +422,67 @@ class FeatureService:
         Returns:
             Updated feature if found, None otherwise
         """
-        feature = self.db.query(Feature).filter(Feature.id == feature_id).first()
-        if feature is None:
-            return None
-
         # Update only provided fields
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(feature, field, value)
+        if not update_data:
+            return self.db.scalar(_get_plain_stmt(feature_id))
 
+        feature = self.db.scalar(_update_stmt(feature_id, update_data))
+        if feature is not None and update_data.get("order") is not None:
+            self._reserve_order(feature.project_id, update_data["order"])
+        self.cache.announce(self.db, Feature, [feature_id])
         self.db.commit()
-        self.db.refresh(feature)
+        self.cache.invalidate(Feature, [feature_id])
         return feature
 
+    def update_with_pbi_count(
+        self, feature_id: UUID, data: FeatureUpdate
+    ) -> tuple[Feature, int] | None:
+        """
+        Update an existing feature and return it with its PBI count.
+
+        Issues a single UPDATE ... RETURNING that includes the count, and
+        moves the project's order counter past an explicitly set order.
+
+        Args:
+            feature_id: UUID of the feature to update
+            data: Feature update data (only provided fields will be updated)
+
+        Returns:
+            (updated feature, pbi_count) if found, None otherwise
+        """
+        update_data = data.model_dump(exclude_unset=True)
+        if not update_data:
+            return self.get_with_pbi_count(feature_id)
+
+        result = self.db.execute(
+            _update_with_pbi_count_stmt(feature_id, update_data)
+        )
+        row = result.first()
+        if row is not None and update_data.get("order") is not None:
+            self._reserve_order(row[0].project_id, update_data["order"])
+        self.cache.announce(self.db, Feature, [feature_id])
+        self.db.commit()
+        self.cache.invalidate(Feature, [feature_id])
+        return None if row is None else (row[0], row[1])
+
     def delete(self, feature_id: UUID) -> bool:
         """
         Delete a feature by ID.
 
+        A single DELETE; the database cascades to the feature's PBIs.
+
         Args:
             feature_id: UUID of the feature to delete
 
         Returns:
             True if deleted, False if not found
         """
-        feature = self.db.query(Feature).filter(Feature.id == feature_id).first()
-        if feature is None:
-            return False
-
-        self.db.delete(feature)
+        result = self.db.execute(_delete_stmt(feature_id))
+        self.cache.announce(self.db, Feature, [feature_id])
         self.db.commit()
-        return True
+        self.cache.invalidate(Feature, [feature_id])
+        return result.rowcount > 0
 
     def update_status(
         self, feature_id: UUID, status: FeatureStatus
@@ -227,11 +499,322 @@ class FeatureService:
         Returns:
             Updated feature if found, None otherwise
         """
-        feature = self.db.query(Feature).filter(Feature.id == feature_id).first()
-        if feature is None:
-            return None
-
-        feature.status = status
+        feature = self.db.scalar(
+            _update_stmt(feature_id, {"status": status})
+        )
+        self.cache.announce(self.db, Feature, [feature_id])
         self.db.commit()
-        self.db.refresh(feature)
+        self.cache.invalidate(Feature, [feature_id])
+        return feature
+
+
+class AsyncFeatureService:
+    """Async service class for Feature operations."""
+
+    def __init__(
+        self, db: AsyncSession, cache: EntityCache | None = None
+    ) -> None:
+        """
+        Initialize the service with an async database session.
+
+        Args:
+            db: SQLAlchemy async database session
+            cache: Entity cache, the configured one by default
+        """
+        self.db = db
+        self.cache = cache or get_entity_cache()
+
+    async def list_by_project(self, project_id: UUID) -> list[Feature]:
+        """
+        Retrieve all features for a project.
+
+        Args:
+            project_id: UUID of the project
+
+        Returns:
+            List of features ordered by order field, then created_at
+        """
+        result = await self.db.scalars(_list_by_project_stmt(project_id))
+        return list(result.unique())
+
+    async def get_by_id(self, feature_id: UUID) -> Feature | None:
+        """
+        Retrieve a feature by its ID.
+
+        Args:
+            feature_id: UUID of the feature to retrieve
+
+        Returns:
+            Feature if found, None otherwise
+        """
+        result = await self.db.scalars(_get_by_id_stmt(feature_id))
+        return result.unique().first()
+
+    async def list_by_project_with_pbi_counts(
+        self, project_id: UUID, limit: int, after: str | None = None
+    ) -> tuple[list[tuple[Feature, int]], str | None]:
+        """
+        Retrieve a page of a project's features together with their PBI counts.
+
+        Counts are computed in the same query, so PBIs are not loaded.
+        Pages are keyed on (order, created_at, id), ascending.
+
+        Args:
+            project_id: UUID of the project
+            limit: Maximum number of features to return
+            after: Cursor returned with the previous page
+
+        Returns:
+            (list of (feature, pbi_count) tuples, next page cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _list_with_pbi_counts_stmt(project_id, limit, after)
+        result = await self.db.execute(stmt)
+        rows = [(feature, count) for feature, count in result]
+        return paginate(rows, limit, _feature_sort_key)
+
+    async def get_with_pbi_count(
+        self, feature_id: UUID
+    ) -> tuple[Feature, int] | None:
+        """
+        Retrieve a feature by its ID together with its PBI count.
+
+        The row comes from the entity cache if present, count included.
+
+        Args:
+            feature_id: UUID of the feature to retrieve
+
+        Returns:
+            (feature, pbi_count) if found, None otherwise; a cached
+            feature is detached, with only its columns loaded
+        """
+
+        async def load() -> Sequence[Any] | None:
+            result = await self.db.execute(_get_with_pbi_count_stmt(feature_id))
+            return result.first()
+
+        row = await self.cache.read_through_async(Feature, feature_id, load)
+        return None if row is None else (row[0], row[1])
+
+    async def list_by_project_version(
+        self, project_id: UUID, limit: int, after: str | None = None
+    ) -> tuple[tuple[tuple[UUID, datetime, int], ...], bool]:
+        """
+        Retrieve the version of a page of a project's feature list.
+
+        Reads the same page as list_by_project_with_pbi_counts, but only
+        the key, updated_at and PBI count of each feature on it.
+        Answers conditional GETs without reading the page itself.
+
+        Args:
+            project_id: UUID of the project
+            limit: Maximum number of features on the page
+            after: Cursor from the previous page
+
+        Returns:
+            ((id, updated_at, pbi_count) of each feature on the page,
+            whether another page follows)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _list_by_project_version_stmt(project_id, limit, after)
+        rows = (await self.db.execute(stmt)).all()
+        return tuple(tuple(row) for row in rows[:limit]), len(rows) > limit
+
+    async def _allocate_orders(self, project_id: UUID, count: int) -> int:
+        """
+        Allocate a contiguous block of order values for a project.
+
+        Args:
+            project_id: UUID of the project
+            count: Number of order values to allocate
+
+        Returns:
+            First order value of the block
+
+        Raises:
+            ValueError: If project not found
+        """
+        try:
+            stmt = _allocate_orders_stmt(project_id, count)
+            return await self.db.scalar(stmt)
+        except IntegrityError:
+            await self.db.rollback()
+            raise ValueError(f"Project with id {project_id} not found")
+
+    async def _reserve_order(self, project_id: UUID, order: int) -> None:
+        """
+        Keep future allocations above an explicitly chosen order value.
+
+        Args:
+            project_id: UUID of the project
+            order: Order value chosen by the caller
+
+        Raises:
+            ValueError: If project not found
+        """
+        try:
+            await self.db.execute(_reserve_order_stmt(project_id, order))
+        except IntegrityError:
+            await self.db.rollback()
+            raise ValueError(f"Project with id {project_id} not found")
+
+    async def create(self, data: FeatureCreate) -> Feature:
+        """
+        Create a new feature.
+
+        Args:
+            data: Feature creation data
+
+        Returns:
+            The newly created feature
+
+        Raises:
+            ValueError: If project not found
+        """
+        # Calculate order if not explicitly provided or is default
+        order = data.order
+        if order == 0:
+            order = await self._allocate_orders(data.project_id, 1)
+        else:
+            await self._reserve_order(data.project_id, order)
+
+        feature = _new_feature(data.project_id, data, order)
+        self.db.add(feature)
+        await self.db.commit()
+        return feature
+
+    async def create_many(
+        self, project_id: UUID, features: list[FeatureCreate]
+    ) -> list[Feature]:
+        """
+        Bulk create features for a project.
+
+        Useful for when Manager Agent generates multiple features at once.
+
+        Args:
+            project_id: UUID of the project
+            features: List of feature creation data
+
+        Returns:
+            List of created features
+
+        Raises:
+            ValueError: If project not found
+        """
+        # Allocate the whole block of orders in one statement
+        next_order = await self._allocate_orders(project_id, len(features))
+
+        # One INSERT ... RETURNING per batch; no per-row refresh needed
+        result = await self.db.scalars(
+            _bulk_insert_stmt(),
+            _bulk_insert_rows(project_id, features, next_order),
+        )
+        created_features = sorted(result, key=lambda feature: feature.order)
+        await self.db.commit()
+        return created_features
+
+    async def update(
+        self, feature_id: UUID, data: FeatureUpdate
+    ) -> Feature | None:
+        """
+        Update an existing feature.
+
+        Issues a single UPDATE ... RETURNING, and moves the project's
+        order counter past an explicitly set order so later creates do
+        not reuse it.
+
+        Args:
+            feature_id: UUID of the feature to update
+            data: Feature update data (only provided fields will be updated)
+
+        Returns:
+            Updated feature if found, None otherwise
+        """
+        # Update only provided fields
+        update_data = data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.db.scalar(_get_plain_stmt(feature_id))
+
+        feature = await self.db.scalar(_update_stmt(feature_id, update_data))
+        if feature is not None and update_data.get("order") is not None:
+            await self._reserve_order(feature.project_id, update_data["order"])
+        await self.cache.announce_async(self.db, Feature, [feature_id])
+        await self.db.commit()
+        await self.cache.invalidate_async(Feature, [feature_id])
+        return feature
+
+    async def update_with_pbi_count(
+        self, feature_id: UUID, data: FeatureUpdate
+    ) -> tuple[Feature, int] | None:
+        """
+        Update an existing feature and return it with its PBI count.
+
+        Issues a single UPDATE ... RETURNING that includes the count, and
+        moves the project's order counter past an explicitly set order.
+
+        Args:
+            feature_id: UUID of the feature to update
+            data: Feature update data (only provided fields will be updated)
+
+        Returns:
+            (updated feature, pbi_count) if found, None otherwise
+        """
+        update_data = data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get_with_pbi_count(feature_id)
+
+        result = await self.db.execute(
+            _update_with_pbi_count_stmt(feature_id, update_data)
+        )
+        row = result.first()
+        if row is not None and update_data.get("order") is not None:
+            await self._reserve_order(row[0].project_id, update_data["order"])
+        await self.cache.announce_async(self.db, Feature, [feature_id])
+        await self.db.commit()
+        await self.cache.invalidate_async(Feature, [feature_id])
+        return None if row is None else (row[0], row[1])
+
+    async def delete(self, feature_id: UUID) -> bool:
+        """
+        Delete a feature by ID.
+
+        A single DELETE; the database cascades to the feature's PBIs.
+
+        Args:
+            feature_id: UUID of the feature to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        result = await self.db.execute(_delete_stmt(feature_id))
+        await self.cache.announce_async(self.db, Feature, [feature_id])
+        await self.db.commit()
+        await self.cache.invalidate_async(Feature, [feature_id])
+        return result.rowcount > 0
+
+    async def update_status(
+        self, feature_id: UUID, status: FeatureStatus
+    ) -> Feature | None:
+        """
+        Update only the status of a feature.
+
+        Convenience method for status transitions.
+
+        Args:
+            feature_id: UUID of the feature
+            status: New status value
+
+        Returns:
+            Updated feature if found, None otherwise
+        """
+        feature = await self.db.scalar(
+            _update_stmt(feature_id, {"status": status})
+        )
+        await self.cache.announce_async(self.db, Feature, [feature_id])
+        await self.db.commit()
+        await self.cache.invalidate_async(Feature, [feature_id])
         return feature
@@ -0,0 +1,125 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is the sort key of the last row on a page, JSON-encoded and
+base64url'd so clients treat it as opaque. The next page is selected with
+a row-value comparison against that key, which the matching composite
+index serves as a range scan no matter how deep the client has paged.
+
+Usage:
+    after_key = decode_cursor(after, datetime, UUID) if after else None
+    rows = ...  # query with .limit(limit + 1)
+    page, next_cursor = paginate(rows, limit, lambda r: (r.created_at, r.id))
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+RowT = TypeVar("RowT")
+
+CursorValue = datetime | UUID | int
+
+
+def _decode_datetime(value: Any) -> datetime:
+    if not isinstance(value, str):
+        raise ValueError
+    decoded = datetime.fromisoformat(value)
+    # Timestamp columns are naive UTC and cursors are written that way
+    if decoded.tzinfo is not None:
+        raise ValueError
+    return decoded
+
+
+def _decode_uuid(value: Any) -> UUID:
+    if not isinstance(value, str):
+        raise ValueError
+    return UUID(value)
+
+
+def _decode_int(value: Any) -> int:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError
+    return value
+
+
+# Decoders for the value types allowed in a cursor; each rejects values
+# of any other JSON type.
+_DECODERS: dict[type, Callable[[Any], CursorValue]] = {
+    datetime: _decode_datetime,
+    UUID: _decode_uuid,
+    int: _decode_int,
+}
+
+
+def _encode_value(value: CursorValue) -> str | int:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: CursorValue) -> str:
+    """
+    Encode a sort key as an opaque cursor string.
+
+    Args:
+        values: Sort key values of the last row on a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [_encode_value(value) for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple[Any, ...]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+        types: Expected type of each sort key value
+
+    Returns:
+        Tuple of decoded sort key values
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match types
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError
+        return tuple(_DECODERS[t](value) for t, value in zip(types, payload))
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def paginate(
+    rows: Sequence[RowT],
+    limit: int,
+    key: Callable[[RowT], tuple[CursorValue, ...]],
+) -> tuple[list[RowT], str | None]:
+    """
+    Split a limit + 1 result into a page and the cursor for the next one.
+
+    Args:
+        rows: Rows fetched with LIMIT limit + 1
+        limit: Requested page size
+        key: Returns the sort key of a row
+
+    Returns:
+        (page rows, next cursor or None if this is the last page)
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit:
+        return page, None
+    return page, encode_cursor(*key(page[-1]))
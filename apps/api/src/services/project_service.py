@@ -3,26 +3,152 @@ Project service for business logic operations.
 
 This service handles all CRUD operations and business logic
 for Project resources.
+
+ProjectService works on a sync Session and AsyncProjectService on an
+AsyncSession. Both build their queries from the same statement helpers.
+
+Projects read by ID go through the entity cache (src/services/cache.py);
+writes drop the entries they touch once committed, in every worker.
 """
 
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session, joinedload
-from src.models import Project, ProjectStatus
+from sqlalchemy import (Delete, Label, Select, Update, delete, func, select,
+                        tuple_, update)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+from src.models import Feature, Project, ProjectStatus
 from src.schemas.project import ProjectCreate, ProjectUpdate
+from src.services.cache import EntityCache, get_entity_cache
+from src.services.pagination import decode_cursor, paginate
+
+# =============================================================================
+# Statements
+# =============================================================================
+
+
+def _list_all_stmt() -> Select[tuple[Project]]:
+    return select(Project).order_by(Project.created_at.desc())
+
+
+def _feature_count_expr() -> Label[int]:
+    # Correlated count per row; the features relationship is never loaded.
+    return (
+        select(func.count(Feature.id))
+        .where(Feature.project_id == Project.id)
+        .correlate(Project)
+        .scalar_subquery()
+        .label("feature_count")
+    )
+
+
+def _list_with_feature_counts_stmt(
+    limit: int, after: str | None
+) -> Select[tuple[Project, int]]:
+    stmt = (
+        select(Project, _feature_count_expr())
+        .order_by(Project.created_at.desc(), Project.id.desc())
+        .limit(limit + 1)
+    )
+    if after is not None:
+        created_at, project_id = decode_cursor(after, datetime, UUID)
+        stmt = stmt.where(
+            tuple_(Project.created_at, Project.id) < (created_at, project_id)
+        )
+    return stmt
+
+
+def _project_sort_key(row: tuple[Project, int]) -> tuple[datetime, UUID]:
+    return row[0].created_at, row[0].id
+
+
+def _get_by_id_stmt(project_id: UUID) -> Select[tuple[Project]]:
+    return select(Project).where(Project.id == project_id)
+
+
+def _list_version_stmt(
+    limit: int, after: str | None
+) -> Select[tuple[UUID, datetime, int]]:
+    # The same page as the list (order, cursor and limit), reduced to
+    # what can change in an item
+    return _list_with_feature_counts_stmt(limit, after).with_only_columns(
+        Project.id, Project.updated_at, _feature_count_expr()
+    )
+
+
+def _feature_ids_stmt(project_id: UUID) -> Select[tuple[UUID]]:
+    return select(Feature.id).where(Feature.project_id == project_id)
+
+
+def _update_stmt(project_id: UUID, values: dict[str, Any]) -> Update:
+    # Single round trip: the trigger sets updated_at, RETURNING hands back
+    # the whole row, and no row means the project does not exist.
+    return (
+        update(Project)
+        .where(Project.id == project_id)
+        .values(**values)
+        .returning(Project)
+    )
+
+
+def _delete_stmt(project_id: UUID) -> Delete:
+    # Features, PBIs and logs go with it via ON DELETE CASCADE; nothing
+    # is loaded.
+    return (
+        delete(Project)
+        .where(Project.id == project_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _get_with_features_stmt(project_id: UUID) -> Select[tuple[Project]]:
+    return (
+        select(Project)
+        .options(joinedload(Project.features))
+        .where(Project.id == project_id)
+    )
+
+
+def _get_tree_stmt(project_id: UUID) -> Select[tuple[Project]]:
+    # One query per level, whatever the number of features and PBIs:
+    # the project, then its features and then all their PBIs by IN.
+    return (
+        select(Project)
+        .options(selectinload(Project.features).selectinload(Feature.pbis))
+        .where(Project.id == project_id)
+    )
+
+
+def _new_project(data: ProjectCreate) -> Project:
+    return Project(
+        name=data.name, # pyright: ignore[reportCallIssue] known SQLAlchemy + Pylance quirk. The code is correct and works.
+        epic=data.epic, # pyright: ignore[reportCallIssue] known SQLAlchemy + Pylance quirk. The code is correct and works.
+        type=data.type, # pyright: ignore[reportCallIssue] known SQLAlchemy + Pylance quirk. The code is correct and works.
+        status=ProjectStatus.DRAFT, # pyright: ignore[reportCallIssue] known SQLAlchemy + Pylance quirk. The code is correct and works.
+    )
+
+
+# =============================================================================
+# Services
+# =============================================================================
 
 
 class ProjectService:
     """Service class for Project operations."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, cache: EntityCache | None = None) -> None:
         """
         Initialize the service with a database session.
 
         Args:
             db: SQLAlchemy database session
+            cache: Entity cache, the configured one by default
         """
         self.db = db
+        self.cache = cache or get_entity_cache()
 
     def list_all(self) -> list[Project]:
         """
@@ -31,23 +157,73 @@ class ProjectService:
         Returns:
             List of all projects, newest first
         """
-        return (
-            self.db.query(Project)
-            .order_by(Project.created_at.desc())
-            .all()
-        )
+        return list(self.db.scalars(_list_all_stmt()))
+
+    def list_with_feature_counts(
+        self, limit: int, after: str | None = None
+    ) -> tuple[list[tuple[Project, int]], str | None]:
+        """
+        Retrieve a page of projects together with their feature counts.
+
+        Counts are computed in the same query, so features are not loaded.
+        Pages are keyed on (created_at, id), newest first.
+
+        Args:
+            limit: Maximum number of projects to return
+            after: Cursor returned with the previous page
+
+        Returns:
+            (list of (project, feature_count) tuples, next page cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _list_with_feature_counts_stmt(limit, after)
+        result = self.db.execute(stmt)
+        rows = [(project, count) for project, count in result]
+        return paginate(rows, limit, _project_sort_key)
 
     def get_by_id(self, project_id: UUID) -> Project | None:
         """
-        Retrieve a project by its ID.
+        Retrieve a project by its ID, from the entity cache if present.
 
         Args:
             project_id: UUID of the project to retrieve
 
         Returns:
-            Project if found, None otherwise
+            Project if found, None otherwise; a cached project is
+            detached, with only its columns loaded
+        """
+        row = self.cache.read_through(
+            Project,
+            project_id,
+            lambda: self.db.execute(_get_by_id_stmt(project_id)).first(),
+        )
+        return None if row is None else row[0]
+
+    def list_version(
+        self, limit: int, after: str | None = None
+    ) -> tuple[tuple[tuple[UUID, datetime, int], ...], bool]:
+        """
+        Retrieve the version of a page of the project list.
+
+        Reads the same page as list_with_feature_counts, but only the
+        key, updated_at and feature count of each project on it.
+        Answers conditional GETs without reading the page itself.
+
+        Args:
+            limit: Maximum number of projects on the page
+            after: Cursor from the previous page
+
+        Returns:
+            ((id, updated_at, feature_count) of each project on the
+            page, whether another page follows)
+
+        Raises:
+            ValueError: If the cursor is invalid
         """
-        return self.db.query(Project).filter(Project.id == project_id).first()
+        rows = self.db.execute(_list_version_stmt(limit, after)).all()
+        return tuple(tuple(row) for row in rows[:limit]), len(rows) > limit
 
     def create(self, data: ProjectCreate) -> Project:
         """
@@ -59,21 +235,17 @@ class ProjectService:
         Returns:
             The newly created project
         """
-        project = Project(
-            name=data.name, # pyright: ignore[reportCallIssue] known SQLAlchemy + Pylance quirk. The code is correct and works.
-            epic=data.epic, # pyright: ignore[reportCallIssue] known SQLAlchemy + Pylance quirk. The code is correct and works.
-            type=data.type, # pyright: ignore[reportCallIssue] known SQLAlchemy + Pylance quirk. The code is correct and works.
-            status=ProjectStatus.DRAFT, # pyright: ignore[reportCallIssue] known SQLAlchemy + Pylance quirk. The code is correct and works.
-        )
+        project = _new_project(data)
         self.db.add(project)
         self.db.commit()
-        self.db.refresh(project)
         return project
 
     def update(self, project_id: UUID, data: ProjectUpdate) -> Project | None:
         """
         Update an existing project.
 
+        Issues a single UPDATE ... RETURNING.
+
         Args:
             project_id: UUID of the project to update
             data: Project update data (only provided fields will be updated)
@@ -81,36 +253,43 @@ class ProjectService:
         Returns:
             Updated project if found, None otherwise
         """
-        project = self.get_by_id(project_id)
-        if project is None:
-            return None
-
         # Update only provided fields
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(project, field, value)
+        if not update_data:
+            return self.get_by_id(project_id)
 
+        project = self.db.scalar(_update_stmt(project_id, update_data))
+        self.cache.announce(self.db, Project, [project_id])
         self.db.commit()
-        self.db.refresh(project)
+        self.cache.invalidate(Project, [project_id])
         return project
 
     def delete(self, project_id: UUID) -> bool:
         """
         Delete a project by ID.
 
+        A single DELETE; the database cascades to features, PBIs and logs.
+        With the entity cache enabled, the IDs of the features are read
+        first so their entries can be dropped too.
+
         Args:
             project_id: UUID of the project to delete
 
         Returns:
             True if deleted, False if not found
         """
-        project = self.get_by_id(project_id)
-        if project is None:
-            return False
-
-        self.db.delete(project)
+        feature_ids = (
+            list(self.db.scalars(_feature_ids_stmt(project_id)))
+            if self.cache.enabled
+            else []
+        )
+        result = self.db.execute(_delete_stmt(project_id))
+        self.cache.announce(self.db, Project, [project_id])
+        self.cache.announce(self.db, Feature, feature_ids)
         self.db.commit()
-        return True
+        self.cache.invalidate(Project, [project_id])
+        self.cache.invalidate(Feature, feature_ids)
+        return result.rowcount > 0
 
     def get_with_features(self, project_id: UUID) -> Project | None:
         """
@@ -123,8 +302,210 @@ class ProjectService:
             Project with features loaded if found, None otherwise
         """
         return (
-            self.db.query(Project)
-            .options(joinedload(Project.features))
-            .filter(Project.id == project_id)
+            self.db.scalars(_get_with_features_stmt(project_id))
+            .unique()
             .first()
         )
+
+    def get_tree(self, project_id: UUID) -> Project | None:
+        """
+        Retrieve a project with its features and their PBIs.
+
+        Issues three queries regardless of the size of the project.
+
+        Args:
+            project_id: UUID of the project to retrieve
+
+        Returns:
+            Project with features and PBIs loaded, in order, if found,
+            None otherwise
+        """
+        return self.db.scalars(_get_tree_stmt(project_id)).first()
+
+
+class AsyncProjectService:
+    """Async service class for Project operations."""
+
+    def __init__(
+        self, db: AsyncSession, cache: EntityCache | None = None
+    ) -> None:
+        """
+        Initialize the service with an async database session.
+
+        Args:
+            db: SQLAlchemy async database session
+            cache: Entity cache, the configured one by default
+        """
+        self.db = db
+        self.cache = cache or get_entity_cache()
+
+    async def list_all(self) -> list[Project]:
+        """
+        Retrieve all projects ordered by creation date.
+
+        Returns:
+            List of all projects, newest first
+        """
+        return list(await self.db.scalars(_list_all_stmt()))
+
+    async def list_with_feature_counts(
+        self, limit: int, after: str | None = None
+    ) -> tuple[list[tuple[Project, int]], str | None]:
+        """
+        Retrieve a page of projects together with their feature counts.
+
+        Counts are computed in the same query, so features are not loaded.
+        Pages are keyed on (created_at, id), newest first.
+
+        Args:
+            limit: Maximum number of projects to return
+            after: Cursor returned with the previous page
+
+        Returns:
+            (list of (project, feature_count) tuples, next page cursor)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        stmt = _list_with_feature_counts_stmt(limit, after)
+        result = await self.db.execute(stmt)
+        rows = [(project, count) for project, count in result]
+        return paginate(rows, limit, _project_sort_key)
+
+    async def get_by_id(self, project_id: UUID) -> Project | None:
+        """
+        Retrieve a project by its ID, from the entity cache if present.
+
+        Args:
+            project_id: UUID of the project to retrieve
+
+        Returns:
+            Project if found, None otherwise; a cached project is
+            detached, with only its columns loaded
+        """
+
+        async def load() -> Sequence[Any] | None:
+            return (await self.db.execute(_get_by_id_stmt(project_id))).first()
+
+        row = await self.cache.read_through_async(Project, project_id, load)
+        return None if row is None else row[0]
+
+    async def list_version(
+        self, limit: int, after: str | None = None
+    ) -> tuple[tuple[tuple[UUID, datetime, int], ...], bool]:
+        """
+        Retrieve the version of a page of the project list.
+
+        Reads the same page as list_with_feature_counts, but only the
+        key, updated_at and feature count of each project on it.
+        Answers conditional GETs without reading the page itself.
+
+        Args:
+            limit: Maximum number of projects on the page
+            after: Cursor from the previous page
+
+        Returns:
+            ((id, updated_at, feature_count) of each project on the
+            page, whether another page follows)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        rows = (await self.db.execute(_list_version_stmt(limit, after))).all()
+        return tuple(tuple(row) for row in rows[:limit]), len(rows) > limit
+
+    async def create(self, data: ProjectCreate) -> Project:
+        """
+        Create a new project.
+
+        Args:
+            data: Project creation data
+
+        Returns:
+            The newly created project
+        """
+        project = _new_project(data)
+        self.db.add(project)
+        await self.db.commit()
+        return project
+
+    async def update(
+        self, project_id: UUID, data: ProjectUpdate
+    ) -> Project | None:
+        """
+        Update an existing project.
+
+        Issues a single UPDATE ... RETURNING.
+
+        Args:
+            project_id: UUID of the project to update
+            data: Project update data (only provided fields will be updated)
+
+        Returns:
+            Updated project if found, None otherwise
+        """
+        # Update only provided fields
+        update_data = data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get_by_id(project_id)
+
+        project = await self.db.scalar(_update_stmt(project_id, update_data))
+        await self.cache.announce_async(self.db, Project, [project_id])
+        await self.db.commit()
+        await self.cache.invalidate_async(Project, [project_id])
+        return project
+
+    async def delete(self, project_id: UUID) -> bool:
+        """
+        Delete a project by ID.
+
+        A single DELETE; the database cascades to features, PBIs and logs.
+        With the entity cache enabled, the IDs of the features are read
+        first so their entries can be dropped too.
+
+        Args:
+            project_id: UUID of the project to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        feature_ids = (
+            list(await self.db.scalars(_feature_ids_stmt(project_id)))
+            if self.cache.enabled
+            else []
+        )
+        result = await self.db.execute(_delete_stmt(project_id))
+        await self.cache.announce_async(self.db, Project, [project_id])
+        await self.cache.announce_async(self.db, Feature, feature_ids)
+        await self.db.commit()
+        await self.cache.invalidate_async(Project, [project_id])
+        await self.cache.invalidate_async(Feature, feature_ids)
+        return result.rowcount > 0
+
+    async def get_with_features(self, project_id: UUID) -> Project | None:
+        """
+        Retrieve a project with its features eagerly loaded.
+
+        Args:
+            project_id: UUID of the project to retrieve
+
+        Returns:
+            Project with features loaded if found, None otherwise
+        """
+        result = await self.db.scalars(_get_with_features_stmt(project_id))
+        return result.unique().first()
+
+    async def get_tree(self, project_id: UUID) -> Project | None:
+        """
+        Retrieve a project with its features and their PBIs.
+
+        Issues three queries regardless of the size of the project.
+
+        Args:
+            project_id: UUID of the project to retrieve
+
+        Returns:
+            Project with features and PBIs loaded, in order, if found,
+            None otherwise
+        """
+        return (await self.db.scalars(_get_tree_stmt(project_id))).first()
@@ -0,0 +1,36 @@
+"""
+Shared fixtures for the API tests.
+
+The tests run against the PostgreSQL database in DATABASE_URL, migrated
+to head (make migrate). Each test that writes gets a project of its own,
+deleted afterwards together with everything in it.
+"""
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy.orm import Session
+from src.database import SessionLocal
+from src.models import Project
+from src.schemas.project import ProjectCreate
+from src.services.project_service import ProjectService
+
+
+@pytest.fixture
+def db() -> Iterator[Session]:
+    """Sync session, closed after the test."""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def project(db: Session) -> Iterator[Project]:
+    """A fresh project, deleted (with its features, PBIs and logs) afterwards."""
+    service = ProjectService(db)
+    project = service.create(ProjectCreate(name="test", epic="Test project"))
+    yield project
+    db.rollback()
+    service.delete(project.id)
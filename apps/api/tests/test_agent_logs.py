@@ -0,0 +1,266 @@
+"""
+Agent log ingestion: COPY in both formats, POST /logs/batch and the
+per-project write lock.
+
+The sync service writes with COPY in CSV, the async one with asyncpg's
+binary COPY; both must read back exactly what was sent.
+"""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+from src.config import get_settings
+from src.database import SessionLocal
+from src.main import app
+from src.models import PBI, AgentLog, Project
+from src.models.enums import AgentMessageType, PBIStatus, PBIType
+from src.schemas.agent_log import AgentLogCreate
+from src.schemas.feature import FeatureCreate
+from src.schemas.project import ProjectCreate
+from src.services.agent_log_service import (AgentLogService,
+                                            AsyncAgentLogService)
+from src.services.feature_service import FeatureService
+from src.services.project_service import ProjectService
+
+API = "/api/v1"
+
+# Values CSV has to quote or escape, and a few that binary COPY encodes
+CONTENTS = [
+    "plain",
+    'quoted "text", with commas',
+    "line one\nline two\r\nline three",
+    "back\\slash and \\N and \\x00ff",
+    "ünïcödé ✓ 🚀",
+    " ",
+]
+
+EXTRA_DATA: list[dict[str, Any] | None] = [
+    {},
+    None,
+    {"nested": {"list": [1, 2.5, None, True]}, "text": 'a "b", c\n'},
+]
+
+
+@pytest.fixture(scope="module")
+def http() -> Iterator[TestClient]:
+    with TestClient(app) as client:
+        yield client
+
+
+def _pbi(db: Session, project: Project) -> PBI:
+    feature = FeatureService(db).create(
+        FeatureCreate(project_id=project.id, name="f", description="d")
+    )
+    pbi = PBI(
+        feature_id=feature.id,
+        title="p",
+        description="d",
+        type=PBIType.BACKEND,
+        status=PBIStatus.PENDING,
+        order=0,
+    )
+    db.add(pbi)
+    db.commit()
+    return pbi
+
+
+def _logs(project_id: UUID, pbi_id: UUID | None) -> list[AgentLogCreate]:
+    return [
+        AgentLogCreate(
+            project_id=project_id,
+            pbi_id=pbi_id if i % 2 else None,
+            agent_name=f"agent, {i}",
+            message_type=list(AgentMessageType)[i % len(AgentMessageType)],
+            content=content,
+            extra_data=EXTRA_DATA[i % len(EXTRA_DATA)],
+        )
+        for i, content in enumerate(CONTENTS)
+    ]
+
+
+def _log(project_id: UUID, content: str) -> AgentLogCreate:
+    return AgentLogCreate(
+        project_id=project_id,
+        agent_name="dev",
+        message_type=AgentMessageType.ACTION,
+        content=content,
+    )
+
+
+def _fields(log: AgentLog | AgentLogCreate) -> tuple[Any, ...]:
+    return (
+        log.project_id,
+        log.pbi_id,
+        log.agent_name,
+        log.message_type,
+        log.content,
+        log.extra_data,
+    )
+
+
+def _count(db: Session, project_id: UUID) -> int:
+    return db.scalar(select(func.count()).where(AgentLog.project_id == project_id))
+
+
+async def _create_async(logs: list[AgentLogCreate]) -> int:
+    engine = create_async_engine(get_settings().async_database_url)
+    try:
+        async with async_sessionmaker(engine)() as session:
+            return await AsyncAgentLogService(session).create_many(logs)
+    finally:
+        await engine.dispose()
+
+
+# =============================================================================
+# COPY
+# =============================================================================
+
+
+@pytest.mark.parametrize("copy_format", ["csv", "binary"])
+def test_copy_round_trip(db: Session, project: Project, copy_format: str) -> None:
+    logs = _logs(project.id, _pbi(db, project).id)
+
+    if copy_format == "csv":
+        written = AgentLogService(db).create_many(logs)
+    else:
+        written = asyncio.run(_create_async(logs))
+
+    assert written == len(logs)
+    stored, _ = AgentLogService(db).list_by_project(project.id, 100)
+    assert [_fields(log) for log in stored] == [_fields(log) for log in logs]
+
+
+@pytest.mark.parametrize("copy_format", ["csv", "binary"])
+def test_copy_missing_pbi_writes_nothing(
+    db: Session, project: Project, copy_format: str
+) -> None:
+    logs = _logs(project.id, uuid4())
+
+    with pytest.raises(ValueError):
+        if copy_format == "csv":
+            AgentLogService(db).create_many(logs)
+        else:
+            asyncio.run(_create_async(logs))
+
+    assert _count(db, project.id) == 0
+
+
+# =============================================================================
+# POST /logs/batch
+# =============================================================================
+
+
+def _payload(logs: list[AgentLogCreate]) -> dict[str, Any]:
+    return {"logs": [log.model_dump(mode="json") for log in logs]}
+
+
+def test_batch_endpoint(http: TestClient, db: Session, project: Project) -> None:
+    logs = _logs(project.id, _pbi(db, project).id)
+
+    response = http.post(f"{API}/logs/batch", json=_payload(logs))
+
+    assert response.status_code == 201
+    assert response.json() == {"inserted": len(logs)}
+    assert _count(db, project.id) == len(logs)
+
+
+@pytest.mark.parametrize("field", ["project_id", "pbi_id"])
+def test_batch_with_missing_reference_is_rejected_whole(
+    http: TestClient, db: Session, project: Project, field: str
+) -> None:
+    payload = _payload(_logs(project.id, None))
+    payload["logs"][-1][field] = str(uuid4())
+
+    response = http.post(f"{API}/logs/batch", json=payload)
+
+    assert response.status_code == 404
+    assert _count(db, project.id) == 0
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("content", "before\u0000after"),
+        ("agent_name", "dev\u0000"),
+        ("extra_data", {"key": "value\u0000"}),
+        ("extra_data", {"key\u0000": "value"}),
+        ("extra_data", {"nested": ["ok", {"deep": "\u0000"}]}),
+    ],
+)
+def test_nul_characters_are_rejected(
+    http: TestClient, db: Session, project: Project, field: str, value: Any
+) -> None:
+    payload = _payload(_logs(project.id, None))
+    payload["logs"][0][field] = value
+
+    batch = http.post(f"{API}/logs/batch", json=payload)
+    single = http.post(f"{API}/logs/", json=payload["logs"][0])
+
+    assert batch.status_code == 422
+    assert single.status_code == 422
+    assert "NUL" in batch.text
+    assert _count(db, project.id) == 0
+
+
+# =============================================================================
+# Write lock
+# =============================================================================
+
+
+def test_project_logs_become_visible_in_key_order(
+    db: Session, project: Project
+) -> None:
+    other = ProjectService(db).create(ProjectCreate(name="other", epic="e"))
+    first_committing = threading.Event()
+    release = threading.Event()
+
+    def first() -> None:
+        # Writes, then holds its transaction (and the project's lock) open
+        with SessionLocal() as session:
+            commit = session.commit
+
+            def held_commit() -> None:
+                first_committing.set()
+                release.wait()
+                commit()
+
+            session.commit = held_commit
+            AgentLogService(session).create_many([_log(project.id, "first")])
+
+    def write(project_id: UUID, content: str) -> None:
+        with SessionLocal() as session:
+            AgentLogService(session).create_many([_log(project_id, content)])
+
+    try:
+        with ThreadPoolExecutor(3) as pool:
+            try:
+                held = pool.submit(first)
+                assert first_committing.wait(5)
+                second = pool.submit(write, project.id, "second")
+                # Another project is not held up
+                pool.submit(write, other.id, "other").result(5)
+
+                # The second write waits for the first to commit
+                with pytest.raises(TimeoutError):
+                    second.result(0.3)
+                assert _count(db, project.id) == 0
+            finally:
+                release.set()
+            held.result(5)
+            second.result(5)
+
+        stored, _ = AgentLogService(db).list_by_project(project.id, 10)
+        assert [log.content for log in stored] == ["first", "second"]
+    finally:
+        db.rollback()
+        ProjectService(db).delete(other.id)
+
@@ -0,0 +1,135 @@
+"""
+Cross-worker invalidation of per-worker entity caches.
+
+Each cache stands for one worker: it has a PgListener of its own, and
+only learns about the other's writes through geonosis_invalidate.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import make_url, text
+from sqlalchemy.orm import Session
+from src.config import get_settings
+from src.database import SessionLocal
+from src.models import Project
+from src.pg_listener import PgListener, listener_dsn
+from src.schemas.project import ProjectUpdate
+from src.services.cache import EntityCache, MemoryCache, cache_key
+from src.services.project_service import ProjectService
+
+TTL = 60
+TIMEOUT = 5
+
+
+class Worker:
+    """An entity cache attached to its own LISTEN connection."""
+
+    def __init__(self, name: str) -> None:
+        url = make_url(get_settings().database_url).update_query_dict(
+            {"application_name": name}
+        )
+        self.name = name
+        self.cache = EntityCache(MemoryCache(100), TTL)
+        self.listener = PgListener(listener_dsn(url.render_as_string(False)))
+        self.connects = 0
+        self._connected = asyncio.Event()
+        self.cache.attach(self.listener)
+        self.listener.on_connect(self._on_connect)
+
+    def _on_connect(self) -> None:
+        self.connects += 1
+        self._connected.set()
+
+    async def connected(self) -> None:
+        await asyncio.wait_for(self._connected.wait(), TIMEOUT)
+        self._connected.clear()
+
+    def cached(self, project: Project) -> bool:
+        return self.cache.backend.get(cache_key(Project, project.id)) is not None
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    async with asyncio.timeout(TIMEOUT):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def workers() -> AsyncIterator[tuple[Worker, Worker]]:
+    pair = Worker("cache-test-a"), Worker("cache-test-b")
+    for worker in pair:
+        worker.listener.start()
+    try:
+        for worker in pair:
+            await worker.connected()
+        yield pair
+    finally:
+        for worker in pair:
+            await worker.listener.stop()
+
+
+@pytest.mark.asyncio
+async def test_write_in_one_worker_evicts_in_the_other(
+    db: Session, project: Project, workers: tuple[Worker, Worker]
+) -> None:
+    a, b = workers
+    ProjectService(db, a.cache).get_by_id(project.id)
+    ProjectService(db, b.cache).get_by_id(project.id)
+    assert a.cached(project) and b.cached(project)
+
+    with SessionLocal() as session:
+        ProjectService(session, a.cache).update(
+            project.id, ProjectUpdate(name="renamed")
+        )
+
+    await _until(lambda: not b.cached(project))
+    assert b.cache.stats().notifications == 1
+    db.expire_all()
+    assert ProjectService(db, b.cache).get_by_id(project.id).name == "renamed"
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_write_evicts_nothing(
+    db: Session, project: Project, workers: tuple[Worker, Worker]
+) -> None:
+    a, b = workers
+    ProjectService(db, b.cache).get_by_id(project.id)
+
+    with SessionLocal() as session:
+        a.cache.announce(session, Project, [project.id])
+        session.rollback()
+    # Delivered after anything sent before it, were it ever sent
+    with SessionLocal() as session:
+        session.execute(text("NOTIFY geonosis_invalidate, 'marker'"))
+        session.commit()
+
+    await _until(lambda: b.cache.stats().notifications == 1)
+    assert b.cached(project)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_flushes_the_cache(
+    db: Session, project: Project, workers: tuple[Worker, Worker]
+) -> None:
+    a, b = workers
+    ProjectService(db, a.cache).get_by_id(project.id)
+    ProjectService(db, b.cache).get_by_id(project.id)
+
+    # Drop b's LISTEN connection, as a network failure would
+    db.execute(
+        text(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            "WHERE application_name = :name"
+        ),
+        {"name": b.name},
+    )
+    db.commit()
+    await b.connected()
+
+    assert b.connects == 2
+    assert b.cache.stats().flushes == 2
+    assert not b.cached(project)
+    assert a.cached(project)
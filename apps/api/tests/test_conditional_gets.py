@@ -0,0 +1,169 @@
+"""
+ETags and 304 Not Modified on the polled routes.
+
+A list page's ETag comes either from the page itself or, for requests
+carrying If-None-Match, from the version query; both must agree.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+from src.database import async_engine, engine
+from src.main import app
+from src.models import PBI, Project
+from src.models.enums import PBIStatus, PBIType
+
+API = "/api/v1"
+
+
+@contextmanager
+def _statements() -> Iterator[list[str]]:
+    statements: list[str] = []
+    target = engine if async_engine is None else async_engine.sync_engine
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(target, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "before_cursor_execute", record)
+
+
+@pytest.fixture(scope="module")
+def http() -> Iterator[TestClient]:
+    with TestClient(app) as client:
+        yield client
+
+
+def _features(http: TestClient, project: Project, count: int) -> list[dict]:
+    response = http.post(
+        f"{API}/features/bulk",
+        json={
+            "project_id": str(project.id),
+            "features": [{"name": f"f{i}", "description": "d"} for i in range(count)],
+        },
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def _add_pbi(db: Session, feature_id: str) -> None:
+    db.add(
+        PBI(
+            feature_id=feature_id,
+            title="p",
+            description="d",
+            type=PBIType.BACKEND,
+            status=PBIStatus.PENDING,
+            order=0,
+        )
+    )
+    db.commit()
+
+
+def _revalidate(http: TestClient, path: str, etag: str):
+    return http.get(path, headers={"If-None-Match": etag})
+
+
+@pytest.mark.parametrize("limit", [2, 50])
+def test_feature_list_page(
+    http: TestClient, db: Session, project: Project, limit: int
+) -> None:
+    features = _features(http, project, 3)
+    path = f"{API}/features/project/{project.id}?limit={limit}"
+
+    with _statements() as statements:
+        first = http.get(path)
+    # No If-None-Match: the page alone, its ETag read off it
+    assert len(statements) == 1
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    with _statements() as statements:
+        cached = _revalidate(http, path, etag)
+    # The version query alone
+    assert len(statements) == 1
+    assert (cached.status_code, cached.headers["ETag"], cached.content) == (
+        304,
+        etag,
+        b"",
+    )
+
+    # A new PBI changes a count shown on the page
+    _add_pbi(db, features[0]["id"])
+    changed = _revalidate(http, path, etag)
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()["items"][0]["pbi_count"] == 1
+    assert _revalidate(http, path, changed.headers["ETag"]).status_code == 304
+
+    # So does an edit of an item
+    http.patch(f"{API}/features/{features[1]['id']}", json={"name": "renamed"})
+    assert _revalidate(http, path, changed.headers["ETag"]).status_code == 200
+
+
+def test_feature_list_page_changes_when_a_page_follows(
+    http: TestClient, project: Project
+) -> None:
+    _features(http, project, 2)
+    path = f"{API}/features/project/{project.id}?limit=2"
+    etag = http.get(path).headers["ETag"]
+
+    # Same items, but now with a next page (and a next_cursor)
+    _features(http, project, 1)
+    response = _revalidate(http, path, etag)
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] is not None
+
+
+def test_project_list_page(http: TestClient, project: Project) -> None:
+    path = f"{API}/projects/?limit=200"
+    first = http.get(path)
+    etag = first.headers["ETag"]
+    assert any(item["id"] == str(project.id) for item in first.json()["items"])
+
+    assert _revalidate(http, path, etag).status_code == 304
+    assert _revalidate(http, path, f'"other", {etag}').status_code == 304
+    assert _revalidate(http, path, "*").status_code == 304
+
+    _features(http, project, 1)
+    changed = _revalidate(http, path, etag)
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_invalid_cursor_is_rejected_with_or_without_etag(http: TestClient) -> None:
+    path = f"{API}/projects/?after=garbage"
+    assert http.get(path).status_code == 400
+    assert _revalidate(http, path, 'W/"x"').status_code == 400
+
+
+def test_project(http: TestClient, project: Project) -> None:
+    path = f"{API}/projects/{project.id}"
+    etag = http.get(path).headers["ETag"]
+
+    assert _revalidate(http, path, etag).status_code == 304
+    http.patch(path, json={"name": "renamed"})
+    changed = _revalidate(http, path, etag)
+    assert changed.status_code == 200
+    assert changed.json()["name"] == "renamed"
+    assert changed.headers["ETag"] != etag
+
+
+def test_feature(http: TestClient, db: Session, project: Project) -> None:
+    feature = _features(http, project, 1)[0]
+    path = f"{API}/features/{feature['id']}"
+    etag = http.get(path).headers["ETag"]
+
+    assert _revalidate(http, path, etag).status_code == 304
+    http.patch(path, json={"status": "IN_PROGRESS"})
+    changed = _revalidate(http, path, etag)
+    assert changed.status_code == 200
+    assert changed.json()["status"] == "IN_PROGRESS"
+    assert changed.headers["ETag"] != etag
@@ -0,0 +1,278 @@
+"""
+The entity cache: its backends and read-through behaviour.
+
+RedisCache runs against fakeredis' TCP server, a local stand-in for a
+Redis-protocol server, so the real clients are exercised.
+"""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from uuid import UUID
+
+import pytest
+from fakeredis import TcpFakeServer
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from src.database import engine
+from src.models import PBI, Project
+from src.models.enums import PBIStatus, PBIType
+from src.schemas.feature import FeatureCreate
+from src.schemas.project import ProjectUpdate
+from src.services.cache import (EntityCache, MemoryCache, RedisCache,
+                                cache_key, decode, encode)
+from src.services.feature_service import FeatureService
+from src.services.project_service import ProjectService
+
+TTL = 60
+
+
+@contextmanager
+def _statements() -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(scope="module")
+def redis_url() -> Iterator[str]:
+    server = TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield f"redis://{host}:{port}/0"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request: pytest.FixtureRequest) -> Iterator[EntityCache]:
+    if request.param == "memory":
+        backend = MemoryCache(100)
+    else:
+        backend = RedisCache(request.getfixturevalue("redis_url"))
+    cache = EntityCache(backend, TTL)
+    yield cache
+    cache.clear()
+
+
+def _load_project(db: Session, project: Project):
+    return lambda: db.execute(select(Project).where(Project.id == project.id)).first()
+
+
+# =============================================================================
+# Backends
+# =============================================================================
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    backend = MemoryCache(2)
+    backend.set("a", b"1", TTL)
+    backend.set("b", b"2", TTL)
+    backend.get("a")
+    backend.set("c", b"3", TTL)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert backend.get("c") == b"3"
+    assert backend.evictions == 1
+    assert backend.size() == 2
+
+
+def test_memory_cache_expires_entries() -> None:
+    backend = MemoryCache(10)
+    backend.set("short", b"1", 0.05)
+    backend.set("long", b"2", TTL)
+    time.sleep(0.1)
+
+    assert backend.get("short") is None
+    assert backend.get("long") == b"2"
+    assert backend.size() == 1
+
+
+def test_redis_cache_round_trip(redis_url: str) -> None:
+    backend = RedisCache(redis_url)
+    backend._client.set("other", b"kept")
+    backend.set("a", b"1", TTL)
+    backend.set("b", b"2", TTL)
+    backend.set("short", b"3", 0.05)
+    time.sleep(0.1)
+
+    assert backend.get("a") == b"1"
+    assert backend.get("short") is None
+    backend.delete(["a"])
+    assert backend.get("a") is None
+    backend.clear()
+    assert backend.get("b") is None
+    # Only the cache's own keys are cleared
+    assert backend._client.get("other") == b"kept"
+    backend._client.delete("other")
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_async_round_trip(redis_url: str) -> None:
+    backend = RedisCache(redis_url)
+    await backend.set_async("a", b"1", TTL)
+
+    assert await backend.get_async("a") == b"1"
+    # Both clients see the same server
+    assert backend.get("a") == b"1"
+    await backend.delete_async(["a"])
+    assert await backend.get_async("a") is None
+    await backend._async_client.aclose()
+
+
+# =============================================================================
+# Read-through
+# =============================================================================
+
+
+def test_project_hit_runs_no_statements(
+    db: Session, project: Project, cache: EntityCache
+) -> None:
+    service = ProjectService(db, cache)
+    loaded = service.get_by_id(project.id)
+
+    with _statements() as statements:
+        cached = service.get_by_id(project.id)
+
+    assert statements == []
+    assert cached is not loaded
+    for column in Project.__table__.columns.keys():
+        assert getattr(cached, column) == getattr(loaded, column)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_feature_hit_keeps_pbi_count(
+    db: Session, project: Project, cache: EntityCache
+) -> None:
+    service = FeatureService(db, cache)
+    feature = service.create(
+        FeatureCreate(project_id=project.id, name="f", description="d")
+    )
+    db.add(
+        PBI(
+            feature_id=feature.id,
+            title="p",
+            description="d",
+            type=PBIType.BACKEND,
+            status=PBIStatus.PENDING,
+            order=0,
+        )
+    )
+    db.commit()
+
+    assert service.get_with_pbi_count(feature.id)[1] == 1
+    with _statements() as statements:
+        cached, pbi_count = service.get_with_pbi_count(feature.id)
+
+    assert statements == []
+    assert (cached.id, cached.name, pbi_count) == (feature.id, "f", 1)
+
+
+def test_update_invalidates(
+    db: Session, project: Project, cache: EntityCache
+) -> None:
+    service = ProjectService(db, cache)
+    service.get_by_id(project.id)
+    service.update(project.id, ProjectUpdate(name="renamed"))
+
+    assert cache.backend.get(cache_key(Project, project.id)) is None
+    assert service.get_by_id(project.id).name == "renamed"
+    assert cache.stats().invalidations == 1
+
+
+def test_missing_entity_is_not_cached(db: Session, cache: EntityCache) -> None:
+    missing = UUID(int=0)
+    service = ProjectService(db, cache)
+
+    assert service.get_by_id(missing) is None
+    assert cache.backend.get(cache_key(Project, missing)) is None
+
+
+def test_stale_version_is_reloaded(
+    db: Session, project: Project, cache: EntityCache
+) -> None:
+    load = _load_project(db, project)
+    key = cache_key(Project, project.id)
+    cache.read_through(Project, project.id, load)
+    cached, = decode(Project, cache.backend.get(key))
+    cached.name = "old copy"
+    cache.backend.set(key, encode((cached,)), TTL)
+    loads = []
+
+    def counted_load():
+        loads.append(1)
+        return load()
+
+    # The version read matches: the cached copy is used
+    hit, = cache.read_through(Project, project.id, counted_load, cached.updated_at)
+    assert (hit.name, loads) == ("old copy", [])
+
+    # Another version: the copy is reloaded and replaced
+    bumped = cached.updated_at.replace(year=cached.updated_at.year + 1)
+    reloaded, = cache.read_through(Project, project.id, counted_load, bumped)
+    assert (reloaded.name, loads) == ("test", [1])
+    again, = cache.read_through(Project, project.id, counted_load)
+    assert again.name == "test"
+    assert cache.stats().stale == 1
+
+
+def test_read_racing_an_invalidation_is_not_stored(
+    db: Session, project: Project, cache: EntityCache
+) -> None:
+    load = _load_project(db, project)
+
+    def load_while_written():
+        row = load()
+        # A write commits and invalidates while this read is in flight
+        cache.invalidate(Project, [project.id])
+        return row
+
+    cache.read_through(Project, project.id, load_while_written)
+
+    assert cache.backend.get(cache_key(Project, project.id)) is None
+    cache.read_through(Project, project.id, load)
+    assert cache.backend.get(cache_key(Project, project.id)) is not None
+
+
+@pytest.mark.asyncio
+async def test_async_read_through(
+    db: Session, project: Project, cache: EntityCache
+) -> None:
+    load = _load_project(db, project)
+    loads = []
+
+    async def load_async():
+        loads.append(1)
+        return load()
+
+    first, = await cache.read_through_async(Project, project.id, load_async)
+    second, = await cache.read_through_async(Project, project.id, load_async)
+
+    assert loads == [1]
+    assert (second.id, second.updated_at) == (first.id, first.updated_at)
+    await cache.invalidate_async(Project, [project.id])
+    await cache.read_through_async(Project, project.id, load_async)
+    assert loads == [1, 1]
+
+
+def test_disabled_cache_always_loads(db: Session, project: Project) -> None:
+    cache = EntityCache(None, TTL)
+    service = ProjectService(db, cache)
+    service.get_by_id(project.id)
+
+    with _statements() as statements:
+        assert service.get_by_id(project.id).id == project.id
+
+    assert len(statements) == 1
+    assert cache.stats().hits == 0
@@ -0,0 +1,107 @@
+"""
+Order values allocated to features created concurrently.
+
+Every create takes its order from the project's row in
+feature_order_counters, so parallel creates must never share one.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from src.config import get_settings
+from src.database import SessionLocal
+from src.models import Feature, Project
+from src.schemas.feature import FeatureCreate, FeatureUpdate
+from src.services.feature_service import AsyncFeatureService, FeatureService
+
+WORKERS = 8
+CREATES_PER_WORKER = 10
+
+
+def _feature(project_id: UUID, name: str, order: int = 0) -> FeatureCreate:
+    return FeatureCreate(
+        project_id=project_id, name=name, description="d", order=order
+    )
+
+
+def _orders(db: Session, project_id: UUID) -> list[int]:
+    stmt = select(Feature.order).where(Feature.project_id == project_id)
+    return list(db.scalars(stmt))
+
+
+def test_parallel_creates_get_unique_orders(db: Session, project: Project) -> None:
+    def create(worker: int) -> None:
+        with SessionLocal() as session:
+            service = FeatureService(session)
+            for i in range(CREATES_PER_WORKER):
+                service.create(_feature(project.id, f"f{worker}-{i}"))
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        list(pool.map(create, range(WORKERS)))
+
+    orders = _orders(db, project.id)
+    assert len(orders) == WORKERS * CREATES_PER_WORKER
+    assert len(set(orders)) == len(orders)
+
+
+def test_parallel_bulk_creates_get_unique_orders(
+    db: Session, project: Project
+) -> None:
+    def create_many(worker: int) -> None:
+        with SessionLocal() as session:
+            FeatureService(session).create_many(
+                project.id,
+                [_feature(project.id, f"f{worker}-{i}") for i in range(5)],
+            )
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        list(pool.map(create_many, range(WORKERS)))
+
+    orders = _orders(db, project.id)
+    assert len(orders) == WORKERS * 5
+    assert len(set(orders)) == len(orders)
+
+
+@pytest.mark.asyncio
+async def test_parallel_async_creates_get_unique_orders(
+    db: Session, project: Project
+) -> None:
+    engine = create_async_engine(get_settings().async_database_url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def create(worker: int) -> None:
+        async with sessions() as session:
+            service = AsyncFeatureService(session)
+            for i in range(CREATES_PER_WORKER):
+                await service.create(_feature(project.id, f"f{worker}-{i}"))
+
+    try:
+        await asyncio.gather(*(create(worker) for worker in range(WORKERS)))
+    finally:
+        await engine.dispose()
+
+    orders = _orders(db, project.id)
+    assert len(orders) == WORKERS * CREATES_PER_WORKER
+    assert len(set(orders)) == len(orders)
+
+
+def test_create_after_explicit_order_continues_past_it(
+    db: Session, project: Project
+) -> None:
+    service = FeatureService(db)
+    service.create(_feature(project.id, "explicit", order=40))
+    assert service.create(_feature(project.id, "next")).order == 41
+
+
+def test_create_after_order_set_by_update_continues_past_it(
+    db: Session, project: Project
+) -> None:
+    service = FeatureService(db)
+    feature = service.create(_feature(project.id, "first"))
+    service.update(feature.id, FeatureUpdate(order=50))
+    assert service.create(_feature(project.id, "next")).order == 51
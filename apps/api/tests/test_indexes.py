@@ -0,0 +1,70 @@
+"""
+Query plans of the hot reads.
+
+Each read must be served by the composite index built for its shape.
+The test tables are small, so sequential scans are switched off for the
+transaction: a read still planned as a Seq Scan has no usable index.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Select, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from src.models import PBI
+from src.services import agent_log_service, feature_service, project_service
+from src.services.pagination import encode_cursor
+
+PROJECT_ID = uuid4()
+CURSOR = encode_cursor(datetime(2026, 1, 1), uuid4())
+FEATURE_CURSOR = encode_cursor(3, datetime(2026, 1, 1), uuid4())
+
+CASES = [
+    pytest.param(
+        project_service._list_with_feature_counts_stmt(50, None),
+        ["ix_projects_created_at_id", "ix_features_project_id_order_created_at_id"],
+        id="project page",
+    ),
+    pytest.param(
+        project_service._list_with_feature_counts_stmt(50, CURSOR),
+        ["ix_projects_created_at_id"],
+        id="project page after cursor",
+    ),
+    pytest.param(
+        feature_service._list_with_pbi_counts_stmt(PROJECT_ID, 50, FEATURE_CURSOR),
+        ["ix_features_project_id_order_created_at_id"],
+        id="feature page",
+    ),
+    pytest.param(
+        select(PBI.id).where(PBI.blocked_by_id == uuid4()),
+        ["ix_pbis_blocked_by_id"],
+        id="pbis blocked by",
+    ),
+    pytest.param(
+        agent_log_service._list_by_project_stmt(PROJECT_ID, 50, CURSOR),
+        ["project_id_created_at_id"],
+        id="project logs",
+    ),
+]
+
+
+def _plan(db: Session, stmt: Select) -> str:
+    sql = stmt.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    try:
+        return "\n".join(db.scalars(text(f"EXPLAIN {sql}")))
+    finally:
+        db.rollback()
+
+
+@pytest.mark.parametrize(("stmt", "indexes"), CASES)
+def test_read_uses_its_index(db: Session, stmt: Select, indexes: list[str]) -> None:
+    plan = _plan(db, stmt)
+
+    assert "Seq Scan" not in plan, plan
+    for index in indexes:
+        assert index in plan, plan
@@ -0,0 +1,201 @@
+"""
+Deduplicated storage of large CODE logs in log_blobs.
+
+Every body is made unique to the test's project, so the blobs counted
+are the test's own; they are deleted afterwards with its logs.
+"""
+
+import asyncio
+import hashlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from uuid import UUID
+
+import pytest
+from sqlalchemy import delete, event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+from src.config import Settings, get_settings
+from src.database import engine
+from src.main import app
+from src.models import AgentLog, LogBlob, Project
+from src.models.agent_log import CONTENT_PREVIEW_CHARS
+from src.models.enums import AgentMessageType
+from src.schemas.agent_log import AgentLogCreate
+from src.services.agent_log_service import (AgentLogService,
+                                            AsyncAgentLogService)
+
+API = "/api/v1"
+THRESHOLD = 1024
+
+
+@pytest.fixture
+def settings(monkeypatch: pytest.MonkeyPatch) -> Settings:
+    """Settings with blobs enabled, restored afterwards."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "log_blobs_enabled", True)
+    monkeypatch.setattr(settings, "log_blob_threshold_bytes", THRESHOLD)
+    return settings
+
+
+@pytest.fixture
+def bodies(db: Session, project: Project) -> Iterator[list[str]]:
+    """Two distinct bodies over the threshold, removed with their blobs."""
+    bodies = [
+        f"# {project.id} ✓ {name}\n" + f"{name} = [{name}] * 2\n" * 100
+        for name in ("a", "b")
+    ]
+    yield bodies
+    db.rollback()
+    db.execute(delete(AgentLog).where(AgentLog.project_id == project.id))
+    db.execute(delete(LogBlob).where(LogBlob.hash.in_(_hashes(bodies))))
+    db.commit()
+
+
+@pytest.fixture(scope="module")
+def http() -> Iterator[TestClient]:
+    with TestClient(app) as client:
+        yield client
+
+
+@contextmanager
+def _statements() -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _hashes(bodies: list[str]) -> list[bytes]:
+    return [hashlib.sha256(body.encode()).digest() for body in bodies]
+
+
+def _log(
+    project_id: UUID,
+    content: str,
+    message_type: AgentMessageType = AgentMessageType.CODE,
+) -> AgentLogCreate:
+    return AgentLogCreate(
+        project_id=project_id,
+        agent_name="dev",
+        message_type=message_type,
+        content=content,
+    )
+
+
+def _blobs(db: Session, bodies: list[str]) -> list[LogBlob]:
+    return list(
+        db.scalars(
+            select(LogBlob)
+            .where(LogBlob.hash.in_(_hashes(bodies)))
+            .order_by(LogBlob.created_at, LogBlob.hash)
+        )
+    )
+
+
+def _referencing(db: Session, project_id: UUID) -> int:
+    return db.scalar(
+        select(func.count()).where(
+            AgentLog.project_id == project_id, AgentLog.content_hash.is_not(None)
+        )
+    )
+
+
+async def _create_async(logs: list[AgentLogCreate]) -> int:
+    engine = create_async_engine(get_settings().async_database_url)
+    try:
+        async with async_sessionmaker(engine)() as session:
+            return await AsyncAgentLogService(session).create_many(logs)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("copy_format", ["csv", "binary"])
+def test_repeated_bodies_are_stored_once(
+    settings: Settings,
+    db: Session,
+    project: Project,
+    bodies: list[str],
+    copy_format: str,
+) -> None:
+    a, b = bodies
+    logs = [
+        _log(project.id, a),
+        _log(project.id, b),
+        _log(project.id, "short"),
+        _log(project.id, a),
+        _log(project.id, a, AgentMessageType.ACTION),
+    ]
+
+    if copy_format == "csv":
+        AgentLogService(db).create_many(logs)
+    else:
+        asyncio.run(_create_async(logs))
+
+    blobs = _blobs(db, bodies)
+    assert {blob.content: blob.size for blob in blobs} == {
+        a: len(a.encode()),
+        b: len(b.encode()),
+    }
+    assert len(blobs) == 2
+    # The short body and the other message type stay inline
+    assert _referencing(db, project.id) == 3
+    stored, _ = AgentLogService(db).list_by_project(project.id, 10)
+    assert [log.content for log in stored] == [log.content for log in logs]
+
+
+def test_second_write_only_references_existing_blobs(
+    settings: Settings, db: Session, project: Project, bodies: list[str]
+) -> None:
+    AgentLogService(db).create_many([_log(project.id, body) for body in bodies])
+    created_at = [blob.created_at for blob in _blobs(db, bodies)]
+
+    with _statements() as statements:
+        AgentLogService(db).create_many([_log(project.id, body) for body in bodies])
+
+    assert not any("INSERT INTO log_blobs" in statement for statement in statements)
+    db.expire_all()
+    assert [blob.created_at for blob in _blobs(db, bodies)] == created_at
+    assert _referencing(db, project.id) == 4
+
+
+def test_compressed_blob_reads_back_identically(
+    settings: Settings,
+    monkeypatch: pytest.MonkeyPatch,
+    db: Session,
+    project: Project,
+    bodies: list[str],
+) -> None:
+    monkeypatch.setattr(settings, "log_compression_enabled", True)
+    monkeypatch.setattr(settings, "log_compression_threshold_bytes", THRESHOLD)
+    AgentLogService(db).create_many([_log(project.id, bodies[0])] * 2)
+
+    (blob,) = _blobs(db, bodies)
+    assert (blob.content_text, blob.content) == (None, bodies[0])
+    stored, _ = AgentLogService(db).list_by_project(project.id, 10)
+    assert [log.content for log in stored] == [bodies[0]] * 2
+
+
+def test_api_serves_blob_content(
+    settings: Settings, http: TestClient, project: Project, bodies: list[str]
+) -> None:
+    payload = [_log(project.id, body).model_dump(mode="json") for body in bodies]
+    response = http.post(f"{API}/logs/batch", json={"logs": payload * 2})
+    assert response.status_code == 201
+
+    path = f"{API}/logs/?project_id={project.id}"
+    # Newest first
+    assert [log["content"] for log in http.get(path).json()["items"]] == [
+        *reversed(bodies)
+    ] * 2
+    previews = http.get(f"{path}&preview=true").json()["items"]
+    assert [log["content_preview"] for log in previews] == [
+        body[:CONTENT_PREVIEW_CHARS] for body in reversed(bodies)
+    ] * 2
@@ -0,0 +1,207 @@
+"""
+Compressed storage of large CODE logs.
+
+Whatever way a content is stored, every read must return it exactly as
+it was written; previews must not need the compressed bytes.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from uuid import UUID
+
+import pytest
+import zstandard
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+from src.config import Settings, get_settings
+from src.database import engine
+from src.log_compression import backfill, store_content
+from src.main import app
+from src.models import AgentLog, Project
+from src.models.agent_log import CONTENT_PREVIEW_CHARS
+from src.models.enums import AgentMessageType
+from src.schemas.agent_log import AgentLogCreate, AgentLogFilter
+from src.services.agent_log_service import (AgentLogService,
+                                            AsyncAgentLogService)
+
+API = "/api/v1"
+THRESHOLD = 4096
+
+# Over the threshold, multi-byte characters included
+LARGE = "# ünïcödé ✓\n" + "".join(
+    f"def f{i}(x):\n    return x * {i}\n" for i in range(400)
+)
+SMALL = "print('hello')\n"
+
+
+@pytest.fixture
+def settings(monkeypatch: pytest.MonkeyPatch) -> Settings:
+    """Settings with compression enabled, restored afterwards."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "log_compression_enabled", True)
+    monkeypatch.setattr(settings, "log_compression_threshold_bytes", THRESHOLD)
+    return settings
+
+
+@pytest.fixture(scope="module")
+def http() -> Iterator[TestClient]:
+    with TestClient(app) as client:
+        yield client
+
+
+def _log(
+    project_id: UUID,
+    content: str,
+    message_type: AgentMessageType = AgentMessageType.CODE,
+) -> AgentLogCreate:
+    return AgentLogCreate(
+        project_id=project_id,
+        agent_name="dev",
+        message_type=message_type,
+        content=content,
+    )
+
+
+def _stored(db: Session, project_id: UUID) -> list[tuple[bool, bool]]:
+    # (content set, content_zstd set) per row, oldest first
+    rows = db.execute(
+        text(
+            "SELECT content IS NOT NULL, content_zstd IS NOT NULL FROM agent_logs "
+            "WHERE project_id = :id ORDER BY created_at, id"
+        ),
+        {"id": project_id},
+    )
+    return [tuple(row) for row in rows]
+
+
+async def _create_async(logs: list[AgentLogCreate]) -> int:
+    engine = create_async_engine(get_settings().async_database_url)
+    try:
+        async with async_sessionmaker(engine)() as session:
+            return await AsyncAgentLogService(session).create_many(logs)
+    finally:
+        await engine.dispose()
+
+
+# =============================================================================
+# store_content
+# =============================================================================
+
+
+def test_large_code_is_compressed(settings: Settings) -> None:
+    stored = store_content(AgentMessageType.CODE, LARGE)
+
+    assert stored.content is None
+    assert zstandard.decompress(stored.content_zstd).decode() == LARGE
+    assert stored.content_head == LARGE[:CONTENT_PREVIEW_CHARS]
+
+
+@pytest.mark.parametrize(
+    "message_type, content",
+    [(AgentMessageType.CODE, SMALL), (AgentMessageType.ACTION, LARGE)],
+)
+def test_other_content_is_stored_plain(
+    settings: Settings, message_type: AgentMessageType, content: str
+) -> None:
+    assert store_content(message_type, content) == (content, None, None)
+
+
+def test_nothing_is_compressed_when_disabled() -> None:
+    assert not get_settings().log_compression_enabled
+    assert store_content(AgentMessageType.CODE, LARGE) == (LARGE, None, None)
+
+
+# =============================================================================
+# Writes and reads
+# =============================================================================
+
+
+@pytest.mark.parametrize("copy_format", ["csv", "binary"])
+def test_compressed_content_reads_back_identically(
+    settings: Settings, db: Session, project: Project, copy_format: str
+) -> None:
+    logs = [
+        _log(project.id, LARGE),
+        _log(project.id, SMALL),
+        _log(project.id, LARGE, AgentMessageType.ACTION),
+    ]
+
+    if copy_format == "csv":
+        AgentLogService(db).create_many(logs)
+    else:
+        asyncio.run(_create_async(logs))
+
+    assert _stored(db, project.id) == [(False, True), (True, False), (True, False)]
+    stored, _ = AgentLogService(db).list_by_project(project.id, 10)
+    assert [log.content for log in stored] == [log.content for log in logs]
+
+
+def test_preview_leaves_compressed_content_unloaded(
+    settings: Settings, db: Session, project: Project
+) -> None:
+    AgentLogService(db).create_many([_log(project.id, LARGE), _log(project.id, SMALL)])
+
+    filters = AgentLogFilter(project_id=project.id)
+    logs, _ = AgentLogService(db).search(filters, 10, preview=True)
+
+    # Newest first
+    assert [log.content_preview for log in logs] == [
+        SMALL,
+        LARGE[:CONTENT_PREVIEW_CHARS],
+    ]
+    assert all("content_zstd" not in vars(log) for log in logs)
+
+
+def test_api_serves_compressed_content(
+    settings: Settings, http: TestClient, project: Project
+) -> None:
+    response = http.post(
+        f"{API}/logs/batch",
+        json={"logs": [_log(project.id, LARGE).model_dump(mode="json")]},
+    )
+    assert response.status_code == 201
+
+    path = f"{API}/logs/?project_id={project.id}"
+    assert http.get(path).json()["items"][0]["content"] == LARGE
+    preview = http.get(f"{path}&preview=true").json()["items"][0]
+    assert preview["content_preview"] == LARGE[:CONTENT_PREVIEW_CHARS]
+    assert "content" not in preview
+
+
+# =============================================================================
+# Backfill
+# =============================================================================
+
+
+def test_backfill_compresses_existing_rows(db: Session, project: Project) -> None:
+    # Written before compression was enabled
+    logs = [
+        _log(project.id, LARGE),
+        _log(project.id, SMALL),
+        _log(project.id, LARGE + "# changed\n"),
+    ]
+    AgentLogService(db).create_many(logs)
+    assert _stored(db, project.id) == [(True, False)] * 3
+
+    # A batch size under the row count walks several batches
+    result = backfill(engine, THRESHOLD, 3, batch_size=1)
+
+    assert result.rows == 2
+    assert result.original_bytes == len(LARGE.encode()) * 2 + len(b"# changed\n")
+    assert 0 < result.compressed_bytes < result.original_bytes
+    assert _stored(db, project.id) == [(False, True), (True, False), (False, True)]
+    db.expire_all()
+    stored = db.scalars(
+        select(AgentLog)
+        .where(AgentLog.project_id == project.id)
+        .order_by(AgentLog.created_at, AgentLog.id)
+    ).all()
+    assert [log.content for log in stored] == [log.content for log in logs]
+    assert [log.content_preview for log in stored] == [
+        log.content[:CONTENT_PREVIEW_CHARS] for log in logs
+    ]
+
+    # Compressed rows are skipped on a rerun
+    assert backfill(engine, THRESHOLD, 3).rows == 0
@@ -0,0 +1,134 @@
+"""
+Bulk export of a project's logs as NDJSON or an Arrow stream.
+
+The chunk size is lowered so that every export spans several chunks;
+each must still carry every log exactly once, oldest first.
+"""
+
+import gzip
+import json
+from collections.abc import Iterator
+from datetime import timezone
+from uuid import uuid4
+
+import pyarrow as pa
+import pytest
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+from src import log_export
+from src.main import app
+from src.models import AgentLog, Project
+from src.models.enums import AgentMessageType
+from src.schemas.agent_log import AgentLogCreate, AgentLogResponse
+from src.services.agent_log_service import AgentLogService
+
+API = "/api/v1"
+CHUNK_SIZE = 3
+LOGS = 10
+
+
+@pytest.fixture(scope="module")
+def http() -> Iterator[TestClient]:
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def chunk_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(log_export, "EXPORT_CHUNK_SIZE", CHUNK_SIZE)
+
+
+def _write_logs(db: Session, project: Project) -> list[AgentLog]:
+    service = AgentLogService(db)
+    service.create_many(
+        [
+            AgentLogCreate(
+                project_id=project.id,
+                agent_name="dev",
+                message_type=list(AgentMessageType)[i % len(AgentMessageType)],
+                content=f"log {i}\nü ✓",
+                extra_data=None if i % 3 else {"i": i, "nested": [True, None]},
+            )
+            for i in range(LOGS)
+        ]
+    )
+    logs, _ = service.list_by_project(project.id, 100)
+    return logs
+
+
+def _export(http: TestClient, project: Project, query: str) -> bytes:
+    path = f"{API}/projects/{project.id}/logs/export?{query}"
+    # Raw, so a gzip body is not decoded by the client
+    with http.stream("GET", path) as response:
+        assert response.status_code == 200
+        body = b"".join(response.iter_raw())
+    if "gzip=true" in query:
+        assert response.headers["Content-Encoding"] == "gzip"
+        return gzip.decompress(body)
+    assert "Content-Encoding" not in response.headers
+    return body
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_ndjson_export(
+    http: TestClient, db: Session, project: Project, compressed: bool
+) -> None:
+    logs = _write_logs(db, project)
+
+    body = _export(http, project, f"format=ndjson&gzip={str(compressed).lower()}")
+
+    assert body.decode().splitlines() == [
+        AgentLogResponse.model_validate(log).model_dump_json() for log in logs
+    ]
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_arrow_export(
+    http: TestClient, db: Session, project: Project, compressed: bool
+) -> None:
+    logs = _write_logs(db, project)
+
+    body = _export(http, project, f"format=arrow&gzip={str(compressed).lower()}")
+
+    reader = pa.ipc.open_stream(body)
+    assert reader.schema == log_export.ARROW_SCHEMA
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [3, 3, 3, 1]
+    rows = pa.Table.from_batches(batches).to_pylist()
+    assert [
+        (
+            row["id"],
+            row["pbi_id"],
+            row["message_type"],
+            row["content"],
+            None if row["extra_data"] is None else json.loads(row["extra_data"]),
+            row["created_at"],
+        )
+        for row in rows
+    ] == [
+        (
+            str(log.id),
+            None,
+            log.message_type.value,
+            log.content,
+            log.extra_data,
+            log.created_at.replace(tzinfo=timezone.utc),
+        )
+        for log in logs
+    ]
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "arrow"])
+def test_empty_export(http: TestClient, project: Project, export_format: str) -> None:
+    body = _export(http, project, f"format={export_format}&gzip=true")
+
+    if export_format == "ndjson":
+        assert body == b""
+    else:
+        table = pa.ipc.open_stream(body).read_all()
+        assert (table.schema, table.num_rows) == (log_export.ARROW_SCHEMA, 0)
+
+
+def test_export_of_missing_project(http: TestClient) -> None:
+    response = http.get(f"{API}/projects/{uuid4()}/logs/export")
+    assert response.status_code == 404
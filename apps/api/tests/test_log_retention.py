@@ -0,0 +1,50 @@
+"""
+Rolling up expired agent logs into agent_log_summaries.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from src.database import engine
+from src.log_retention import rollup_batch
+from src.models import AgentLogSummary, Project
+from src.models.enums import AgentMessageType
+from src.schemas.agent_log import AgentLogCreate
+from src.services.agent_log_service import AgentLogService
+
+
+def test_logs_without_pbi_roll_up_into_one_summary(
+    db: Session, project: Project
+) -> None:
+    AgentLogService(db).create_many(
+        [
+            AgentLogCreate(
+                project_id=project.id,
+                agent_name="dev",
+                message_type=AgentMessageType.ERROR,
+                content=f"e{i}",
+            )
+            for i in range(3)
+        ]
+    )
+    # Everything written so far has expired
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=1)
+
+    # Two batches: the second one upserts into the row of the first, as
+    # (project_id, pbi_id, message_type) is unique with NULLS NOT DISTINCT
+    assert rollup_batch(engine, project.id, AgentMessageType.ERROR, cutoff, 2) == 2
+    assert rollup_batch(engine, project.id, AgentMessageType.ERROR, cutoff, 2) == 1
+
+    summaries = db.scalars(
+        select(AgentLogSummary).where(AgentLogSummary.project_id == project.id)
+    ).all()
+    assert len(summaries) == 1
+    summary = summaries[0]
+    assert (summary.pbi_id, summary.message_type, summary.log_count) == (
+        None,
+        AgentMessageType.ERROR,
+        3,
+    )
+    assert [error["content"] for error in summary.errors] == ["e0", "e1", "e2"]
+    assert summary.first_at <= summary.last_at
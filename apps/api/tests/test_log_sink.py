@@ -0,0 +1,161 @@
+"""
+The agent log write-behind sink: batching, backpressure and draining.
+"""
+
+import asyncio
+from collections.abc import Callable
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from src.dependencies import write_agent_logs
+from src.log_sink import AgentLogSink
+from src.models import AgentLog, Project
+from src.models.enums import AgentMessageType
+from src.schemas.agent_log import AgentLogCreate
+
+PROJECT_ID = UUID(int=1)
+MISSING_PBI_ID = UUID(int=2)
+TIMEOUT = 5
+
+
+class Writer:
+    """Records the batches written; fails any that reference MISSING_PBI_ID."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, logs: list[AgentLogCreate]) -> int:
+        await self.gate.wait()
+        if any(log.pbi_id == MISSING_PBI_ID for log in logs):
+            raise ValueError("Batch references a project or PBI that does not exist")
+        self.batches.append([log.content for log in logs])
+        return len(logs)
+
+    @property
+    def written(self) -> list[str]:
+        return [content for batch in self.batches for content in batch]
+
+
+def _log(
+    content: str, project_id: UUID = PROJECT_ID, pbi_id: UUID | None = None
+) -> AgentLogCreate:
+    return AgentLogCreate(
+        project_id=project_id,
+        pbi_id=pbi_id,
+        agent_name="dev",
+        message_type=AgentMessageType.ACTION,
+        content=content,
+    )
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    async with asyncio.timeout(TIMEOUT):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_flushed_without_waiting() -> None:
+    writer = Writer()
+    sink = AgentLogSink(writer, batch_size=3, flush_interval=60)
+    sink.start()
+    for i in range(4):
+        assert await sink.put(_log(f"c{i}"))
+
+    await _until(lambda: len(writer.batches) == 1)
+    assert writer.batches == [["c0", "c1", "c2"]]
+    await sink.stop()
+    assert writer.batches == [["c0", "c1", "c2"], ["c3"]]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_the_interval() -> None:
+    writer = Writer()
+    sink = AgentLogSink(writer, batch_size=100, flush_interval=0.1)
+    sink.start()
+    await sink.put(_log("c0"))
+
+    await asyncio.sleep(0.02)
+    assert writer.batches == []
+    await _until(lambda: writer.batches == [["c0"]])
+    await sink.stop()
+
+
+@pytest.mark.asyncio
+async def test_only_entries_referencing_missing_rows_fail() -> None:
+    writer = Writer()
+    sink = AgentLogSink(writer, batch_size=10, flush_interval=60)
+    sink.start()
+    for i in range(10):
+        pbi_id = MISSING_PBI_ID if i in (3, 7) else None
+        await sink.put(_log(f"c{i}", pbi_id=pbi_id))
+    await sink.stop()
+
+    assert writer.written == [f"c{i}" for i in range(10) if i not in (3, 7)]
+    stats = sink.stats()
+    assert (stats.accepted, stats.written, stats.failed) == (10, 8, 2)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_waits_for_room_then_drops() -> None:
+    writer = Writer()
+    writer.gate.clear()
+    sink = AgentLogSink(
+        writer, max_queue=2, batch_size=1, flush_interval=60, block_timeout=0.2
+    )
+    sink.start()
+    # The worker takes the first entry and blocks writing it
+    await sink.put(_log("c0"))
+    await _until(lambda: sink.stats().queued == 0)
+    await sink.put(_log("c1"))
+    await sink.put(_log("c2"))
+
+    assert not await sink.put(_log("dropped"))
+    assert sink.stats().dropped == 1
+
+    # Room made within block_timeout lets the writer in
+    waiting = asyncio.create_task(sink.put(_log("c3")))
+    await asyncio.sleep(0.02)
+    writer.gate.set()
+    assert await waiting
+    await sink.stop()
+
+    assert writer.written == ["c0", "c1", "c2", "c3"]
+    stats = sink.stats()
+    assert (stats.accepted, stats.written, stats.dropped) == (4, 4, 1)
+
+
+@pytest.mark.asyncio
+async def test_stop_writes_everything_queued() -> None:
+    writer = Writer()
+    sink = AgentLogSink(writer, batch_size=20, flush_interval=60)
+    sink.start()
+    for i in range(50):
+        await sink.put(_log(f"c{i}"))
+    await sink.stop()
+
+    assert writer.written == [f"c{i}" for i in range(50)]
+    assert not await sink.put(_log("late"))
+    stats = sink.stats()
+    assert (stats.written, stats.dropped, stats.queued) == (50, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_missing_pbi_drops_only_its_own_log(
+    db: Session, project: Project
+) -> None:
+    sink = AgentLogSink(write_agent_logs, batch_size=100, flush_interval=60)
+    sink.start()
+    for i in range(6):
+        pbi_id = uuid4() if i == 4 else None
+        await sink.put(_log(f"c{i}", project_id=project.id, pbi_id=pbi_id))
+    await sink.stop()
+
+    stats = sink.stats()
+    assert (stats.written, stats.failed) == (5, 1)
+    count = select(func.count()).where(AgentLog.project_id == project.id)
+    assert db.scalar(count) == 5
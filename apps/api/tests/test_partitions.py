@@ -0,0 +1,136 @@
+"""
+agent_logs partition maintenance.
+
+Every pass runs in a transaction that is rolled back afterwards, so the
+partitions of the test database are left as they were. The months used
+(1990) are older than any real partition, so retention only ever
+reaches the ones created here. Tests taking a project ask for it before
+the connection, so the rollback comes before the project's cleanup.
+"""
+
+from collections.abc import Iterator
+from datetime import date
+
+import pytest
+from sqlalchemy import Connection, text
+from src.database import engine
+from src.models import Project
+from src.partitions import maintain_partitions
+
+
+@pytest.fixture
+def connection() -> Iterator[Connection]:
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            yield connection
+        finally:
+            transaction.rollback()
+
+
+def _partitions(connection: Connection) -> set[str]:
+    return set(
+        connection.scalars(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE inhparent = 'agent_logs'::regclass "
+                "AND child.relname LIKE 'agent_logs_y1990%'"
+            )
+        )
+    )
+
+
+def _table_exists(connection: Connection, name: str) -> bool:
+    exists = connection.scalar(text("SELECT to_regclass(:name)"), {"name": name})
+    return exists is not None
+
+
+def _insert_log(connection: Connection, project: Project, created_at: str) -> None:
+    connection.execute(
+        text(
+            "INSERT INTO agent_logs "
+            "(project_id, agent_name, message_type, content, created_at) "
+            "VALUES (:project_id, 'dev', 'ACTION', 'old', :created_at)"
+        ),
+        {"project_id": project.id, "created_at": created_at},
+    )
+
+
+def _rows_in(connection: Connection, name: str) -> int:
+    return connection.scalar(text(f"SELECT count(*) FROM {name}"))
+
+
+def test_creates_the_current_and_upcoming_months(connection: Connection) -> None:
+    changes = maintain_partitions(connection, 2, today=date(1990, 1, 15))
+
+    expected = {"agent_logs_y1990m01", "agent_logs_y1990m02", "agent_logs_y1990m03"}
+    assert set(changes.created) == expected
+    assert changes.removed == []
+    assert _partitions(connection) == expected
+    bounds = connection.scalar(
+        text(
+            "SELECT pg_get_expr(relpartbound, oid) FROM pg_class "
+            "WHERE relname = 'agent_logs_y1990m02'"
+        )
+    )
+    assert "'1990-02-01" in bounds and "'1990-03-01" in bounds
+
+    # A second pass finds them all
+    again = maintain_partitions(connection, 2, today=date(1990, 1, 20))
+    assert again.created == []
+
+
+def test_rows_are_routed_to_their_month(
+    project: Project, connection: Connection
+) -> None:
+    maintain_partitions(connection, 1, today=date(1990, 1, 1))
+
+    _insert_log(connection, project, "1990-01-31 23:59:59")
+    _insert_log(connection, project, "1990-02-01 00:00:00")
+
+    assert _rows_in(connection, "agent_logs_y1990m01") == 1
+    assert _rows_in(connection, "agent_logs_y1990m02") == 1
+
+
+def test_drops_expired_months(project: Project, connection: Connection) -> None:
+    maintain_partitions(connection, 5, today=date(1990, 1, 1))
+    _insert_log(connection, project, "1990-01-10")
+
+    # Keeping 3 full months before June: March onwards
+    changes = maintain_partitions(
+        connection, 0, retention_months=3, today=date(1990, 6, 1)
+    )
+
+    assert changes.removed == ["agent_logs_y1990m01", "agent_logs_y1990m02"]
+    assert _partitions(connection) == {
+        f"agent_logs_y1990m{month:02d}" for month in range(3, 7)
+    }
+    assert not _table_exists(connection, "agent_logs_y1990m01")
+    old = text("SELECT count(*) FROM agent_logs WHERE project_id = :id")
+    assert connection.scalar(old, {"id": project.id}) == 0
+
+
+def test_detach_only_keeps_expired_months_as_tables(
+    project: Project, connection: Connection
+) -> None:
+    maintain_partitions(connection, 1, today=date(1990, 1, 1))
+    _insert_log(connection, project, "1990-01-10")
+
+    changes = maintain_partitions(
+        connection, 0, retention_months=1, detach_only=True, today=date(1990, 3, 1)
+    )
+
+    assert changes.removed == ["agent_logs_y1990m01"]
+    assert "agent_logs_y1990m01" not in _partitions(connection)
+    assert _rows_in(connection, "agent_logs_y1990m01") == 1
+
+
+def test_concurrent_pass_does_nothing(connection: Connection) -> None:
+    maintain_partitions(connection, 0, today=date(1990, 1, 1))
+
+    # The first pass still holds the lock until its transaction ends
+    with engine.connect() as other, other.begin():
+        changes = maintain_partitions(other, 2, today=date(1990, 1, 1))
+
+    assert changes == ([], [])
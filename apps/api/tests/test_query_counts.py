@@ -0,0 +1,95 @@
+"""
+Statements issued by the list and tree reads.
+
+Counts and nested rows are loaded with a fixed number of queries,
+whatever the number of projects, features and PBIs.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from src.database import engine
+from src.models import PBI, Project
+from src.models.enums import PBIStatus, PBIType
+from src.schemas.feature import FeatureCreate
+from src.services.feature_service import FeatureService
+from src.services.project_service import ProjectService
+
+FEATURES = 5
+PBIS_PER_FEATURE = 3
+
+
+@contextmanager
+def _statements() -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _populate(db: Session, project: Project) -> None:
+    features = FeatureService(db).create_many(
+        project.id,
+        [
+            FeatureCreate(project_id=project.id, name=f"f{i}", description="d")
+            for i in range(FEATURES)
+        ],
+    )
+    db.add_all(
+        PBI(
+            feature_id=feature.id,
+            title=f"p{i}",
+            description="d",
+            type=PBIType.BACKEND,
+            status=PBIStatus.PENDING,
+            order=i,
+        )
+        for feature in features
+        for i in range(PBIS_PER_FEATURE)
+    )
+    db.commit()
+
+
+def test_project_list_counts_features_in_one_statement(
+    db: Session, project: Project
+) -> None:
+    _populate(db, project)
+
+    with _statements() as statements:
+        rows, _ = ProjectService(db).list_with_feature_counts(200)
+
+    assert len(statements) == 1
+    assert {p.id: count for p, count in rows}[project.id] == FEATURES
+
+
+def test_feature_list_counts_pbis_in_one_statement(
+    db: Session, project: Project
+) -> None:
+    _populate(db, project)
+
+    with _statements() as statements:
+        service = FeatureService(db)
+        rows, _ = service.list_by_project_with_pbi_counts(project.id, 50)
+
+    assert len(statements) == 1
+    assert [count for _, count in rows] == [PBIS_PER_FEATURE] * FEATURES
+
+
+def test_tree_loads_one_statement_per_level(db: Session, project: Project) -> None:
+    _populate(db, project)
+
+    with _statements() as statements:
+        tree = ProjectService(db).get_tree(project.id)
+        pbis = [pbi for feature in tree.features for pbi in feature.pbis]
+
+    # The project, its features, then all their PBIs
+    assert len(statements) == 3
+    assert len(pbis) == FEATURES * PBIS_PER_FEATURE
@@ -28,7 +28,7 @@ export default async function ProjectsPage() {
   let error: string | null = null;
 
   try {
-    projects = await projectsApi.list();
+    projects = (await projectsApi.list()).items;
   } catch (e) {
     error = e instanceof Error ? e.message : "Failed to load projects";
   }
@@ -3,6 +3,7 @@
  */
 
 import type {
+    Page,
     Project,
     ProjectCreate,
     ProjectListItem,
@@ -92,10 +93,17 @@ async function apiFetch<T>(
 
 export const projectsApi = {
   /**
-   * List all projects.
+   * List one page of projects, newest first.
    */
-  async list(): Promise<ProjectListItem[]> {
-    return apiFetch<ProjectListItem[]>("/projects/", {
+  async list(
+    params: { limit?: number; after?: string } = {}
+  ): Promise<Page<ProjectListItem>> {
+    const query = new URLSearchParams();
+    if (params.limit !== undefined) query.set("limit", String(params.limit));
+    if (params.after) query.set("after", params.after);
+    const queryString = query.toString();
+    const suffix = queryString ? `?${queryString}` : "";
+    return apiFetch<Page<ProjectListItem>>(`/projects/${suffix}`, {
       cache: "no-store",
     });
   },
@@ -63,6 +63,15 @@ export interface ProjectListItem {
   feature_count: number;
 }
 
+/**
+ * A page from a cursor-paginated list endpoint.
+ * Pass next_cursor back as `after` to fetch the following page.
+ */
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
 /**
  * Payload for creating a new project.
  */